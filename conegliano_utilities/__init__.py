@@ -2,142 +2,201 @@
 Conegliano Utilities - Personal utility functions for data science and development tasks
 """
 
-import warnings
-import requests
-from packaging import version
+import importlib
+import time
 
-__version__ = "1.1.19"
+__version__ = "1.2.48"
 
+from ._updates import check_for_updates, start_update_check
 
-def check_for_updates():
+
+def _print_version_banner() -> None:
     """
-    Check if a newer version is available on GitHub.
+    Print current package version and last update timestamp.
+
+    ~~~
+    • Reads version from package __version__
+    • Gets current timestamp for load time
+    • Displays formatted version information
+    • Shows when module was last loaded
+    • Provides visual separator for clarity
+    ~~~
 
-    1. Gets current version from package
-    2. Fetches latest release info from GitHub API
-    3. Compares versions and shows warning if outdated
-    4. Provides upgrade command if update available
+    Kept here rather than in core so the import-time banner does not load
+    pandas; core.print_version_info is the public entry point.
 
-    Returns type: None (NoneType) - prints update information or warnings
+    Returns type: None (NoneType) - prints version information to console
     """
     try:
-        # GitHub API endpoint for latest release
-        url = (
-            "https://api.github.com/repos/Norris36/conegliano_utilities/releases/latest"
-        )
-        response = requests.get(url, timeout=5)
-
-        if response.status_code == 200:
-            latest_info = response.json()
-            latest_version = latest_info["tag_name"].lstrip("v")
-            current_version = __version__
-
-            if version.parse(latest_version) > version.parse(current_version):
-                warnings.warn(
-                    f"\n🔔 UPDATE AVAILABLE 🔔\n"
-                    f"Current version: {current_version}\n"
-                    f"Latest version: {latest_version}\n"
-                    "Run: pip install --upgrade "
-                    "git+https://github.com/Norris36/conegliano_utilities.git\n",
-                    UserWarning,
-                    stacklevel=2,
-                )
-
-    except Exception:
-        # Silently fail - don't disrupt normal usage if check fails
-        pass
-
-
-# Check for updates on import (optional - can be disabled)
+        current_time = time.strftime('%Y-%m-%d %H:%M:%S')
+        print(f"\n{'='*50}")
+        print(f"🚀 Conegliano Utilities v{__version__}")
+        print(f"📅 Loaded at: {current_time}")
+        print(f"{'='*50}\n")
+    except Exception as e:
+        print(f"⚠️  Error loading version: {e}")
+
+
+# Check for updates on import (set CONEGLIANO_CHECK_UPDATES=0 to disable)
 try:
-    check_for_updates()
+    start_update_check()
 except Exception:
     pass
 
-# Import main functions to make them available at package level
-from .core import *
-from .data_utils import *
-from .web_utils import *
-from .workout import *
-from .issue_logger import *
-from .issue_config import *
-from .local_issue_store import *
-from .email_issue_reporter import *
-from .global_issue_logger import *
-from .code_extractor import *
-from .issue_solver import *
+# Public names exported by each submodule. Submodules are imported lazily on
+# first attribute access (PEP 562), so importing the package stays cheap and
+# pandas, matplotlib and friends only load when a function needs them.
+_SUBMODULE_EXPORTS = {
+    "core": [
+        # Core utilities
+        "print_version_info",
+        "get_functions_dataframe",
+        "hygin",
+        "iter_hygin",
+        "find_files",
+        "get_file_creation_time",
+        "get_file_modified_time",
+        "get_folder_sizes",
+        "create_dataframe_from_folder_sizes",
+        "get_filesize_dataframe",
+    ],
+    "data_utils": [
+        # Data utilities
+        "get_columns",
+        "humanise_text",
+        "humanise_df",
+        "rename_columns",
+        "pareto_distribution",
+        "analog_count",
+        "calculate_column_overlap",
+    ],
+    "web_utils": [
+        # Web utilities
+        "find_all_links",
+    ],
+    "workout": [
+        # Workout utilities
+        "WorkoutGenerator",
+        "create_workout_from_dataframe",
+        "create_workout_from_github",
+        "create_detailed_workout_from_dataframe",
+        "create_detailed_workout_from_github",
+        "create_day_config",
+        "load_exercise_data_from_github",
+        "load_latest_workout_from_github",
+    ],
+    "issue_logger": [
+        # Issue logging utilities
+        "create_github_issue",
+        "create_debug_issue",
+        "log_error_and_create_issue",
+        "quick_issue",
+        "smart_issue",
+        "format_system_info",
+        "format_stack_trace",
+    ],
+    "issue_config": [
+        # Issue configuration
+        "get_github_token",
+        "get_repo_config",
+        "setup_token_config",
+        "set_hardcoded_token",
+    ],
+    "local_issue_store": [
+        # Local issue storage
+        "get_local_issues_dir",
+        "store_issue_locally",
+        "store_issues_locally",
+        "list_local_issues",
+        "iter_local_issues",
+        "sync_local_issues_to_github",
+        "create_local_debug_issue",
+    ],
+    "email_issue_reporter": [
+        # Email issue reporting
+        "send_issue_email",
+        "create_mailto_link",
+        "print_email_issue",
+    ],
+    "global_issue_logger": [
+        # Global issue logging (works from anywhere)
+        "detect_current_repo",
+        "global_issue",
+        "bulk_global_issue",
+        "quick_global_issue",
+        "list_repo_issues",
+        "global_issue_context",
+        "issue",  # Short alias for global_issue
+        "quick_issue_global",  # Alias for quick_global_issue
+    ],
+    "code_extractor": [
+        # Code extraction utilities
+        "extract_function_code",
+        "copy_function_to_clipboard",
+        "copy_functions_to_clipboard",
+        "search_function_in_directory",
+        "iter_function_matches",
+        "find_function_in_file",
+        "list_functions_in_file",
+        "quick_function_copy",
+        "copy_func",  # Alias
+        "find_func",  # Alias
+        "get_code",   # Alias
+    ],
+    "issue_solver": [
+        # Issue solving with code integration
+        "issue_solved",
+        "get_open_issues",
+        "iter_open_issues",
+        "display_open_issues",
+        "add_comment_to_issue",
+        "close_issue",
+        "quick_solve",
+        "solve",       # Alias
+        "quick_solution",  # Alias
+        "list_issues", # Alias
+    ],
+}
+
+_LAZY_ATTRIBUTES = {
+    name: module_name
+    for module_name, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name: str):
+    """
+    Import the submodule that provides a package attribute on first access.
+
+    1. Returns the submodule itself when a submodule name is requested
+    2. Looks up the owning submodule for exported names
+    3. Raises AttributeError for anything else without importing submodules
+    4. Caches the resolved value in the package namespace
+
+    Args:
+        name (str): Attribute name requested from the package
+
+    Returns type: value (Any) - the requested submodule, function or class
+    """
+    if name in _SUBMODULE_EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # Print version info on import
-print_version_info()
+_print_version_banner()
 
 # Define what gets imported with "from conegliano_utilities import *"
-__all__ = [
-    # Core utilities
-    "get_functions_dataframe",
-    "hygin",
-    "find_files",
-    "get_file_creation_time",
-    "get_file_modified_time",
-    "get_folder_sizes",
-    "create_dataframe_from_folder_sizes",
-    "get_filesize_dataframe",
-    # Data utilities
-    "get_columns",
-    "humanise_df",
-    "rename_columns",
-    # Web utilities
-    "find_all_links",
-    # Workout utilities
-    "WorkoutGenerator",
-    "create_workout_from_dataframe",
-    "create_workout_from_github",
-    "load_exercise_data_from_github",
-    "load_latest_workout_from_github",
-    # Issue logging utilities
-    "create_github_issue",
-    "create_debug_issue",
-    "log_error_and_create_issue",
-    "quick_issue",
-    "smart_issue",
-    "format_system_info",
-    "format_stack_trace",
-    # Issue configuration
-    "get_github_token",
-    "setup_token_config",
-    "set_hardcoded_token",
-    # Local issue storage
-    "store_issue_locally",
-    "list_local_issues",
-    "sync_local_issues_to_github",
-    "create_local_debug_issue",
-    # Email issue reporting
-    "send_issue_email",
-    "create_mailto_link",
-    "print_email_issue",
-    # Global issue logging (works from anywhere)
-    "global_issue",
-    "quick_global_issue",
-    "list_repo_issues",
-    "global_issue_context",
-    "issue",  # Short alias for global_issue
-    # Code extraction utilities
-    "extract_function_code",
-    "copy_function_to_clipboard",
-    "search_function_in_directory",
-    "find_function_in_file",
-    "list_functions_in_file",
-    "quick_function_copy",
-    "copy_func",  # Alias
-    "find_func",  # Alias
-    "get_code",   # Alias
-    # Issue solving with code integration
-    "issue_solved",
-    "get_open_issues",
-    "display_open_issues",
-    "add_comment_to_issue",
-    "close_issue",
-    "quick_solve",
-    "solve",       # Alias
-    "quick_solution",  # Alias
-    "list_issues", # Alias
-]
+__all__ = list(_LAZY_ATTRIBUTES)
@@ -0,0 +1,168 @@
+"""
+AST helpers - Shared parsing and lookup of function definitions in Python files
+"""
+
+import ast
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+# Parsed files kept by get_file_index, least recently used dropped first
+_FILE_INDEX_CACHE_SIZE = 4096
+_FILE_INDEX_CACHE = OrderedDict()
+_FILE_INDEX_LOCK = threading.Lock()
+
+
+def iter_definitions(tree: ast.Module, include_methods: bool = True) -> Iterator[ast.AST]:
+    """
+    Yield module-level function definitions and, optionally, class methods.
+
+    ~~~
+    • Iterates the module body directly instead of walking every node
+    • Descends into class bodies (including nested classes) for methods
+    • Does not descend into function bodies
+    ~~~
+
+    Args:
+        tree (ast.Module): Parsed module
+        include_methods (bool): Also yield functions defined in class bodies
+
+    Returns type: definitions (Iterator[ast.AST]) - FunctionDef and AsyncFunctionDef nodes
+    """
+    class_bodies = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+        elif include_methods and isinstance(node, ast.ClassDef):
+            class_bodies.append(node.body)
+
+    while class_bodies:
+        for node in class_bodies.pop(0):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                yield node
+            elif isinstance(node, ast.ClassDef):
+                class_bodies.append(node.body)
+
+
+def annotation_to_str(annotation: ast.AST, source: str) -> str:
+    """
+    Render a type annotation node as readable source text.
+
+    ~~~
+    • Uses ast.unparse when available (Python 3.9+)
+    • Falls back to the annotation's source segment on Python 3.8
+    • Falls back to the name, or a compact ast.dump, on older versions
+    ~~~
+
+    Args:
+        annotation (ast.AST): Annotation node from a function signature
+        source (str): Source code the annotation was parsed from (unused on 3.9+)
+
+    Returns type: type_name (str) - annotation as text, e.g. "List[int]"
+    """
+    if hasattr(ast, 'unparse'):
+        return ast.unparse(annotation)
+    if hasattr(ast, 'get_source_segment'):
+        segment = ast.get_source_segment(source, annotation)
+        if segment is not None:
+            return segment
+    if isinstance(annotation, ast.Name):
+        return annotation.id
+    return ast.dump(annotation, annotate_fields=False)
+
+
+class FileIndex:
+    """
+    Parsed view of a Python file shared by code_extractor and core.
+
+    ~~~
+    • Holds the source split into lines for slicing function code
+    • Keeps module-level functions and class methods in definition order
+    • Indexes both groups by name (first match wins)
+    ~~~
+    """
+
+    __slots__ = ('path', 'lines', 'functions', 'methods', 'function_index', 'method_index')
+
+    def __init__(self, path: str, content: str):
+        tree = ast.parse(content)
+        self.path = path
+        self.lines = content.splitlines()
+        self.functions = list(iter_definitions(tree, include_methods=False))
+        self.methods = list(iter_definitions(tree))[len(self.functions):]
+
+        self.function_index = {}
+        for node in self.functions:
+            self.function_index.setdefault(node.name, node)
+
+        self.method_index = {}
+        for node in self.methods:
+            if node.name not in self.function_index:
+                self.method_index.setdefault(node.name, node)
+
+    def get(self, function_name: str, include_methods: bool = True) -> Optional[ast.AST]:
+        """
+        Look up a function definition by name.
+
+        ~~~
+        • Prefers module-level functions over methods
+        • Falls back to class methods when include_methods is True
+        ~~~
+
+        Args:
+            function_name (str): Name of function to find
+            include_methods (bool): Also look for methods defined in classes
+
+        Returns type: node (Optional[ast.AST]) - function definition node or None if not found
+        """
+        node = self.function_index.get(function_name)
+        if node is None and include_methods:
+            node = self.method_index.get(function_name)
+        return node
+
+
+def get_file_index(file_path: str, data: Optional[bytes] = None, stat_result: Optional[os.stat_result] = None) -> FileIndex:
+    """
+    Return the cached index for a Python file, re-parsing it only if it changed.
+
+    ~~~
+    • Keys the cache on the file's mtime and size, keeping one entry per path
+    • Parses bytes the caller already read instead of reading the file again
+    • Decodes once (undecodable bytes are replaced) and builds a FileIndex
+    • Keeps the most recently used _FILE_INDEX_CACHE_SIZE files (clear with get_file_index.cache_clear())
+    ~~~
+
+    Args:
+        file_path (str): Path to Python file
+        data (bytes, optional): File contents already read by the caller
+        stat_result (os.stat_result, optional): Stat of the file matching data
+
+    Returns type: file_index (FileIndex) - parsed and indexed file
+    """
+    if stat_result is None:
+        stat_result = os.stat(file_path)
+    version = (stat_result.st_mtime_ns, stat_result.st_size)
+
+    with _FILE_INDEX_LOCK:
+        cached = _FILE_INDEX_CACHE.get(file_path)
+        if cached is not None and cached[0] == version:
+            _FILE_INDEX_CACHE.move_to_end(file_path)
+            return cached[1]
+
+    if data is None:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+    # utf-8-sig also strips a leading byte order mark
+    file_index = FileIndex(file_path, data.decode('utf-8-sig', errors='replace'))
+
+    with _FILE_INDEX_LOCK:
+        _FILE_INDEX_CACHE[file_path] = (version, file_index)
+        _FILE_INDEX_CACHE.move_to_end(file_path)
+        if len(_FILE_INDEX_CACHE) > _FILE_INDEX_CACHE_SIZE:
+            _FILE_INDEX_CACHE.popitem(last=False)
+    return file_index
+
+
+get_file_index.cache_clear = _FILE_INDEX_CACHE.clear
@@ -0,0 +1,175 @@
+"""
+HTTP helpers - Shared connection pool for GitHub API calls
+"""
+
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Rate-limited requests are retried up to this many times, waiting for the
+# longer of GitHub's hint and an exponential back-off (1, 2, 4 s). Waits
+# beyond the cap (e.g. an hour until the primary limit resets) are not slept
+# through; the limited response is returned to the caller instead.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_WAIT = 60
+
+# Connection failures (DNS, refused, TLS resets) are retried by the transport
+_CONNECT_RETRIES = 3
+
+
+@lru_cache(maxsize=1)
+def get_github_session():
+    """
+    Create the HTTP client shared by every GitHub API call in the package.
+
+    ~~~
+    • Uses an HTTP/2 httpx.Client when httpx and h2 are installed (pip install conegliano-utilities[http2])
+    • Otherwise uses a requests.Session with a pooled adapter
+    • Keeps TCP/TLS connections to api.github.com alive between calls
+    • Retries failed connections up to 3 times; POSTs and PATCHes that reached GitHub are never resent
+    • Sets the default Accept and User-Agent headers once
+    ~~~
+
+    Both clients expose the same request(method, url, json=, headers=, params=, timeout=)
+    call and response attributes used by this package. With HTTP/2, concurrent
+    requests such as issue_solved's comment and close share one connection.
+
+    Returns type: session (httpx.Client or requests.Session) - pooled HTTP client
+    """
+    default_headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "conegliano-utilities"
+    }
+
+    try:
+        import httpx
+        import h2  # noqa: F401 - httpx needs h2 for http2=True
+    except ImportError:
+        pass
+    else:
+        return httpx.Client(
+            headers=default_headers,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=_CONNECT_RETRIES,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+            )
+        )
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Only connection failures are retried here: read=0 never resends a request
+    # GitHub may have acted on, and status=0 with respect_retry_after_header=False
+    # leaves 429/503 and Retry-After handling (and its wait cap) to github_request
+    retries = Retry(
+        total=_CONNECT_RETRIES,
+        connect=_CONNECT_RETRIES,
+        read=0,
+        status=0,
+        backoff_factor=0.5,
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    session.headers.update(default_headers)
+    return session
+
+
+@lru_cache(maxsize=8)
+def github_auth_headers(token: str) -> Mapping[str, str]:
+    """
+    Get the per-request Authorization header for a GitHub token.
+
+    ~~~
+    • Built once per token and reused by every call with that token
+    • Read-only, so callers copy it before adding their own headers
+    • Kept off the shared session because callers may pass different tokens
+    ~~~
+
+    Args:
+        token (str): GitHub personal access token
+
+    Returns type: headers (Mapping[str, str]) - headers to pass alongside the shared session defaults
+    """
+    return MappingProxyType({"Authorization": f"token {token}"})
+
+
+def _rate_limit_wait(response) -> Optional[float]:
+    """
+    Work out how long GitHub asks us to wait before retrying a response.
+
+    ~~~
+    • Only 403 and 429 responses can be rate limits
+    • Prefers the Retry-After header (secondary limits)
+    • Falls back to X-RateLimit-Reset when X-RateLimit-Remaining is 0
+    ~~~
+
+    Args:
+        response (requests.Response): Response to inspect
+
+    Returns type: wait (Optional[float]) - seconds to wait, or None if not rate limited
+    """
+    if response.status_code not in (403, 429):
+        return None
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return 0.0
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(float(headers.get("X-RateLimit-Reset", 0)) - time.time(), 0.0)
+        except ValueError:
+            return 0.0
+    return None
+
+
+def github_request(method: str, url: str, **kwargs):
+    """
+    Send a GitHub API request on the shared client, backing off on rate limits.
+
+    ~~~
+    • Sends the request through get_github_session()
+    • Sleeps and retries on 403/429 rate-limit responses
+    • Gives up after a few retries or when the requested wait is too long
+    • Callers can read X-RateLimit-Remaining from the returned response
+    ~~~
+
+    Args:
+        method (str): HTTP method, e.g. "GET" or "POST"
+        url (str): Full API URL
+        **kwargs: Passed through to requests.Session.request
+
+    Returns type: response (requests.Response) - final response from GitHub
+    """
+    session = get_github_session()
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        response = session.request(method, url, **kwargs)
+        wait = _rate_limit_wait(response)
+        if wait is None or attempt == _RATE_LIMIT_RETRIES:
+            return response
+        wait = max(wait, 2 ** attempt)
+        if wait > _RATE_LIMIT_MAX_WAIT:
+            return response
+        time.sleep(wait)
+
+
+def rate_limit_remaining(response) -> Optional[int]:
+    """
+    Read the remaining GitHub API quota from a response.
+
+    Args:
+        response (requests.Response): Response from a GitHub API call
+
+    Returns type: remaining (Optional[int]) - requests left in the window, None if unknown
+    """
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    return int(remaining) if remaining and remaining.isdigit() else None
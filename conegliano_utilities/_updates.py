@@ -0,0 +1,87 @@
+"""
+Update checks - Notify when a newer release is available on GitHub
+"""
+
+import os
+import threading
+import time
+import warnings
+from pathlib import Path
+
+from . import __version__
+
+
+def check_for_updates():
+    """
+    Check if a newer version is available on GitHub.
+
+    1. Gets current version from package
+    2. Fetches latest release info from GitHub API
+    3. Compares versions and shows warning if outdated
+    4. Provides upgrade command if update available
+
+    Returns type: None (NoneType) - prints update information or warnings
+    """
+    try:
+        import requests
+        from packaging import version
+
+        # GitHub API endpoint for latest release
+        url = (
+            "https://api.github.com/repos/Norris36/conegliano_utilities/releases/latest"
+        )
+        response = requests.get(url, timeout=5)
+
+        if response.status_code == 200:
+            latest_info = response.json()
+            latest_version = latest_info["tag_name"].lstrip("v")
+            current_version = __version__
+
+            if version.parse(latest_version) > version.parse(current_version):
+                warnings.warn(
+                    f"\n🔔 UPDATE AVAILABLE 🔔\n"
+                    f"Current version: {current_version}\n"
+                    f"Latest version: {latest_version}\n"
+                    "Run: pip install --upgrade "
+                    "git+https://github.com/Norris36/conegliano_utilities.git\n",
+                    UserWarning,
+                    stacklevel=2,
+                )
+
+    except Exception:
+        # Silently fail - don't disrupt normal usage if check fails
+        pass
+
+
+# Import-time update checks run at most once per interval and never block
+_UPDATE_CHECK_STAMP = Path.home() / ".cache" / "conegliano_utilities" / "last_update_check"
+_UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds
+
+
+def start_update_check() -> None:
+    """
+    Run check_for_updates in a background thread at most once a day.
+
+    1. Skips the check when CONEGLIANO_CHECK_UPDATES is set to "0"
+    2. Skips the check when the stamp file is younger than the interval
+    3. Touches the stamp file to record this check
+    4. Starts check_for_updates on a daemon thread so import never waits
+
+    Returns type: None (NoneType) - starts the update check in the background
+    """
+    if os.environ.get("CONEGLIANO_CHECK_UPDATES") == "0":
+        return
+
+    try:
+        if time.time() - _UPDATE_CHECK_STAMP.stat().st_mtime < _UPDATE_CHECK_INTERVAL:
+            return
+    except OSError:
+        pass  # No previous check recorded
+
+    try:
+        _UPDATE_CHECK_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        _UPDATE_CHECK_STAMP.touch()
+    except OSError:
+        pass  # Still check, just without rate limiting
+
+    threading.Thread(target=check_for_updates, daemon=True).start()
@@ -11,82 +11,129 @@ This module provides utilities for:
 import ast
 import inspect
 import os
+import re
+import shutil
 import subprocess
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Union
 from datetime import datetime
 import importlib.util
 
+from ._ast_utils import annotation_to_str, get_file_index
 
-def find_function_in_file(file_path: str, function_name: str) -> Optional[Dict[str, Any]]:
+
+# Clipboard commands in order of preference, detected once per session
+_CLIPBOARD_COMMANDS = (
+    ['pbcopy'],  # macOS
+    ['xclip', '-selection', 'clipboard'],  # Linux
+    ['clip'],  # Windows
+)
+_CLIPBOARD_COMMAND = None
+
+# Home directory and common code folders, resolved on first use
+_DEFAULT_SEARCH_PATHS = None
+
+# Function definition lines, used by the regex fast path of list_functions_in_file
+_DEF_PATTERN = re.compile(
+    rb'^(?P<indent>[ \t]*)(?P<async_kw>async[ \t]+)?def[ \t]+(?P<name>\w+)[ \t]*\(',
+    re.MULTILINE,
+)
+
+# Directory names never searched for source files (hidden directories are skipped too)
+_PRUNED_DIRECTORIES = frozenset({
+    'node_modules', '__pycache__', 'venv', 'env', 'build', 'dist', 'site-packages',
+})
+
+
+def find_function_in_file(file_path: str, function_name: str, include_methods: bool = True) -> Optional[Dict[str, Any]]:
     """
     Find a specific function in a Python file and extract its details.
 
     ~~~
-    • Parses Python file using AST
+    • Parses Python file using AST (cached until the file changes)
     • Locates function definition by name
     • Extracts source code, line numbers, and metadata
-    • Handles both regular functions and methods
+    • Handles both module-level functions and class methods
     ~~~
 
     Args:
         file_path (str): Path to Python file
         function_name (str): Name of function to find
+        include_methods (bool): Also look for methods defined in classes (default: True)
+
+    Returns type: function_info (Optional[Dict[str, Any]]) - function details or None if not found
+    """
+    return _find_function(file_path, function_name, include_methods)
+
+
+def _find_function(
+    file_path: str,
+    function_name: str,
+    include_methods: bool = True,
+    data: Optional[bytes] = None,
+    stat_result: Optional[os.stat_result] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a function in a Python file, parsing bytes the caller already read.
+
+    Args:
+        file_path (str): Path to Python file
+        function_name (str): Name of function to find
+        include_methods (bool): Also look for methods defined in classes
+        data (bytes, optional): File contents already read by the caller
+        stat_result (os.stat_result, optional): Stat of the file matching data
 
     Returns type: function_info (Optional[Dict[str, Any]]) - function details or None if not found
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.splitlines()
-
-        # Parse the file with AST
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name == function_name:
-                    # Extract function source code
-                    start_line = node.lineno - 1  # AST uses 1-based indexing
-                    end_line = node.end_lineno if hasattr(node, 'end_lineno') else len(lines)
-
-                    # Get the actual source code
-                    function_lines = lines[start_line:end_line]
-                    source_code = '\n'.join(function_lines)
-
-                    # Get function signature and docstring
-                    signature_parts = [f"def {node.name}("]
-                    for i, arg in enumerate(node.args.args):
-                        if i > 0:
-                            signature_parts.append(", ")
-                        signature_parts.append(arg.arg)
-                        if arg.annotation:
-                            signature_parts.append(f": {ast.unparse(arg.annotation)}")
-                    signature_parts.append(")")
-
-                    if node.returns:
-                        signature_parts.append(f" -> {ast.unparse(node.returns)}")
-
-                    signature = ''.join(signature_parts)
-
-                    # Extract docstring
-                    docstring = None
-                    if (node.body and isinstance(node.body[0], ast.Expr) and
-                        isinstance(node.body[0].value, ast.Constant) and
-                        isinstance(node.body[0].value.value, str)):
-                        docstring = node.body[0].value.value
-
-                    return {
-                        "name": function_name,
-                        "file_path": file_path,
-                        "source_code": source_code,
-                        "signature": signature,
-                        "docstring": docstring,
-                        "start_line": start_line + 1,  # Return 1-based line numbers
-                        "end_line": end_line,
-                        "is_async": isinstance(node, ast.AsyncFunctionDef),
-                        "lines_count": end_line - start_line
-                    }
+        # Reuse the parsed file unless it changed on disk
+        file_index = get_file_index(file_path, data, stat_result)
+        lines = file_index.lines
+
+        node = file_index.get(function_name, include_methods)
+        if node is not None:
+            # Extract function source code
+            start_line = node.lineno - 1  # AST uses 1-based indexing
+            end_line = node.end_lineno if hasattr(node, 'end_lineno') else len(lines)
+
+            # Get the actual source code
+            function_lines = lines[start_line:end_line]
+            source_code = '\n'.join(function_lines)
+
+            # Get function signature and docstring (the joined source is only
+            # needed to render annotations where ast.unparse is missing)
+            source = '' if hasattr(ast, 'unparse') else '\n'.join(lines)
+            signature_parts = [f"def {node.name}("]
+            for i, arg in enumerate(node.args.args):
+                if i > 0:
+                    signature_parts.append(", ")
+                signature_parts.append(arg.arg)
+                if arg.annotation:
+                    signature_parts.append(f": {annotation_to_str(arg.annotation, source)}")
+            signature_parts.append(")")
+
+            if node.returns:
+                signature_parts.append(f" -> {annotation_to_str(node.returns, source)}")
+
+            signature = ''.join(signature_parts)
+
+            # Extract docstring
+            docstring = None
+            if (node.body and isinstance(node.body[0], ast.Expr) and
+                isinstance(node.body[0].value, ast.Constant) and
+                isinstance(node.body[0].value.value, str)):
+                docstring = node.body[0].value.value
+
+            return {
+                "name": function_name,
+                "file_path": file_path,
+                "source_code": source_code,
+                "signature": signature,
+                "docstring": docstring,
+                "start_line": start_line + 1,  # Return 1-based line numbers
+                "end_line": end_line,
+                "is_async": isinstance(node, ast.AsyncFunctionDef),
+                "lines_count": end_line - start_line
+            }
 
         return None  # Function not found
 
@@ -95,56 +142,185 @@ def find_function_in_file(file_path: str, function_name: str) -> Optional[Dict[s
         return None
 
 
-def search_function_in_directory(directory: str, function_name: str, extensions: List[str] = None) -> List[Dict[str, Any]]:
+def _iter_source_files(directory: str, extensions: List[str], exclude_dirs: Optional[Set[str]] = None) -> Iterator[str]:
+    """
+    Yield paths of files below a directory that end with one of the extensions.
+
+    ~~~
+    • Walks the tree iteratively with os.scandir
+    • Uses cached DirEntry type information instead of extra stat calls
+    • Prunes hidden, cache, build and virtualenv directories
+    • Skips directories that cannot be read
+    ~~~
+
+    Args:
+        directory (str): Directory to walk
+        extensions (List[str]): File extensions to include
+        exclude_dirs (Set[str], optional): Directory names to skip (default: _PRUNED_DIRECTORIES)
+
+    Returns type: file_paths (Iterator[str]) - matching file paths
+    """
+    if exclude_dirs is None:
+        exclude_dirs = _PRUNED_DIRECTORIES
+
+    suffixes = tuple(extensions)
+    stack = [directory]
+
+    while stack:
+        current_dir = stack.pop()
+        try:
+            entries = os.scandir(current_dir)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs and not entry.name.startswith('.'):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+
+
+def _iter_candidate_files(
+    directory: str,
+    function_name: str,
+    extensions: List[str],
+    exclude_dirs: Optional[Set[str]] = None
+) -> Iterator[Tuple[str, bytes, os.stat_result]]:
+    """
+    Yield source files whose raw bytes may contain a definition of the function.
+
+    ~~~
+    • Walks the directory tree for files with matching extensions
+    • Reads each file once as bytes, and stats the open file for the parse cache
+    • Skips files where no 'def <name>' pattern occurs
+    • Hands the bytes on so candidates are parsed without a second read
+    ~~~
+
+    Args:
+        directory (str): Directory to search in
+        function_name (str): Function name to find
+        extensions (List[str]): File extensions to search
+        exclude_dirs (Set[str], optional): Directory names to skip
+
+    Returns type: candidates (Iterator[Tuple[str, bytes, os.stat_result]]) - (path, contents, stat) of files worth parsing
+    """
+    name_bytes = function_name.encode('utf-8')
+    definition_pattern = re.compile(rb"def\s+" + re.escape(name_bytes) + rb"\b")
+
+    for file_path in _iter_source_files(directory, extensions, exclude_dirs):
+        try:
+            # Cheap byte scan rejects files that cannot define the function
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                stat_result = os.fstat(f.fileno())
+            if name_bytes in data and definition_pattern.search(data):
+                yield file_path, data, stat_result
+        except OSError:
+            # Skip files that can't be read
+            continue
+
+
+def iter_function_matches(directory: str, function_name: str, extensions: List[str] = None, exclude_dirs: Optional[Set[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield matches for a function across all Python files in a directory.
+
+    ~~~
+    • Walks and parses files only as far as the caller consumes matches
+    • Skips files whose raw bytes contain no matching definition
+    • Adds the path relative to the search directory to each match
+    • Lets callers stop after the first hit without scanning the whole tree
+    ~~~
+
+    Args:
+        directory (str): Directory to search in
+        function_name (str): Function name to find
+        extensions (List[str], optional): File extensions to search (default: ['.py'])
+        exclude_dirs (Set[str], optional): Directory names to skip (default: _PRUNED_DIRECTORIES)
+
+    Returns type: matches (Iterator[Dict[str, Any]]) - function matches with details
+    """
+    if extensions is None:
+        extensions = ['.py']
+
+    for file_path, data, stat_result in _iter_candidate_files(directory, function_name, extensions, exclude_dirs):
+        function_info = _find_function(file_path, function_name, data=data, stat_result=stat_result)
+        if function_info:
+            # Add relative path for better display
+            function_info['relative_path'] = os.path.relpath(file_path, directory)
+            yield function_info
+
+
+def search_function_in_directory(directory: str, function_name: str, extensions: List[str] = None, exclude_dirs: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
     """
     Search for a function across all Python files in a directory.
 
     ~~~
     • Recursively searches through directory tree
+    • Skips files whose raw bytes contain no matching definition
+    • Parses candidates in-process from the bytes already read, sharing the parse cache
     • Finds all occurrences of function name
     • Returns detailed information for each match
     • Supports filtering by file extensions
+    • Skips hidden, cache, build and virtualenv directories
     ~~~
 
     Args:
         directory (str): Directory to search in
         function_name (str): Function name to find
         extensions (List[str], optional): File extensions to search (default: ['.py'])
+        exclude_dirs (Set[str], optional): Directory names to skip (default: _PRUNED_DIRECTORIES)
 
     Returns type: matches (List[Dict[str, Any]]) - list of function matches with details
     """
     if extensions is None:
         extensions = ['.py']
 
-    matches = []
-    directory_path = Path(directory)
-
     try:
-        for file_path in directory_path.rglob('*'):
-            if file_path.suffix in extensions and file_path.is_file():
-                try:
-                    function_info = find_function_in_file(str(file_path), function_name)
-                    if function_info:
-                        # Add relative path for better display
-                        function_info['relative_path'] = str(file_path.relative_to(directory_path))
-                        matches.append(function_info)
-                except Exception as e:
-                    # Skip files that can't be parsed
-                    continue
-
-        return matches
+        return list(iter_function_matches(directory, function_name, extensions, exclude_dirs))
 
     except Exception as e:
         print(f"❌ Error searching directory {directory}: {e}")
         return []
 
 
-def extract_function_code(function_name: str, search_paths: List[str] = None) -> Dict[str, Any]:
+def _get_default_search_paths() -> List[str]:
+    """
+    Resolve the default search locations once per session.
+
+    ~~~
+    • Expands the home directory and common code folders
+    • Keeps only folders that exist
+    • Caches the result so repeated searches skip the filesystem checks
+    ~~~
+
+    Returns type: search_paths (List[str]) - home directory plus existing common code folders
+    """
+    global _DEFAULT_SEARCH_PATHS
+
+    if _DEFAULT_SEARCH_PATHS is None:
+        home_dir = os.path.expanduser("~")
+        common_paths = [
+            os.path.join(home_dir, "Documents"),
+            os.path.join(home_dir, "Projects"),
+            os.path.join(home_dir, "Code"),
+        ]
+        _DEFAULT_SEARCH_PATHS = [home_dir] + [p for p in common_paths if os.path.isdir(p)]
+
+    return _DEFAULT_SEARCH_PATHS
+
+
+def extract_function_code(function_name: str, search_paths: List[str] = None, exhaustive: bool = False) -> Dict[str, Any]:
     """
     Extract function code with automatic search across common locations.
 
     ~~~
     • Searches current directory and common Python paths
+    • Stops at the first match unless an exhaustive search is requested
     • Returns first match with detailed metadata
     • Includes context about where function was found
     • Provides ready-to-copy source code
@@ -153,31 +329,29 @@ def extract_function_code(function_name: str, search_paths: List[str] = None) ->
     Args:
         function_name (str): Name of function to extract
         search_paths (List[str], optional): Custom search paths
+        exhaustive (bool): Search every path and collect all matches (default: False)
 
     Returns type: extraction_result (Dict[str, Any]) - function code and metadata
     """
     if search_paths is None:
-        search_paths = [
-            os.getcwd(),  # Current directory
-            os.path.expanduser("~"),  # Home directory
-        ]
-
-        # Add common Python locations if they exist
-        common_paths = [
-            "/usr/local/lib/python*",
-            os.path.expanduser("~/Documents"),
-            os.path.expanduser("~/Projects"),
-            os.path.expanduser("~/Code"),
-        ]
-        search_paths.extend([p for p in common_paths if os.path.exists(p)])
+        # Current directory can change between calls, the rest is resolved once
+        search_paths = [os.getcwd()] + _get_default_search_paths()
 
     print(f"🔍 Searching for function '{function_name}'...")
 
     all_matches = []
     for search_path in search_paths:
-        if os.path.exists(search_path):
-            matches = search_function_in_directory(search_path, function_name)
-            all_matches.extend(matches)
+        if not os.path.exists(search_path):
+            continue
+
+        if exhaustive:
+            all_matches.extend(search_function_in_directory(search_path, function_name))
+        else:
+            # Only the first match is used, so stop walking once it is found
+            first_match = next(iter_function_matches(search_path, function_name), None)
+            if first_match:
+                all_matches.append(first_match)
+                break
 
     if not all_matches:
         return {
@@ -205,6 +379,93 @@ def extract_function_code(function_name: str, search_paths: List[str] = None) ->
     }
 
 
+def _get_clipboard_command() -> Optional[List[str]]:
+    """
+    Detect the available clipboard command once and reuse it afterwards.
+
+    ~~~
+    • Checks pbcopy (macOS), xclip (Linux) and clip (Windows) in order
+    • Uses shutil.which so missing tools are not spawned
+    • Caches the detected command for the rest of the session
+    ~~~
+
+    Returns type: clipboard_command (Optional[List[str]]) - command to pipe content into, or None
+    """
+    global _CLIPBOARD_COMMAND
+
+    if _CLIPBOARD_COMMAND is None:
+        _CLIPBOARD_COMMAND = []
+        for command in _CLIPBOARD_COMMANDS:
+            if shutil.which(command[0]):
+                _CLIPBOARD_COMMAND = command
+                break
+
+    return _CLIPBOARD_COMMAND or None
+
+
+def _format_extracted_code(function_name: str, extraction_result: Dict[str, Any], include_metadata: bool = True) -> str:
+    """
+    Format extracted function code, optionally prefixed with a metadata header.
+
+    ~~~
+    • Adds function name, source location, lines and timestamp as comments
+    • Returns plain source code when metadata is disabled
+    ~~~
+
+    Args:
+        function_name (str): Function name that was extracted
+        extraction_result (Dict[str, Any]): Successful result from extract_function_code
+        include_metadata (bool): Include metadata comments
+
+    Returns type: content (str) - code ready to paste
+    """
+    source_code = extraction_result["source_code"]
+
+    if not include_metadata:
+        return source_code
+
+    metadata_header = f"""# Function: {function_name}
+# Source: {extraction_result.get('relative_path', extraction_result['file_path'])}
+# Lines: {extraction_result['start_line']}-{extraction_result['end_line']}
+# Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+"""
+    return metadata_header + source_code
+
+
+def _copy_to_clipboard(content: str) -> bool:
+    """
+    Pipe text into the detected clipboard command.
+
+    ~~~
+    • Uses the clipboard command detected for this session
+    • Runs a single subprocess for the whole payload
+    • Prints which command was used or a fallback hint
+    ~~~
+
+    Args:
+        content (str): Text to copy
+
+    Returns type: copy_success (bool) - True if the clipboard command succeeded
+    """
+    copy_success = False
+    clipboard_command = _get_clipboard_command()
+
+    if clipboard_command:
+        try:
+            subprocess.run(clipboard_command, input=content.encode(), check=True)
+            copy_success = True
+            print(f"📋 Copied to clipboard using {clipboard_command[0]}")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
+
+    if not copy_success:
+        print("⚠️  Could not copy to clipboard automatically")
+        print("📝 Code is available in the returned result")
+
+    return copy_success
+
+
 def copy_function_to_clipboard(function_name: str, include_metadata: bool = True) -> Dict[str, Any]:
     """
     Extract function code and copy to clipboard with optional metadata.
@@ -229,54 +490,11 @@ def copy_function_to_clipboard(function_name: str, include_metadata: bool = True
         return extraction_result
 
     # Prepare code for clipboard
-    source_code = extraction_result["source_code"]
-
-    if include_metadata:
-        metadata_header = f"""# Function: {function_name}
-# Source: {extraction_result.get('relative_path', extraction_result['file_path'])}
-# Lines: {extraction_result['start_line']}-{extraction_result['end_line']}
-# Extracted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-"""
-        clipboard_content = metadata_header + source_code
-    else:
-        clipboard_content = source_code
+    clipboard_content = _format_extracted_code(function_name, extraction_result, include_metadata)
 
     # Copy to clipboard
     try:
-        # Try different clipboard methods
-        copy_success = False
-
-        # Method 1: pbcopy (macOS)
-        try:
-            subprocess.run(['pbcopy'], input=clipboard_content.encode(), check=True)
-            copy_success = True
-            print("📋 Copied to clipboard using pbcopy")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        # Method 2: xclip (Linux)
-        if not copy_success:
-            try:
-                subprocess.run(['xclip', '-selection', 'clipboard'],
-                             input=clipboard_content.encode(), check=True)
-                copy_success = True
-                print("📋 Copied to clipboard using xclip")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-
-        # Method 3: Windows clip
-        if not copy_success:
-            try:
-                subprocess.run(['clip'], input=clipboard_content.encode(), check=True)
-                copy_success = True
-                print("📋 Copied to clipboard using clip")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-
-        if not copy_success:
-            print("⚠️  Could not copy to clipboard automatically")
-            print("📝 Code is available in the returned result")
+        copy_success = _copy_to_clipboard(clipboard_content)
 
         extraction_result.update({
             "clipboard_content": clipboard_content,
@@ -298,48 +516,120 @@ def copy_function_to_clipboard(function_name: str, include_metadata: bool = True
         return extraction_result
 
 
-def list_functions_in_file(file_path: str) -> List[Dict[str, Any]]:
+def copy_functions_to_clipboard(
+    function_names: List[str],
+    include_metadata: bool = True,
+    output_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Extract several functions and copy them to the clipboard in one go.
+
+    ~~~
+    • Extracts each function, reusing the cached file parses
+    • Joins all found functions into a single payload
+    • Runs the clipboard command once instead of once per function
+    • Writes the payload to output_path instead when one is given
+    ~~~
+
+    Args:
+        function_names (List[str]): Function names to copy
+        include_metadata (bool): Include metadata comments in copied code
+        output_path (str, optional): File to write the payload to instead of the clipboard
+
+    Returns type: copy_result (Dict[str, Any]) - found and missing functions plus the combined content
+    """
+    chunks = []
+    found = []
+    missing = []
+
+    for function_name in function_names:
+        extraction_result = extract_function_code(function_name)
+        if extraction_result.get("success"):
+            chunks.append(_format_extracted_code(function_name, extraction_result, include_metadata))
+            found.append(function_name)
+        else:
+            missing.append(function_name)
+
+    result = {
+        "success": bool(found),
+        "functions": found,
+        "missing": missing,
+        "clipboard_content": "\n\n\n".join(chunks),
+        "copied_to_clipboard": False,
+        "include_metadata": include_metadata
+    }
+
+    if not found:
+        result["error"] = "None of the functions were found in any search paths"
+        return result
+
+    try:
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(result["clipboard_content"])
+            result["output_path"] = output_path
+            print(f"💾 Wrote {len(found)} functions to {output_path}")
+        else:
+            result["copied_to_clipboard"] = _copy_to_clipboard(result["clipboard_content"])
+
+        print(f"✅ Extracted {len(found)} of {len(function_names)} functions")
+        if missing:
+            print(f"⚠️  Not found: {', '.join(missing)}")
+
+    except Exception as e:
+        result["clipboard_error"] = str(e)
+
+    return result
+
+
+def list_functions_in_file(file_path: str, include_methods: bool = True, fast: bool = False) -> List[Dict[str, Any]]:
     """
     List all functions defined in a Python file.
 
     ~~~
-    • Parses file to find all function definitions
+    • Parses file to find module-level function definitions (cached)
+    • Includes class methods unless include_methods is False
     • Extracts basic metadata for each function
     • Handles both regular and async functions
+    • With fast=True, scans raw bytes with a regex instead of parsing
     • Returns organized list for browsing
     ~~~
 
     Args:
         file_path (str): Path to Python file
+        include_methods (bool): Also list methods defined in classes (default: True)
+        fast (bool): Only return name, line number, async and indentation info,
+            found by a regex scan without AST parsing (default: False)
 
     Returns type: functions_list (List[Dict[str, Any]]) - list of function metadata
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    if fast:
+        return _scan_functions_in_file(file_path, include_methods)
 
-        tree = ast.parse(content)
+    try:
+        # Shares the cached parse with find_function_in_file
+        file_index = get_file_index(file_path)
+        nodes = file_index.functions + file_index.methods if include_methods else file_index.functions
         functions = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Extract basic info
-                function_info = {
-                    "name": node.name,
-                    "line_number": node.lineno,
-                    "is_async": isinstance(node, ast.AsyncFunctionDef),
-                    "args_count": len(node.args.args),
-                    "has_docstring": False
-                }
-
-                # Check for docstring
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant) and
-                    isinstance(node.body[0].value.value, str)):
-                    function_info["has_docstring"] = True
-                    function_info["docstring_preview"] = node.body[0].value.value[:100] + "..." if len(node.body[0].value.value) > 100 else node.body[0].value.value
-
-                functions.append(function_info)
+        for node in nodes:
+            # Extract basic info
+            function_info = {
+                "name": node.name,
+                "line_number": node.lineno,
+                "is_async": isinstance(node, ast.AsyncFunctionDef),
+                "args_count": len(node.args.args),
+                "has_docstring": False
+            }
+
+            # Check for docstring
+            if (node.body and isinstance(node.body[0], ast.Expr) and
+                isinstance(node.body[0].value, ast.Constant) and
+                isinstance(node.body[0].value.value, str)):
+                function_info["has_docstring"] = True
+                function_info["docstring_preview"] = node.body[0].value.value[:100] + "..." if len(node.body[0].value.value) > 100 else node.body[0].value.value
+
+            functions.append(function_info)
 
         return sorted(functions, key=lambda x: x["line_number"])
 
@@ -348,6 +638,52 @@ def list_functions_in_file(file_path: str) -> List[Dict[str, Any]]:
         return []
 
 
+def _scan_functions_in_file(file_path: str, include_methods: bool = True) -> List[Dict[str, Any]]:
+    """
+    List function definitions with a regex scan over the raw file bytes.
+
+    ~~~
+    • Reads the file once as bytes
+    • Matches 'def' and 'async def' lines without parsing the file
+    • Treats indented definitions as methods (this includes nested functions)
+    • Counts newlines incrementally to compute line numbers
+    ~~~
+
+    Args:
+        file_path (str): Path to Python file
+        include_methods (bool): Also list indented definitions
+
+    Returns type: functions_list (List[Dict[str, Any]]) - name, line_number, is_async and is_method per function
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"❌ Error reading {file_path}: {e}")
+        return []
+
+    functions = []
+    line_number = 1
+    last_position = 0
+
+    for match in _DEF_PATTERN.finditer(data):
+        line_number += data.count(b'\n', last_position, match.start())
+        last_position = match.start()
+
+        is_method = bool(match.group('indent'))
+        if is_method and not include_methods:
+            continue
+
+        functions.append({
+            "name": match.group('name').decode('utf-8', 'replace'),
+            "line_number": line_number,
+            "is_async": bool(match.group('async_kw')),
+            "is_method": is_method,
+        })
+
+    return functions
+
+
 def quick_function_copy(function_name: str) -> None:
     """
     Quick function to copy function code to clipboard with minimal output.
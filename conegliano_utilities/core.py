@@ -3,36 +3,30 @@ import os
 import ast
 import re
 import datetime
-from typing import List, get_type_hints
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, get_type_hints
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from ._ast_utils import annotation_to_str, get_file_index
+
 
 def print_version_info() -> None:
     """
     Print current package version and last update timestamp.
 
     ~~~
-    • Imports version from package __init__.py
+    • Reads version from package __version__
     • Gets current timestamp for load time
     • Displays formatted version information
-    • Shows when module was last loaded
     • Provides visual separator for clarity
     ~~~
 
     Returns type: None (NoneType) - prints version information to console
     """
-    try:
-        from . import __version__
-        current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"\n{'='*50}")
-        print(f"🚀 Conegliano Utilities v{__version__}")
-        print(f"📅 Loaded at: {current_time}")
-        print(f"{'='*50}\n")
-    except ImportError:
-        print("⚠️  Version information not available")
-    except Exception as e:
-        print(f"⚠️  Error loading version: {e}")
+    from . import _print_version_banner
+    _print_version_banner()
 
 
 def get_functions_dataframe(filename: str = 'conegliano_utilities.py') -> pd.DataFrame:
@@ -40,8 +34,8 @@ def get_functions_dataframe(filename: str = 'conegliano_utilities.py') -> pd.Dat
     Extracts function names, docstrings, input and output variable types from a Python file.
 
     1. Reads Python source code from specified file
-    2. Parses source code using AST module  
-    3. Extracts function definitions with type hints and docstrings
+    2. Parses source code using AST module (cached until the file changes)
+    3. Extracts module-level functions and methods with type hints and docstrings
     4. Creates structured DataFrame with function metadata
     5. Handles cases with missing type annotations gracefully
 
@@ -50,13 +44,14 @@ def get_functions_dataframe(filename: str = 'conegliano_utilities.py') -> pd.Dat
 
     Returns type: df (pd.DataFrame) - structured data with columns "Function", "Description", "Input Types", "Output Type"
     """
-    with open(filename, 'r') as file:
-        source_code = file.read()
-
-    tree = ast.parse(source_code)
+    # Shares the parse cache with code_extractor, re-parsing only when the file changes
+    file_index = get_file_index(filename)
+    # The joined source is only needed to render annotations where ast.unparse is missing
+    source = '' if hasattr(ast, 'unparse') else '\n'.join(file_index.lines)
     functions_data = []
 
-    for node in ast.walk(tree):
+    # Only module-level functions and class methods; function bodies are not walked
+    for node in file_index.functions + file_index.methods:
         if isinstance(node, ast.FunctionDef):
             function_name = node.name
             docstring = ast.get_docstring(node)
@@ -69,21 +64,13 @@ def get_functions_dataframe(filename: str = 'conegliano_utilities.py') -> pd.Dat
                 # Extract input parameter types from annotations
                 for arg in node.args.args:
                     if arg.annotation:
-                        # Get the annotation as string
-                        if hasattr(arg.annotation, 'id'):
-                            type_name = arg.annotation.id
-                        else:
-                            type_name = str(arg.annotation)
-                        input_types.append(f"{arg.arg}: {type_name}")
+                        input_types.append(f"{arg.arg}: {annotation_to_str(arg.annotation, source)}")
                     else:
                         input_types.append(f"{arg.arg}: Any")
             
             # Extract return type from annotation
             if node.returns:
-                if hasattr(node.returns, 'id'):
-                    output_type = node.returns.id
-                else:
-                    output_type = str(node.returns)
+                output_type = annotation_to_str(node.returns, source)
             
             # If no return annotation, try to extract from docstring
             if output_type == 'None' and docstring:
@@ -109,126 +96,191 @@ def get_functions_dataframe(filename: str = 'conegliano_utilities.py') -> pd.Dat
     return df
 
 
-def hygin(path: str, query: str, extensions=None) -> list:
+def _scan_files(root: str):
     """
-    Searches for files that match the given query within the specified path.
+    Yield a DirEntry for every file below a directory.
 
-    1. Validates input path exists and is directory
-    2. Normalizes extensions parameter to list format
-    3. Recursively walks through directory structure
-    4. Filters files by query pattern and extensions
-    5. Displays progress using tqdm progress bar
+    1. Walks the tree iteratively with os.scandir
+    2. Descends into subdirectories without following symlinks
+    3. Skips symlinks to directories, which os.walk listed as directories
+    4. Skips folders that cannot be read
+
+    Args:
+        root (str): Directory to scan
+
+    Returns type: entries (Iterator[os.DirEntry]) - file entries found below root
+    """
+    stack = [root]
+    push = stack.append
+    scandir = os.scandir
+    while stack:
+        try:
+            with scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            push(entry.path)
+                            continue
+                        # Only symlinks need a stat here; d_type answers the rest
+                        if entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    yield entry
+        except OSError:
+            continue
+
+
+def _stream_hygin_matches(path: str, query: str, extensions):
+    """
+    Yield matching file paths while advancing the progress bar.
+
+    1. Scans the directory tree once with os.scandir
+    2. Filters files by query pattern and extensions
+    3. Counts scanned files on a throttled tqdm progress bar
+
+    Args:
+        path (str): The directory to search, already validated
+        query (str): The file name or pattern to search for
+        extensions (tuple or None): Normalized file extensions to filter by
+
+    Returns type: matches (Iterator[str]) - file paths as they are found
+    """
+    # Indeterminate bar: the tree is walked once, so there is no total up front.
+    # mininterval/miniters keep refreshes (and their clock checks) rare on large trees
+    with tqdm(desc="Searching", unit="file", mininterval=0.1, miniters=100) as pbar:
+        update = pbar.update
+        for entry in _scan_files(path):
+            name = entry.name
+            if query in name and (extensions is None or name.endswith(extensions)):
+                yield entry.path
+            update(1)
+
+
+def iter_hygin(path: str, query: str, extensions=None) -> Iterator[str]:
+    """
+    Lazily yield files that match the given query within the specified path.
+
+    1. Validates input path exists and is directory (when called, not when iterated)
+    2. Normalizes extensions parameter to a tuple
+    3. Streams matches as the tree is scanned
+    4. Stops scanning as soon as the caller stops iterating
 
     Args:
         path (str): The path to start the search from
         query (str): The file name or pattern to search for
         extensions (str or list, optional): File extension(s) to filter by
 
-    Returns type: matching_files (list) - file paths that match query and extension criteria
+    Returns type: matches (Iterator[str]) - file paths that match query and extension criteria
     """
     if not os.path.isdir(path):
         raise ValueError(f"{path} is not a directory")
 
-    # Normalize extensions to a list if it's a single string
+    # Normalize extensions to a tuple so str.endswith checks them in one call
     if isinstance(extensions, str):
-        extensions = [extensions]
+        extensions = (extensions,)
+    extensions = tuple(extensions) if extensions else None
+
+    return _stream_hygin_matches(path, query, extensions)
+
+
+def hygin(path: str, query: str, extensions=None) -> list:
+    """
+    Searches for files that match the given query within the specified path.
+
+    1. Validates input path exists and is directory
+    2. Scans the directory tree once via iter_hygin
+    3. Collects every match into a list
+
+    Args:
+        path (str): The path to start the search from
+        query (str): The file name or pattern to search for
+        extensions (str or list, optional): File extension(s) to filter by
 
-    # List all directories and files in the provided path
-    top_paths = os.listdir(path) + [path]
-    matching_files = []
+    Returns type: matching_files (list) - file paths that match query and extension criteria
+    """
+    return list(iter_hygin(path, query, extensions))
 
-    with tqdm(total=len(top_paths), desc="Initializing search") as pbar:
-        for top_dir in top_paths:
-            full_top_path = os.path.join(path, top_dir)
-            pbar.set_description(f"Searching in {top_dir}")
 
-            if os.path.isdir(full_top_path):
-                # Count the number of subdirectories to update the total
-                dirs_to_search = []
-                for root, dirs, _ in os.walk(full_top_path):
-                    dirs_to_search.extend(dirs)
+# Date format accepted by find_files, compiled once at import
+_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
 
-                # Update the total iterations in the progress bar
-                pbar.total += len(dirs_to_search)
 
-                # Traverse the directory
-                for root, dirs, files in os.walk(full_top_path):
-                    for f in files:
-                        if query in f:
-                            if extensions:
-                                if any(f.endswith(ext) for ext in extensions):
-                                    matching_files.append(os.path.join(root, f))
-                            else:
-                                matching_files.append(os.path.join(root, f))
+def _split_name_and_folder(file_path: str) -> tuple:
+    """
+    Split a path into its file name and the name of its parent folder.
 
-                    # Update the progress bar description with remaining folders
-                    remaining_folders = len(dirs_to_search) - len([d for d in dirs_to_search if d in root])
-                    pbar.set_description(f"Searching in {root} | Folders left: {remaining_folders}")
+    1. Uses two str.rpartition calls on POSIX paths
+    2. Strips repeated separators so results match os.path.dirname
+    3. Falls back to os.path on platforms with drive letters or alternate separators
 
-                    # Update the progress bar
-                    pbar.update(1)
+    Args:
+        file_path (str): Path to split
 
-            pbar.update(1)
+    Returns type: (file_name, folder_name) (tuple) - same as basename(path), basename(dirname(path))
+    """
+    if os.altsep is not None:
+        return os.path.basename(file_path), os.path.basename(os.path.dirname(file_path))
 
-            
-            
-    return matching_files
+    head, _, file_name = file_path.rpartition(os.sep)
+    head = head.rstrip(os.sep)
+    return file_name, head.rpartition(os.sep)[2]
 
 
 def find_files(paths: List[str], target_date: str = '2025-02-11', days: int = 14) -> pd.DataFrame:
     """
     Find and filter files based on modification date within a specified date range.
     
-    1. Creates DataFrame from input file paths
-    2. Validates target date format and converts to datetime
-    3. Extracts file metadata including modification times
+    1. Validates target date format and converts to datetime
+    2. Stats each file once to collect name, modification time and folder
+    3. Builds the DataFrame from the collected columns in one step
     4. Calculates date range window around target date
     5. Filters files within specified date range window
     
     Args:
-        paths (List[str]): A list of file paths to be analyzed
+        paths (List[str]): A list of file paths (or os.DirEntry objects) to be analyzed
         target_date (str): The center date for filtering in 'YYYY-MM-DD' format
         days (int): The total number of days in the date range window (default: 14)
     
     Returns type: filtered_working_dataframe (pd.DataFrame) - filtered files with metadata including path, filename, modification date, and folder name
     """
-    working_dataframe = pd.DataFrame(paths, columns=['path'])
-    
     # Validate date format
-    assert isinstance(target_date, str) and re.match(r'^\d{4}-\d{2}-\d{2}$', target_date), \
+    assert isinstance(target_date, str) and _DATE_PATTERN.fullmatch(target_date), \
            "target_date must be a string in format 'YYYY-MM-DD'"
     
-    target_date = datetime.datetime.strptime(target_date, '%Y-%m-%d')
+    # The format is already validated, so slice the fields instead of using strptime
+    target_date = pd.Timestamp(int(target_date[:4]), int(target_date[5:7]), int(target_date[8:10]))
     
-    # Extract filename from path
-    working_dataframe['file_name'] = working_dataframe['path'].apply(
-        lambda x: os.path.basename(x)
-    )
-    
-    # Get file modification time (fixed the reference to external 'my' module)
-    working_dataframe['file_modified_date'] = working_dataframe['path'].apply(
-        lambda x: os.path.getmtime(x) if os.path.exists(x) else None
-    )
-
-    # Convert timestamps to datetime
-    working_dataframe['file_modified_date'] = pd.to_datetime(
-        working_dataframe['file_modified_date'], unit='s', errors='coerce'
-    )
-
-    # Extract folder name
-    working_dataframe['folder_name'] = working_dataframe['path'].apply(
-        lambda x: os.path.basename(os.path.dirname(x))
-    )
+    # Stat each file once and collect the metadata columns in a single pass
+    file_paths, file_names, modified_times, folder_names = [], [], [], []
+    for item in paths:
+        try:
+            # DirEntry objects (e.g. from os.scandir) reuse their cached stat result
+            stat_result = item.stat() if isinstance(item, os.DirEntry) else os.stat(item)
+            modified_times.append(stat_result.st_mtime)
+        except OSError:
+            modified_times.append(None)
+        file_path = os.fspath(item)
+        file_paths.append(file_path)
+        file_name, folder_name = _split_name_and_folder(file_path)
+        file_names.append(file_name)
+        folder_names.append(folder_name)
+
+    working_dataframe = pd.DataFrame({
+        'path': file_paths,
+        'file_name': file_names,
+        'file_modified_date': pd.to_datetime(modified_times, unit='s', errors='coerce'),
+        'folder_name': folder_names,
+    })
 
     # Calculate date range
-    min_date = target_date - datetime.timedelta(days=days/2)
-    max_date = target_date + datetime.timedelta(days=days/2)
+    half_window = pd.Timedelta(days=days / 2)
+    min_date = target_date - half_window
+    max_date = target_date + half_window
     
     # Filter files within date range
-    filtered_working_dataframe = working_dataframe[
-        (working_dataframe['file_modified_date'] >= min_date) & 
-        (working_dataframe['file_modified_date'] <= max_date)
-    ]
+    in_window = working_dataframe['file_modified_date'].between(min_date, max_date, inclusive='both')
+    filtered_working_dataframe = working_dataframe[in_window]
 
     return filtered_working_dataframe
 
@@ -279,13 +331,53 @@ def get_file_modified_time(file_path: str) -> str:
         return f"Error: {str(e)}"
 
 
-def get_folder_sizes(root_folder: str) -> dict:
+# fwalk stats files relative to an open directory fd, skipping full path resolution
+_USE_FWALK = hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd
+
+
+def _scan_folder_size(path: str) -> int:
+    """
+    Sum the size of all files below a directory.
+
+    1. Walks the tree with os.fwalk where available (POSIX), else the _scan_files generator
+    2. Stats files relative to the directory fd, or reuses the cached DirEntry.stat
+    3. Follows the path itself if it is a symlink, but no symlinks below it
+    4. Skips entries that cannot be accessed
+
+    Args:
+        path (str): The directory path to scan
+
+    Returns type: total (int) - total size of all files in bytes
+    """
+    total = 0
+    if _USE_FWALK:
+        stat = os.stat
+        # fwalk will not enter a top-level symlink, while os.walk and scandir
+        # do, so resolve it first; links further down stay unfollowed
+        for _, _, filenames, dir_fd in os.fwalk(os.path.realpath(path)):
+            for filename in filenames:
+                try:
+                    total += stat(filename, dir_fd=dir_fd, follow_symlinks=False).st_size
+                except OSError:
+                    continue  # Skip inaccessible files
+        return total
+
+    for entry in _scan_files(path):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue  # Skip inaccessible files
+
+    return total
+
+
+def get_folder_sizes(root_folder: str, max_workers: int = None) -> dict:
     """
     Calculate the size of all immediate subdirectories within a root folder.
 
     ~~~
     • Lists all immediate subdirectories in root folder
-    • Walks through each subdirectory recursively
+    • Walks through each subdirectory recursively in a thread pool
     • Calculates total size by summing all file sizes
     • Handles permission errors and inaccessible files gracefully
     • Returns dictionary mapping folder paths to sizes in bytes
@@ -293,23 +385,28 @@ def get_folder_sizes(root_folder: str) -> dict:
 
     Args:
         root_folder (str): The root directory path to analyze
+        max_workers (int, optional): Number of scanning threads, defaults to one per subdirectory capped at 32
 
     Returns type: folder_sizes (dict) - mapping of folder paths to their total sizes in bytes
     """
     folder_sizes = {}
 
     # Get only immediate subdirectories (not files)
-    for item in os.listdir(root_folder):
-        item_path = os.path.join(root_folder, item)
-        if os.path.isdir(item_path):
-            dir_size = 0
-            for dirpath, dirnames, filenames in os.walk(item_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        dir_size += os.path.getsize(filepath)
-                    except (OSError, PermissionError):
-                        continue  # Skip inaccessible files
+    with os.scandir(root_folder) as entries:
+        subdirs = [entry.path for entry in entries if entry.is_dir()]
+
+    if not subdirs:
+        return folder_sizes
+
+    if max_workers is None:
+        max_workers = min(32, len(subdirs))
+
+    if max_workers <= 1:
+        return {item_path: _scan_folder_size(item_path) for item_path in subdirs}
+
+    # Scanning is I/O bound, so threads overlap the stat syscalls
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item_path, dir_size in zip(subdirs, executor.map(_scan_folder_size, subdirs)):
             folder_sizes[item_path] = dir_size
 
     return folder_sizes
@@ -333,20 +430,30 @@ def create_dataframe_from_folder_sizes(folder_sizes: dict) -> pd.DataFrame:
 
     Returns type: df (pd.DataFrame) - structured data with columns for path, size, cumulative metrics, and percentages
     """
+    paths = list(folder_sizes.keys())
+    sizes_gb = np.fromiter(folder_sizes.values(), dtype=np.float64, count=len(folder_sizes))
+    sizes_gb = np.round(sizes_gb / (1024 ** 3), 2)  # Round to 2 decimal places
+
+    # Sort by size descending once, before building the frame
+    order = np.argsort(-sizes_gb, kind='stable')
+    sizes_gb = sizes_gb[order]
+    paths = [paths[i] for i in order]
+
+    # Cumulative size and percentages share a single total
+    cum_size = np.round(sizes_gb.cumsum(), 2)
+    total_size = sizes_gb.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage = np.round(sizes_gb / total_size * 100, 2)
+        cum_percentage = np.round(cum_size / total_size * 100, 2)
+
     df = pd.DataFrame({
-        "path": list(folder_sizes.keys()),
-        "size (GB)": [size / (1024 ** 3) for size in folder_sizes.values()]
+        "path": paths,
+        "size (GB)": sizes_gb,
+        "cum (size)": cum_size,
+        "percentage(size)": percentage,
+        "cum percentage (size)": cum_percentage,
+        "basename": [os.path.basename(path) for path in paths],
     })
-    df["size (GB)"] = df["size (GB)"].round(2)  # Round to 2 decimal places
-    df.sort_values(by="size (GB)", ascending=False, inplace=True)
-    df.reset_index(drop=True, inplace=True)
-    # now lets get the cummulative size
-    df["cum (size)"] = df["size (GB)"].cumsum().round(2)
-    # and the percentage of total size
-    df['percentage(size)'] = (df["size (GB)"] / df["size (GB)"].sum() * 100).round(2)
-    # and the cumulative percentage of total size
-    df['cum percentage (size)'] = (df['cum (size)'] / df["size (GB)"].sum() * 100).round(2)
-    df["basename"] = df["path"].apply(os.path.basename)
     return df
 
 
@@ -371,6 +478,6 @@ def get_filesize_dataframe(folder_path: str) -> pd.DataFrame:
     if not os.path.isdir(folder_path):
         raise ValueError("The provided path is not a valid directory.")
     folder_sizes = get_folder_sizes(folder_path)
+    # Already sorted by size descending by create_dataframe_from_folder_sizes
     df = create_dataframe_from_folder_sizes(folder_sizes)
-    df.sort_values(by="size (GB)", ascending=False, inplace=True)
     return df
@@ -1,4 +1,5 @@
 from matplotlib import pyplot as plt
+import numpy as np
 import pandas as pd
 
 
@@ -7,7 +8,7 @@ def get_columns(path: str) -> str:
     Extract column names from all sheets in an Excel file or CSV file.
     
     1. Gets file extension from path
-    2. Reads file into dataframe based on extension  
+    2. Reads only the header row(s) based on extension
     3. Extracts column names into formatted list
     4. Returns semicolon-separated string with results
     
@@ -20,8 +21,8 @@ def get_columns(path: str) -> str:
         file_extension = path.split('.')[-1].lower()
         
         if file_extension in ['xlsx', 'xlsm', 'xls']:
-            # Read all sheets from Excel file
-            df = pd.read_excel(path, sheet_name=None)
+            # Read only the header row of every sheet; no body cells are parsed
+            df = pd.read_excel(path, sheet_name=None, nrows=0)
             columns = []
             
             # Handle multiple sheets
@@ -31,8 +32,8 @@ def get_columns(path: str) -> str:
             return "; ".join(columns)
             
         elif file_extension == 'csv':
-            # Read CSV file
-            df = pd.read_csv(path)
+            # Read only the CSV header row
+            df = pd.read_csv(path, nrows=0)
             return f"CSV: {df.columns.tolist()}"
             
         else: 
@@ -77,25 +78,16 @@ def humanise_text(text: str) -> str:
     # Replace underscores and hyphens with spaces
     new_text = text.replace('_', ' ').replace('-', ' ')
 
-    # Split into words and apply title case to first word, lowercase to rest
-    words = new_text.split(' ')
-    formatted_words = []
-
-    for i, word in enumerate(words):
-        if i == 0:
-            formatted_words.append(word.title())  # First word title case
-        else:
-            formatted_words.append(word.lower())  # Other words lowercase
-
-    # Join words back together
-    return ' '.join(formatted_words)
+    # Title case the first word, lowercase the rest (split on the first space only)
+    first_word, separator, rest = new_text.partition(' ')
+    return first_word.title() + separator + rest.lower()
 
 
 def humanise_df(local_df: pd.DataFrame) -> pd.DataFrame:
     """
     Takes a DataFrame and returns it with humanized column names.
 
-    Uses humanise_text() to transform each column name:
+    Applies the humanise_text() rules to all column names at once:
     1. Creates copy of input DataFrame
     2. Replaces underscores and hyphens with spaces
     3. Applies title case to first word, lowercase to others
@@ -116,9 +108,17 @@ def humanise_df(local_df: pd.DataFrame) -> pd.DataFrame:
     # Create a copy to avoid modifying the original
     df_copy = local_df.copy()
 
-    # Apply humanise_text to each column name
-    column_mapping = {col: humanise_text(col) for col in df_copy.columns}
-    df_copy.rename(columns=column_mapping, inplace=True)
+    if len(df_copy.columns) == 0:
+        return df_copy
+
+    # Apply the humanise_text rules to the whole column Index with vectorised .str methods
+    columns = df_copy.columns.str.replace('_', ' ', regex=False).str.replace('-', ' ', regex=False)
+    parts = columns.str.partition(' ')
+    df_copy.columns = (
+        parts.get_level_values(0).str.title()
+        + parts.get_level_values(1)
+        + parts.get_level_values(2).str.lower()
+    )
 
     return df_copy
 
@@ -128,7 +128,7 @@ def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
     Renames DataFrame columns to a standardized format.
     
     1. Creates copy of input DataFrame
-    2. Creates mapping dictionary for column transformations
+    2. Transforms all column names with vectorised string methods
     3. Applies special rule for 'Name'/'name' columns
     4. Standardizes other columns (remove spaces, underscores, lowercase)
     5. Returns DataFrame with renamed columns
@@ -141,22 +141,20 @@ def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
     # Create a copy to avoid modifying the original
     df_copy = df.copy()
     
-    # Create a mapping of old to new column names
-    column_mapping = {}
+    if len(df_copy.columns) == 0:
+        return df_copy
     
-    for col in df_copy.columns:
-        if col in ['Name', 'name']:
-            new_name = 'name_'
-        else:
-            new_name = col.replace("  ", " ")  # Replace double spaces
-            new_name = new_name.replace("-", "")  # Remove hyphens
-            new_name = new_name.replace(" ", "_")  # Replace spaces with underscores
-            new_name = new_name.lower()  # Convert to lowercase
-        
-        column_mapping[col] = new_name
+    # Standardize all column names with vectorised Index.str methods
+    columns = df_copy.columns
+    new_columns = (
+        columns.str.replace("  ", " ", regex=False)  # Replace double spaces
+        .str.replace("-", "", regex=False)  # Remove hyphens
+        .str.replace(" ", "_", regex=False)  # Replace spaces with underscores
+        .str.lower()  # Convert to lowercase
+    )
     
-    # Apply the renaming
-    df_copy.rename(columns=column_mapping, inplace=True)
+    # Special rule for name columns
+    df_copy.columns = new_columns.where(~columns.isin(['Name', 'name']), 'name_')
     
     return df_copy
 
@@ -208,16 +206,15 @@ def analog_count(dataframe, column, simple = True, normalize = False, plot = Fal
     """
     y = dataframe[column].value_counts(normalize = normalize).rename_axis(column).reset_index(name='counts')
     
-    if simple != True:
-        y['h_counts'] = y['counts'].cumsum()
-        y['g_counts'] = y['h_counts'] / y['counts'].sum()
+    # Cumulative columns are needed for the detailed view and for the plot; compute them once
+    if not simple or plot:
+        counts = y['counts']
+        cumulative = counts.cumsum()
+        y['h_counts'] = cumulative
+        y['g_counts'] = cumulative / counts.sum()
     
     try:    
-        if plot and simple :
-            if simple == True:
-                y['h_counts'] = y['counts'].cumsum()
-                y['g_counts'] = y['h_counts'] / y['counts'].sum()
-            
+        if plot:
             my_plot = pareto_distribution(y)
             my_plot.show()                
 
@@ -238,19 +235,19 @@ def calculate_column_overlap(df_a, df_b):
     Returns:
     pd.DataFrame: A DataFrame in long format showing the overlap percentage between columns of df_a and df_b.
     """
-    # Create a DataFrame to store the overlap data
-    data_overlap = pd.DataFrame(index=df_a.columns, columns=df_b.columns)
-
-    # Iterate over each column pair and calculate overlap
-    for col_a in data_overlap.index:
-        for col_b in data_overlap.columns:
-            unique_value_column_a = set(df_a[col_a].unique())
-            unique_value_column_b = set(df_b[col_b].unique())
-
-            # Calculate the intersection and percentage overlap
-            intersection = len(unique_value_column_a.intersection(unique_value_column_b))
-            length = len(df_a)
-            data_overlap.loc[col_a, col_b] = round((intersection / length) * 100, 2)
+    # Compute each column's unique values once instead of once per column pair
+    unique_values_a = [set(df_a[col_a].unique()) for col_a in df_a.columns]
+    unique_values_b = [set(df_b[col_b].unique()) for col_b in df_b.columns]
+
+    # Count intersections into a numeric matrix and scale it in one step
+    intersections = np.empty((len(unique_values_a), len(unique_values_b)), dtype=np.float64)
+    for i, values_a in enumerate(unique_values_a):
+        for j, values_b in enumerate(unique_values_b):
+            intersections[i, j] = len(values_a & values_b)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        overlap = np.round(intersections / len(df_a) * 100, 2)
+    data_overlap = pd.DataFrame(overlap, index=df_a.columns, columns=df_b.columns)
 
     # Reshape the data_overlap DataFrame to a long format
     data_overlap_long = data_overlap.stack().reset_index()
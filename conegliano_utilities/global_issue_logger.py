@@ -9,68 +9,250 @@ This module provides a global issue logging system that:
 """
 
 import os
+import platform
+import re
+import shutil
+import socket
 import subprocess
+import sys
+import time
 import json
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Tuple
+from typing import Dict, Optional, Any, List, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+# Lightweight sibling modules are imported up front; issue_logger is only
+# needed for GitHub submissions, so it is imported on first use via
+# _get_create_github_issue and requests loads with the shared session
+from ._http import github_auth_headers, github_request
+from .issue_config import get_github_token, get_repo_config
+from .local_issue_store import list_local_issues, store_issue_locally, store_issues_locally
+
+
+# owner/repo from GitHub remotes: git@github.com:o/r(.git), https://[user@]github.com/o/r(.git)(/),
+# git://, git+https:// and ssh://git@github.com/o/r
+_GITHUB_URL_PATTERN = re.compile(
+    r'^(?:git@github\.com:|(?:https?|git|git\+https|ssh)://(?:[^@/]+@)?github\.com/)'
+    r'(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$'
+)
+
+# Git commands run by global_issue_context, keyed by the git_info field they fill
+_CONTEXT_GIT_COMMANDS = {
+    "current_branch": ["branch", "--show-current"],
+    "recent_commits": ["log", "--oneline", "-5"],
+    "has_changes": ["status", "--porcelain"],
+}
+
+# Working-context section appended to global issue descriptions
+_CONTEXT_TEMPLATE = (
+    "\n\n## Working Context\n"
+    "**Working in Repository:** {repo}\n"
+    "**Current Directory:** `{dir}`\n"
+    "**Relative Path:** `{rel}`\n"
+    "**Timestamp:** {ts}\n"
+    "\n"
+    "*This issue was created from outside the jensbay_utilities repo while working on other code.*\n"
+)
+
+# (owner, repo) -> (ETag, issues) from the last successful list_repo_issues call
+_ISSUE_LIST_CACHE: Dict[Tuple[str, str], Tuple[str, List[Dict[str, Any]]]] = {}
+
+# Resolve git once instead of scanning PATH on every subprocess call
+_GIT = shutil.which("git") or "git"
+
+
+@lru_cache(maxsize=1)
+def _get_process_context() -> Dict[str, str]:
+    """
+    Collect system details that are constant for the life of the process.
 
+    ~~~
+    • Computed on first use rather than at import (platform.platform() can be slow)
+    • Cached afterwards, so global_issue_context does not re-read OS release files
+    ~~~
 
-def detect_current_repo() -> Dict[str, Optional[str]]:
+    Returns type: process_context (Dict[str, str]) - python_version, platform and hostname
     """
-    Automatically detect the current Git repository information.
+    return {
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "platform": platform.platform(),
+        "hostname": socket.gethostname()
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_create_github_issue():
+    """
+    Import issue_logger.create_github_issue on first use and cache the function.
+
+    Returns type: create_github_issue (Callable) - GitHub issue creation function
+    """
+    from .issue_logger import create_github_issue
+    return create_github_issue
+
+
+def _run_git(repo_dir: str, *args: str) -> subprocess.CompletedProcess:
+    """
+    Run a read-only git command against a directory.
 
     ~~~
-    • Finds Git repository root directory
-    • Extracts repository owner and name from remote URL
-    • Handles both GitHub and other Git providers
-    • Falls back to directory-based detection
+    • Uses the git executable resolved at import time
+    • Targets the directory with git -C instead of changing the child's cwd
+    • Disables optional index locks and credential prompts, uses the C locale
+    • Skips the close-fds pass on POSIX so posix_spawn can be used
+    • Raises CalledProcessError on a non-zero exit status
+    ~~~
+
+    Args:
+        repo_dir (str): Directory the command should run in
+        *args (str): git subcommand and its arguments
+
+    Returns type: result (subprocess.CompletedProcess) - completed process with text stdout
+    """
+    return subprocess.run(
+        [_GIT, "-C", repo_dir, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        # Python's own fds are non-inheritable, so on POSIX there is nothing to close;
+        # together with no cwd= this lets subprocess use posix_spawn instead of fork+exec
+        close_fds=os.name != "posix",
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0", "LC_ALL": "C"}
+    )
+
+
+def _relative_to_root(current_dir: str, git_root: str) -> str:
+    """
+    Return the working directory relative to the git root.
+
+    ~~~
+    • Slices the root prefix off when the directory lies under the root
+    • Falls back to os.path.relpath otherwise (e.g. C:/ vs C:\\ spellings on Windows)
+    ~~~
+
+    Args:
+        current_dir (str): Absolute working directory
+        git_root (str): Absolute repository root from git rev-parse
+
+    Returns type: relative_path (str) - path from git_root to current_dir, "." at the root
+    """
+    if current_dir == git_root:
+        return "."
+    if current_dir.startswith(git_root) and current_dir[len(git_root)] == os.sep:
+        return current_dir[len(git_root) + 1:]
+    return os.path.relpath(current_dir, git_root)
+
+
+# [epoch second, ISO string] of the last formatted timestamp
+_ISO_NOW_CACHE = [None, ""]
+
+
+def _iso_now() -> str:
+    """
+    Return the current local time as a second-precision ISO 8601 string.
+
+    ~~~
+    • Reads the clock with time.time()
+    • Formats through datetime only when the second has changed
+    • Reuses the cached string for calls within the same second (bulk issue creation)
+    ~~~
+
+    Returns type: timestamp (str) - e.g. "2025-02-11T14:03:27"
+    """
+    second = int(time.time())
+    if _ISO_NOW_CACHE[0] != second:
+        _ISO_NOW_CACHE[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _ISO_NOW_CACHE[1]
+
+
+def _find_git_root(start: str) -> Optional[str]:
+    """
+    Find the enclosing repository root by looking for a .git entry.
+
+    ~~~
+    • Checks start and each parent directory for .git (folder or worktree file)
+    • Uses one lstat per level instead of spawning git rev-parse
+    • Stops at the filesystem root
+    ~~~
+
+    Args:
+        start (str): Absolute directory to start from
+
+    Returns type: git_root (Optional[str]) - repository root, or None outside a repository
+    """
+    path = start
+    while True:
+        if os.path.lexists(os.path.join(path, ".git")):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _non_repo_info(current_dir: str) -> Dict[str, Optional[str]]:
+    """
+    Build the repository info used when a directory is not in a git repository.
+
+    Args:
+        current_dir (str): Directory that was inspected
+
+    Returns type: repo_info (Dict[str, Optional[str]]) - directory-based fallback metadata
+    """
+    return {
+        "git_root": None,
+        "remote_url": None,
+        "owner": "Norris36",
+        "repo_name": Path(current_dir).name,
+        "current_dir": current_dir,
+        "relative_path": "."
+    }
+
+
+@lru_cache(maxsize=32)
+def _detect_repo_for_directory(current_dir: str) -> Dict[str, Optional[str]]:
+    """
+    Detect Git repository information for a directory, cached per directory.
+
+    ~~~
+    • Runs the git subprocesses only the first time a directory is seen
+    • Returns the fallback info when the directory is not in a git repository
+    • Lets unexpected errors propagate so they are not cached
     ~~~
 
+    Args:
+        current_dir (str): Directory to inspect (the caller's working directory)
+
     Returns type: repo_info (Dict[str, Optional[str]]) - repository metadata
     """
     try:
-        # Get git root directory
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        git_root = result.stdout.strip()
+        # Get git root directory. Walking up for a .git entry costs a few stat
+        # calls and avoids spawning git at all outside repositories; git itself
+        # is only asked when GIT_DIR/GIT_WORK_TREE may point elsewhere
+        if "GIT_DIR" in os.environ or "GIT_WORK_TREE" in os.environ:
+            git_root = _run_git(current_dir, "rev-parse", "--show-toplevel").stdout.strip()
+        else:
+            git_root = _find_git_root(current_dir)
+            if git_root is None:
+                return _non_repo_info(current_dir)
 
         # Get remote URL
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=git_root
-        )
+        result = _run_git(git_root, "remote", "get-url", "origin")
         remote_url = result.stdout.strip()
 
-        # Parse GitHub URL
-        if "github.com" in remote_url:
-            # Handle both SSH and HTTPS URLs
-            if remote_url.startswith("git@github.com:"):
-                # SSH: git@github.com:owner/repo.git
-                repo_path = remote_url.replace("git@github.com:", "").replace(".git", "")
-            elif "github.com/" in remote_url:
-                # HTTPS: https://github.com/owner/repo.git
-                repo_path = remote_url.split("github.com/")[1].replace(".git", "")
-            else:
-                repo_path = None
-
-            if repo_path and "/" in repo_path:
-                owner, repo_name = repo_path.split("/", 1)
-                return {
-                    "git_root": git_root,
-                    "remote_url": remote_url,
-                    "owner": owner,
-                    "repo_name": repo_name,
-                    "current_dir": os.getcwd(),
-                    "relative_path": os.path.relpath(os.getcwd(), git_root)
-                }
+        # Parse GitHub URL (SSH, HTTPS, git:// and ssh:// forms)
+        match = _GITHUB_URL_PATTERN.match(remote_url)
+        if match:
+            return {
+                "git_root": git_root,
+                "remote_url": remote_url,
+                "owner": match.group("owner"),
+                "repo_name": match.group("repo"),
+                "current_dir": current_dir,
+                "relative_path": _relative_to_root(current_dir, git_root)
+            }
 
         # Fallback: use directory name and default owner
         repo_name = Path(git_root).name
@@ -79,24 +261,35 @@ def detect_current_repo() -> Dict[str, Optional[str]]:
             "remote_url": remote_url,
             "owner": "Norris36",  # Default owner
             "repo_name": repo_name,
-            "current_dir": os.getcwd(),
-            "relative_path": os.path.relpath(os.getcwd(), git_root)
+            "current_dir": current_dir,
+            "relative_path": _relative_to_root(current_dir, git_root)
         }
 
     except subprocess.CalledProcessError:
-        # Not in a git repository
-        current_dir = os.getcwd()
-        return {
-            "git_root": None,
-            "remote_url": None,
-            "owner": "Norris36",
-            "repo_name": Path(current_dir).name,
-            "current_dir": current_dir,
-            "relative_path": "."
-        }
+        # Not in a git repository (or no origin remote)
+        return _non_repo_info(current_dir)
+
+
+def detect_current_repo() -> Dict[str, Optional[str]]:
+    """
+    Automatically detect the current Git repository information.
+
+    ~~~
+    • Finds Git repository root directory
+    • Extracts repository owner and name from remote URL
+    • Handles both GitHub and other Git providers
+    • Falls back to directory-based detection
+    • Caches results per working directory (clear with detect_current_repo.cache_clear())
+    ~~~
+
+    Returns type: repo_info (Dict[str, Optional[str]]) - repository metadata
+    """
+    current_dir = os.getcwd()
+    try:
+        # Copy so callers can modify the result without touching the cache
+        return dict(_detect_repo_for_directory(current_dir))
     except Exception as e:
         # Other errors
-        current_dir = os.getcwd()
         return {
             "git_root": None,
             "remote_url": None,
@@ -108,86 +301,101 @@ def detect_current_repo() -> Dict[str, Optional[str]]:
         }
 
 
-def global_issue(
+detect_current_repo.cache_clear = _detect_repo_for_directory.cache_clear
+
+
+def _build_global_issue(
+    current_location: Dict[str, Optional[str]],
     title: str,
     description: str = "",
     labels: Optional[List[str]] = None,
-    priority: str = "medium",
     include_context: bool = True
-) -> Dict[str, Any]:
+) -> Tuple[str, str, List[str]]:
     """
-    Create an issue in jensbay_utilities repo from anywhere on your system.
+    Build the title, body and labels for a global issue.
 
     ~~~
-    • Always creates issues in jensbay_utilities repository
-    • Includes context about your current working location
-    • Works from any directory (doesn't need to be in the repo)
-    • Routes to GitHub or local storage automatically
+    • Prefixes the title with [Global]
+    • Appends the working-context section to the description
+    • Adds global-issue, from-repo and working-in labels
     ~~~
 
     Args:
+        current_location (Dict[str, Optional[str]]): Result of detect_current_repo()
         title (str): Issue title
         description (str): Issue description
         labels (List[str], optional): Issue labels
-        priority (str): Priority level (low, medium, high, critical)
         include_context (bool): Include automatic context information
 
-    Returns type: issue_result (Dict[str, Any]) - issue creation result with metadata
+    Returns type: (title, body, labels) (Tuple[str, str, List[str]]) - issue fields ready to submit
     """
-    current_location = detect_current_repo()
-
     # Build enhanced description with context about WHERE you're working
     if include_context:
-        working_repo = current_location.get('repo_name', 'unknown')
-        working_dir = current_location.get('current_dir', 'unknown')
-        relative_path = current_location.get('relative_path', '.')
-
-        context_info = f"""
-
-## Working Context
-**Working in Repository:** {working_repo}
-**Current Directory:** `{working_dir}`
-**Relative Path:** `{relative_path}`
-**Timestamp:** {datetime.now().isoformat()}
-
-*This issue was created from outside the jensbay_utilities repo while working on other code.*
-"""
+        context_info = _CONTEXT_TEMPLATE.format_map({
+            "repo": current_location.get('repo_name', 'unknown'),
+            "dir": current_location.get('current_dir', 'unknown'),
+            "rel": current_location.get('relative_path', '.'),
+            "ts": _iso_now()
+        })
         enhanced_description = description + context_info
     else:
         enhanced_description = description
 
-    # Add context-based labels
-    repo_labels = labels or []
-    repo_labels.append("global-issue")
+    # Add context-based labels (a new list, so the caller's labels are not modified)
+    repo_labels = [*(labels or ()), "global-issue"]
 
     # Add label for where you're working
     working_repo = current_location.get('repo_name', 'unknown')
     if working_repo != 'jensbay_utilities':
-        repo_labels.append(f"from-repo:{working_repo}")
+        repo_labels.append("from-repo:" + working_repo)
 
-    # Add directory context if available
-    if current_location.get('relative_path') and current_location['relative_path'] != '.':
-        dir_label = current_location['relative_path'].split('/')[0]
-        repo_labels.append(f"working-in:{dir_label}")
+    # Add directory context if available (top-level folder only)
+    relative_path = current_location.get('relative_path')
+    if relative_path and relative_path != '.':
+        repo_labels.append("working-in:" + relative_path.partition(os.sep)[0])
 
-    # ALWAYS target jensbay_utilities repo
-    target_owner = "Norris36"
-    target_repo = "jensbay_utilities"
+    return f"[Global] {title}", enhanced_description, repo_labels
 
-    # Try to create issue in jensbay_utilities
-    try:
-        from .issue_logger import create_github_issue
-        from .issue_config import get_github_token
 
-        token = get_github_token()
+def _create_global_issue_on_github(
+    current_location: Dict[str, Optional[str]],
+    token: Optional[str],
+    repo_config: Mapping[str, Any],
+    title: str,
+    body: str,
+    labels: List[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Try to create a prepared global issue on GitHub.
+
+    ~~~
+    • Skips straight to None when no token is available
+    • Creates the issue in the configured target repository
+    • Attaches the working context to a successful result
+    ~~~
+
+    Args:
+        current_location (Dict[str, Optional[str]]): Result of detect_current_repo()
+        token (str, optional): GitHub token
+        repo_config (Mapping[str, Any]): Target repository from get_repo_config()
+        title (str): Prepared issue title
+        body (str): Prepared issue body
+        labels (List[str]): Prepared issue labels
+
+    Returns type: issue_result (Optional[Dict[str, Any]]) - GitHub result, or None if the caller should store locally
+    """
+    target_owner = repo_config["owner"]
+    target_repo = repo_config["repo"]
+
+    try:
         if token:
             print(f"🌐 Creating global issue in {target_owner}/{target_repo}")
             print(f"📍 Working from: {current_location.get('current_dir', 'unknown')}")
 
-            result = create_github_issue(
-                title=f"[Global] {title}",
-                body=enhanced_description,
-                labels=repo_labels,
+            result = _get_create_github_issue()(
+                title=title,
+                body=body,
+                labels=labels,
                 github_token=token,
                 repo_owner=target_owner,
                 repo_name=target_repo
@@ -201,25 +409,73 @@ def global_issue(
     except Exception as e:
         print(f"⚠️  GitHub creation failed: {e}")
 
-    # Fallback to local storage (will sync to jensbay_utilities later)
-    try:
-        from .local_issue_store import store_issue_locally
+    return None
 
-        print(f"📱 Storing issue locally (will sync to {target_repo} later)")
 
-        # Add working context to additional data
-        additional_context = {
-            "working_context": current_location,
-            "global_issue": True,
-            "target_repo": f"{target_owner}/{target_repo}"
-        }
+def _local_issue_data(
+    current_location: Dict[str, Optional[str]],
+    repo_config: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the additional data stored with a locally saved global issue.
+
+    Args:
+        current_location (Dict[str, Optional[str]]): Result of detect_current_repo()
+        repo_config (Mapping[str, Any]): Target repository from get_repo_config()
+
+    Returns type: additional_data (Dict[str, Any]) - working context and sync target
+    """
+    return {
+        "working_context": current_location,
+        "global_issue": True,
+        "target_repo": f"{repo_config['owner']}/{repo_config['repo']}"
+    }
+
+
+def _submit_global_issue(
+    current_location: Dict[str, Optional[str]],
+    token: Optional[str],
+    title: str,
+    body: str,
+    labels: List[str],
+    priority: str = "medium"
+) -> Dict[str, Any]:
+    """
+    Create a prepared global issue on GitHub, falling back to local storage.
+
+    ~~~
+    • Creates the issue in the target repository when a token is available
+    • Stores the issue locally if there is no token or GitHub fails
+    • Attaches the working context to the result
+    ~~~
+
+    Args:
+        current_location (Dict[str, Optional[str]]): Result of detect_current_repo()
+        token (str, optional): GitHub token, None to go straight to local storage
+        title (str): Prepared issue title
+        body (str): Prepared issue body
+        labels (List[str]): Prepared issue labels
+        priority (str): Priority level for local storage
+
+    Returns type: issue_result (Dict[str, Any]) - issue creation result with metadata
+    """
+    # Target repo from the issue profile (jensbay_utilities unless overridden)
+    repo_config = get_repo_config()
+
+    result = _create_global_issue_on_github(current_location, token, repo_config, title, body, labels)
+    if result is not None:
+        return result
+
+    # Fallback to local storage (will sync to the target repo later)
+    try:
+        print(f"📱 Storing issue locally (will sync to {repo_config['repo']} later)")
 
         result = store_issue_locally(
-            title=f"[Global] {title}",
-            body=enhanced_description,
-            labels=repo_labels,
+            title=title,
+            body=body,
+            labels=labels,
             priority=priority,
-            additional_data=additional_context
+            additional_data=_local_issue_data(current_location, repo_config)
         )
 
         if result.get('success'):
@@ -238,6 +494,113 @@ def global_issue(
         }
 
 
+def global_issue(
+    title: str,
+    description: str = "",
+    labels: Optional[List[str]] = None,
+    priority: str = "medium",
+    include_context: bool = True
+) -> Dict[str, Any]:
+    """
+    Create an issue in jensbay_utilities repo from anywhere on your system.
+
+    ~~~
+    • Always creates issues in jensbay_utilities repository
+    • Includes context about your current working location
+    • Works from any directory (doesn't need to be in the repo)
+    • Routes to GitHub or local storage automatically
+    ~~~
+
+    Args:
+        title (str): Issue title
+        description (str): Issue description
+        labels (List[str], optional): Issue labels
+        priority (str): Priority level (low, medium, high, critical)
+        include_context (bool): Include automatic context information
+
+    Returns type: issue_result (Dict[str, Any]) - issue creation result with metadata
+    """
+    current_location = detect_current_repo()
+    issue_title, body, repo_labels = _build_global_issue(
+        current_location, title, description, labels, include_context
+    )
+    return _submit_global_issue(
+        current_location, get_github_token(), issue_title, body, repo_labels, priority
+    )
+
+
+def bulk_global_issue(issues: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Create several global issues at once, sharing the setup work between them.
+
+    ~~~
+    • Detects the working repository and reads the GitHub token once
+    • Builds every issue with the same rules as global_issue
+    • Submits issues concurrently on a thread pool (network bound)
+    • Stores every issue GitHub did not accept in one local batch
+    ~~~
+
+    Args:
+        issues (List[Dict[str, Any]]): Issues as dicts with "title" and optional
+            "description", "labels", "priority" and "include_context" keys
+        max_workers (int): Maximum number of concurrent submissions (default: 8)
+
+    Returns type: issue_results (List[Dict[str, Any]]) - one result per issue, in input order
+    """
+    if not issues:
+        return []
+
+    current_location = detect_current_repo()
+    token = get_github_token()
+    repo_config = get_repo_config()
+
+    prepared = [
+        (
+            *_build_global_issue(
+                current_location,
+                issue["title"],
+                issue.get("description", ""),
+                issue.get("labels"),
+                issue.get("include_context", True)
+            ),
+            issue.get("priority", "medium")
+        )
+        for issue in issues
+    ]
+
+    print(f"🐛 Creating {len(issues)} global issues")
+    results: List[Optional[Dict[str, Any]]] = [None] * len(prepared)
+    if token:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prepared)))) as executor:
+            results = list(executor.map(
+                lambda item: _create_global_issue_on_github(
+                    current_location, token, repo_config, item[0], item[1], item[2]
+                ),
+                prepared
+            ))
+
+    # Store everything GitHub did not accept in one local batch
+    pending = [index for index, result in enumerate(results) if result is None]
+    if pending:
+        print(f"📱 Storing {len(pending)} issues locally (will sync to {repo_config['repo']} later)")
+        additional_data = _local_issue_data(current_location, repo_config)
+        stored = store_issues_locally([
+            {
+                "title": prepared[index][0],
+                "body": prepared[index][1],
+                "labels": prepared[index][2],
+                "priority": prepared[index][3],
+                "additional_data": additional_data
+            }
+            for index in pending
+        ])
+        for index, result in zip(pending, stored):
+            result['working_context'] = current_location
+            results[index] = result
+
+    return results
+
+
 def quick_global_issue(title: str, description: str = "") -> None:
     """
     Quick global issue creation with minimal setup.
@@ -292,20 +655,25 @@ def list_repo_issues(repo_owner: Optional[str] = None, repo_name: Optional[str]
 
     # Try GitHub API first
     try:
-        from .issue_config import get_github_token
-        import requests
-
         token = get_github_token()
         if token:
             url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues"
-            headers = {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3+json"
-            }
-
-            response = requests.get(url, headers=headers)
+            headers = github_auth_headers(token)
+
+            # Conditional request: GitHub answers 304 (not rate limited) if nothing changed
+            cache_key = (repo_owner, repo_name)
+            etag, cached_issues = _ISSUE_LIST_CACHE.get(cache_key, (None, None))
+            if etag:
+                headers = {**headers, "If-None-Match": etag}
+
+            response = github_request("GET", url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached_issues is not None:
+                print(f"✅ Found {len(cached_issues)} GitHub issues (unchanged)")
+                return cached_issues
             if response.status_code == 200:
                 issues = response.json()
+                if response.headers.get("ETag"):
+                    _ISSUE_LIST_CACHE[cache_key] = (response.headers["ETag"], issues)
                 print(f"✅ Found {len(issues)} GitHub issues")
                 return issues
 
@@ -314,8 +682,6 @@ def list_repo_issues(repo_owner: Optional[str] = None, repo_name: Optional[str]
 
     # Fallback to local issues
     try:
-        from .local_issue_store import list_local_issues
-
         local_issues = list_local_issues()
         # Filter by repo if possible
         repo_issues = [
@@ -350,49 +716,34 @@ def global_issue_context() -> Dict[str, Any]:
         # Get additional git information
         git_info = {}
         if repo_info.get('git_root'):
-            try:
-                # Current branch
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=repo_info['git_root']
-                )
-                git_info['current_branch'] = result.stdout.strip()
-
-                # Recent commits
-                result = subprocess.run(
-                    ["git", "log", "--oneline", "-5"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=repo_info['git_root']
-                )
-                git_info['recent_commits'] = result.stdout.strip().split('\n')
-
-                # Status
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=repo_info['git_root']
-                )
-                git_info['has_changes'] = bool(result.stdout.strip())
-
-            except subprocess.CalledProcessError:
-                pass
+            git_root = repo_info['git_root']
+            # The three git calls are independent, so run them concurrently
+            # (wall time becomes the slowest call instead of the sum)
+            with ThreadPoolExecutor(max_workers=len(_CONTEXT_GIT_COMMANDS)) as executor:
+                futures = {
+                    key: executor.submit(_run_git, git_root, *command)
+                    for key, command in _CONTEXT_GIT_COMMANDS.items()
+                }
 
-        # Get Python and system info
-        import platform
-        import sys
+            for key, future in futures.items():
+                try:
+                    output = future.result().stdout
+                except subprocess.CalledProcessError:
+                    continue
+
+                if key == 'current_branch':
+                    git_info['current_branch'] = output.strip()
+                elif key == 'recent_commits':
+                    # splitlines drops the trailing newline and handles \r\n in one pass
+                    git_info['recent_commits'] = output.splitlines()
+                else:
+                    git_info['has_changes'] = bool(output.strip())
 
+        # Get Python and system info
         system_info = {
-            "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            "platform": platform.platform(),
-            "working_directory": os.getcwd(),
-            "timestamp": datetime.now().isoformat()
+            **_get_process_context(),
+            "working_directory": repo_info.get('current_dir') or os.getcwd(),
+            "timestamp": _iso_now()
         }
 
         return {
@@ -405,7 +756,7 @@ def global_issue_context() -> Dict[str, Any]:
         return {
             "repo_info": repo_info,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
 
 
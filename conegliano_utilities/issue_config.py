@@ -4,8 +4,10 @@ Issue Logger Configuration - Secure token and fallback options
 
 import os
 import base64
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 
 # OPTION 1: Hardcoded fallback token (encode it for basic obfuscation)
@@ -13,13 +15,58 @@ from typing import Optional
 _FALLBACK_TOKEN = base64.b64encode(b"YOUR_TOKEN_HERE").decode()
 
 
+def _decode_fallback_token() -> Optional[str]:
+    """
+    Decode the hardcoded fallback token once at import time.
+
+    Returns type: token (Optional[str]) - decoded token, or None if unset or invalid
+    """
+    try:
+        decoded_token = base64.b64decode(_FALLBACK_TOKEN).decode()
+        if decoded_token != 'YOUR_TOKEN_HERE':
+            return decoded_token
+    except Exception:
+        pass
+    return None
+
+
+_DECODED_FALLBACK_TOKEN = _decode_fallback_token()
+
+
+@lru_cache(maxsize=1)
+def _read_stored_token() -> Optional[str]:
+    """
+    Read the token from the local config file or hardcoded fallback, once per process.
+
+    ~~~
+    • Reads ~/.github_config/token if it exists
+    • Falls back to the decoded hardcoded token
+    • Cached until setup_token_config saves a new token
+    ~~~
+
+    Returns type: token (Optional[str]) - GitHub personal access token or None
+    """
+    # Option 2: Local config file (better than hardcoded)
+    config_file = Path.home() / '.github_config' / 'token'
+    try:
+        with open(config_file, 'r') as f:
+            token = f.read().strip()
+            if token and token != 'YOUR_TOKEN_HERE':
+                return token
+    except Exception:
+        pass
+
+    # Option 3: Hardcoded fallback (least secure, but works)
+    return _DECODED_FALLBACK_TOKEN
+
+
 def get_github_token() -> Optional[str]:
     """
     Get GitHub token from multiple sources with fallbacks.
 
     ~~~
-    • Tries environment variable first (most secure)
-    • Falls back to local config file
+    • Tries environment variable first (most secure, checked on every call)
+    • Falls back to local config file (read once and cached)
     • Uses hardcoded token as last resort
     • Returns None if no token found
     ~~~
@@ -31,26 +78,10 @@ def get_github_token() -> Optional[str]:
     if token:
         return token
 
-    # Option 2: Local config file (better than hardcoded)
-    config_file = Path.home() / '.github_config' / 'token'
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                token = f.read().strip()
-                if token and token != 'YOUR_TOKEN_HERE':
-                    return token
-        except Exception:
-            pass
+    return _read_stored_token()
 
-    # Option 3: Hardcoded fallback (least secure, but works)
-    try:
-        decoded_token = base64.b64decode(_FALLBACK_TOKEN).decode()
-        if decoded_token != 'YOUR_TOKEN_HERE':
-            return decoded_token
-    except Exception:
-        pass
 
-    return None
+get_github_token.cache_clear = _read_stored_token.cache_clear
 
 
 def setup_token_config(token: str) -> bool:
@@ -79,6 +110,9 @@ def setup_token_config(token: str) -> bool:
 
         # Set file permissions to be readable only by owner
         config_file.chmod(0o600)
+
+        # Make the next get_github_token() call pick up the new token
+        _read_stored_token.cache_clear()
         return True
 
     except Exception:
@@ -104,21 +138,44 @@ def set_hardcoded_token(token: str) -> str:
     return base64.b64encode(token.encode()).decode()
 
 
-# Alternative repository configurations for different environments
-REPO_CONFIGS = {
-    'personal': {
+# Alternative repository configurations for different environments (read-only)
+REPO_CONFIGS = MappingProxyType({
+    'personal': MappingProxyType({
         'owner': 'Norris36',
         'repo': 'jensbay_utilities',
         'public': True
-    },
-    'work': {
+    }),
+    'work': MappingProxyType({
         'owner': 'your-work-org',
         'repo': 'internal-issues',
         'public': False
-    },
-    'backup': {
+    }),
+    'backup': MappingProxyType({
         'owner': 'Norris36',
         'repo': 'debug-issues',
         'public': True
-    }
-}
\ No newline at end of file
+    })
+})
+
+
+def get_repo_config(profile: str = 'personal') -> Mapping[str, Any]:
+    """
+    Get the target repository configuration for issue creation.
+
+    ~~~
+    • CONEGLIANO_ISSUE_PROFILE overrides the requested profile when set
+    • Returns a read-only view from REPO_CONFIGS
+    • Falls back to the personal profile for unknown names
+    ~~~
+
+    Args:
+        profile (str): Profile name in REPO_CONFIGS (default: 'personal')
+
+    Returns type: repo_config (Mapping[str, Any]) - read-only mapping with owner, repo and public keys
+    """
+    profile = os.getenv('CONEGLIANO_ISSUE_PROFILE') or profile
+    config = REPO_CONFIGS.get(profile)
+    if config is None:
+        print(f"⚠️  Unknown issue profile '{profile}', using 'personal' (choose from: {', '.join(REPO_CONFIGS)})")
+        config = REPO_CONFIGS['personal']
+    return config
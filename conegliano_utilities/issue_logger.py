@@ -7,11 +7,17 @@ import platform
 import sys
 import traceback
 from datetime import datetime
-from typing import Dict, Optional, Any, List
-import requests
+from functools import lru_cache
+from typing import Dict, Optional, Any, List, Tuple
 import os
 import subprocess
-# Remove circular imports - import functions when needed
+from ._http import GITHUB_API_URL, github_auth_headers, github_request, rate_limit_remaining
+from .issue_config import get_github_token
+from .local_issue_store import store_issue_locally
+# local_issue_store imports this module inside its functions, so importing it
+# here at module level does not create an import cycle
+
+_DEBUG_ISSUE_FOOTER = "---\n*This issue was created automatically by the issue_logger module.*"
 
 
 def create_github_issue(
@@ -28,8 +34,9 @@ def create_github_issue(
     ~~~
     • Validates GitHub token and repository access
     • Formats issue body with debugging information
-    • Creates issue via GitHub API with proper headers
-    • Returns issue URL and metadata for reference
+    • Creates issue via GitHub API on the shared pooled session
+    • Backs off and retries when GitHub reports a rate limit
+    • Returns issue URL and metadata, including the remaining API quota
     ~~~
 
     Args:
@@ -45,7 +52,6 @@ def create_github_issue(
     """
     # Get GitHub token from multiple sources
     if not github_token:
-        from .issue_config import get_github_token
         github_token = get_github_token()
 
     if not github_token:
@@ -62,16 +68,12 @@ def create_github_issue(
     issue_data = {"title": title, "body": body, "labels": labels}
 
     # GitHub API endpoint
-    url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues"
-
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json",
-    }
+    url = f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/issues"
 
-    # Create the issue
-    response = requests.post(url, json=issue_data, headers=headers)
+    # Create the issue on the shared session, waiting out rate limits
+    response = github_request(
+        "POST", url, json=issue_data, headers=github_auth_headers(github_token)
+    )
 
     if response.status_code == 201:
         issue_info = response.json()
@@ -82,6 +84,7 @@ def create_github_issue(
             "api_url": issue_info["url"],
             "created_at": issue_info["created_at"],
             "title": issue_info["title"],
+            "rate_limit_remaining": rate_limit_remaining(response),
         }
     else:
         return {
@@ -89,36 +92,23 @@ def create_github_issue(
             "status_code": response.status_code,
             "error": response.text,
             "message": f"Failed to create issue: {response.status_code}",
+            "rate_limit_remaining": rate_limit_remaining(response),
         }
 
 
-def format_system_info() -> str:
+@lru_cache(maxsize=1)
+def _static_system_info() -> str:
     """
-    Collect comprehensive system information for debugging purposes.
+    Build the part of the system information that cannot change within a process.
 
     ~~~
-    • Gathers Python version and implementation details
-    • Collects operating system and platform information
-    • Gets current working directory and environment variables
-    • Formats information in markdown for GitHub issue display
+    • Collects Python and platform details once per process
+    • Leaves the working directory, git details and timestamp to the caller
     ~~~
 
-    Returns type: system_info (str) - formatted system information in markdown
+    Returns type: system_info (str) - markdown system information up to the OS line
     """
-    try:
-        # Get git info if available
-        try:
-            git_branch = subprocess.check_output(
-                ["git", "branch", "--show-current"], cwd=os.getcwd(), text=True
-            ).strip()
-            git_commit = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], cwd=os.getcwd(), text=True
-            ).strip()[:8]
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            git_branch = "N/A"
-            git_commit = "N/A"
-
-        system_info = f"""## System Information
+    return f"""## System Information
 
 **Python Information:**
 - Python Version: {sys.version}
@@ -128,25 +118,105 @@ def format_system_info() -> str:
 
 **Environment:**
 - OS: {platform.system()} {platform.release()}
-- Working Directory: {os.getcwd()}
-- Git Branch: {git_branch}
-- Git Commit: {git_commit}
-
-**Timestamp:** {datetime.now().isoformat()}
 """
-        return system_info
+
+
+def _git_info(working_dir: str) -> Tuple[str, str]:
+    """
+    Read the current git branch and commit for a directory.
+
+    ~~~
+    • Runs a single git rev-parse for both values
+    • Not cached, so reports stay correct after a commit or checkout
+    ~~~
+
+    Args:
+        working_dir (str): Directory to run git in
+
+    Returns type: git_info (Tuple[str, str]) - branch and short commit, "N/A" for both outside a repository
+    """
+    # One rev-parse prints the commit, then the branch (--abbrev-ref only
+    # applies to the revisions after it)
+    try:
+        git_commit, git_branch = subprocess.check_output(
+            ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], cwd=working_dir, text=True
+        ).splitlines()
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return "N/A", "N/A"
+    if git_branch == "HEAD":
+        git_branch = ""  # detached HEAD, as reported by git branch --show-current
+    return git_branch, git_commit[:8]
+
+
+def format_system_info() -> str:
+    """
+    Collect comprehensive system information for debugging purposes.
+
+    ~~~
+    • Gathers Python version and implementation details
+    • Collects operating system and platform information
+    • Gets current working directory and git branch/commit
+    • Formats information in markdown for GitHub issue display
+    • Caches only the Python and platform details (clear with format_system_info.cache_clear())
+    ~~~
+
+    Returns type: system_info (str) - formatted system information in markdown
+    """
+    try:
+        working_dir = os.getcwd()
+        git_branch, git_commit = _git_info(working_dir)
+        return (
+            f"{_static_system_info()}"
+            f"- Working Directory: {working_dir}\n"
+            f"- Git Branch: {git_branch}\n"
+            f"- Git Commit: {git_commit}\n\n"
+            f"**Timestamp:** {datetime.now().isoformat()}\n"
+        )
 
     except Exception as e:
         return f"## System Information\n\nError collecting system info: {str(e)}\n"
 
 
+format_system_info.cache_clear = _static_system_info.cache_clear
+
+
+def _format_exception_text(exception: BaseException) -> str:
+    """
+    Format an exception's traceback, reusing the text from an earlier call.
+
+    ~~~
+    • Stores the formatted text on the exception itself, so it is freed with it
+    • Reformats if the traceback or chained exceptions changed (e.g. re-raised)
+    • Skips walking frames and reading source lines on repeat calls
+    ~~~
+
+    Args:
+        exception (BaseException): Exception to format
+
+    Returns type: trace_text (str) - formatted traceback text
+    """
+    key = (exception.__traceback__, exception.__cause__, exception.__context__)
+    cached = getattr(exception, "_issue_logger_trace", None)
+    if cached is not None and all(a is b for a, b in zip(cached[0], key)):
+        return cached[1]
+
+    trace_text = "".join(
+        traceback.format_exception(type(exception), exception, exception.__traceback__)
+    )
+    try:
+        exception._issue_logger_trace = (key, trace_text)
+    except AttributeError:
+        pass  # exception types without __dict__ are simply not cached
+    return trace_text
+
+
 def format_stack_trace(exception: Optional[Exception] = None) -> str:
     """
     Format current or provided exception with full stack trace for debugging.
 
     ~~~
     • Captures current exception if none provided
-    • Formats full stack trace with file paths and line numbers
+    • Formats full stack trace with file paths and line numbers, once per exception
     • Includes exception type and message details
     • Returns markdown-formatted traceback for GitHub issues
     ~~~
@@ -156,21 +226,16 @@ def format_stack_trace(exception: Optional[Exception] = None) -> str:
 
     Returns type: formatted_trace (str) - markdown formatted stack trace
     """
-    if exception:
-        # Format provided exception
-        trace_lines = traceback.format_exception(
-            type(exception), exception, exception.__traceback__
-        )
-        trace_text = "".join(trace_lines)
-    else:
+    if exception is None:
         # Get current exception if available
-        exc_info = sys.exc_info()
-        if exc_info[0] is not None:
-            trace_text = traceback.format_exc()
-        else:
-            trace_text = (
-                "No active exception found. Call this function within an except block."
-            )
+        exception = sys.exc_info()[1]
+
+    if exception is not None:
+        trace_text = _format_exception_text(exception)
+    else:
+        trace_text = (
+            "No active exception found. Call this function within an except block."
+        )
 
     return f"""## Stack Trace
 
@@ -222,22 +287,21 @@ def create_debug_issue(
     if exception:
         body_parts.append(format_stack_trace(exception))
 
-    # Add additional context
+    # Add additional context as one section (JSON stays indented for readability)
     if additional_context:
-        body_parts.append("## Additional Context\n")
-        for key, value in additional_context.items():
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value, indent=2)
-            body_parts.append(f"**{key}:** \n```\n{value}\n```\n")
+        body_parts.append("## Additional Context\n\n" + "\n".join(
+            f"**{key}:** \n```\n"
+            f"{json.dumps(value, indent=2) if isinstance(value, (dict, list)) else value}"
+            "\n```\n"
+            for key, value in additional_context.items()
+        ))
 
     # Add system information
     if include_system_info:
         body_parts.append(format_system_info())
 
     # Add footer
-    body_parts.append(
-        "---\n*This issue was created automatically by the issue_logger module.*"
-    )
+    body_parts.append(_DEBUG_ISSUE_FOOTER)
 
     body = "\n".join(body_parts)
 
@@ -342,32 +406,28 @@ def smart_issue(
     """
     if force_local:
         print("🗂️  Creating local issue (forced)...")
-        from .local_issue_store import store_issue_locally
         return store_issue_locally(title, description, labels, priority)
 
-    try:
-        # Try GitHub first
-        from .issue_config import get_github_token
-        github_token = get_github_token()
-        if github_token:
-            print("🌐 Trying GitHub...")
+    # Fast path: get_github_token only reads the environment and a cached
+    # file, so it cannot raise; only the GitHub request needs guarding
+    github_token = get_github_token()
+    if github_token:
+        print("🌐 Trying GitHub...")
+        try:
             result = create_github_issue(title=title, body=description, labels=labels, github_token=github_token)
-
+        except Exception as e:
+            print(f"⚠️  GitHub error: {str(e)}")
+            print("📱 Falling back to local storage...")
+        else:
             if result.get("success"):
                 print(f"✅ GitHub issue created: {result['issue_url']}")
                 return result
-            else:
-                print(f"⚠️  GitHub failed: {result.get('message', 'Unknown error')}")
-                print("📱 Falling back to local storage...")
-        else:
-            print("🔑 No GitHub token found, using local storage...")
-
-    except Exception as e:
-        print(f"⚠️  GitHub error: {str(e)}")
-        print("📱 Falling back to local storage...")
+            print(f"⚠️  GitHub failed: {result.get('message', 'Unknown error')}")
+            print("📱 Falling back to local storage...")
+    else:
+        print("🔑 No GitHub token found, using local storage...")
 
     # Fallback to local storage
-    from .local_issue_store import store_issue_locally
     local_result = store_issue_locally(title, description, labels, priority)
     if local_result.get("success"):
         print(f"✅ Local issue stored: {local_result['file_path']}")
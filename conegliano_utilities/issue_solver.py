@@ -9,70 +9,109 @@ This module provides tools for:
 """
 
 import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from .global_issue_logger import list_repo_issues
 from .code_extractor import extract_function_code
+from ._http import GITHUB_API_URL, github_auth_headers, github_request
+from .issue_config import get_github_token
+
+# Solution issue body; filled with str.format_map in issue_solved
+_SOLUTION_HEADER_TEMPLATE = (
+    "## Solution for Issue #{n}\n\n"
+    "This issue provides a solution for #{n}.\n\n"
+)
+_SOLUTION_BODY_TEMPLATE = (
+    "{header}{description}"
+    "## Solution Code\n"
+    "\n"
+    "```python\n"
+    "{code}\n"
+    "```\n"
+    "\n"
+    "## Solution Details\n"
+    "\n"
+    "- **Created:** {created}\n"
+    "{function_line}{solves_line}"
+    "\n"
+    "---\n"
+    "*This solution was created using the issue_solver module.*"
+)
+
+# (owner, repo) -> (ETag, raw issues) from the last successful open-issues fetch
+_OPEN_ISSUES_CACHE: Dict[Tuple[str, str], Tuple[str, List[Dict[str, Any]]]] = {}
+
+
+def _simplify_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a GitHub API issue payload to the fields the solver uses.
 
+    Args:
+        issue (Dict[str, Any]): Issue object from the GitHub API
 
-def get_open_issues(repo_owner: str = "Norris36", repo_name: str = "jensbay_utilities") -> List[Dict[str, Any]]:
+    Returns type: simplified (Dict[str, Any]) - issue metadata
     """
-    Get all open issues from the jensbay_utilities repository.
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "body": issue["body"] or "",
+        "labels": [label["name"] for label in issue["labels"]],
+        "created_at": issue["created_at"],
+        "updated_at": issue["updated_at"],
+        "html_url": issue["html_url"],
+        "state": issue["state"]
+    }
+
+
+def _fetch_open_issues(repo_owner: str, repo_name: str) -> List[Dict[str, Any]]:
+    """
+    Fetch the raw open-issue payloads for a repository.
 
     ~~~
-    • Fetches open issues from GitHub API
-    • Filters by state and labels if needed
-    • Returns organized list with issue metadata
-    • Handles API errors gracefully
+    • Sends If-None-Match with the ETag from the previous fetch
+    • Returns the cached page when GitHub answers 304 Not Modified
+    • Prints the number of issues found
     ~~~
 
     Args:
-        repo_owner (str): Repository owner (default: Norris36)
-        repo_name (str): Repository name (default: jensbay_utilities)
+        repo_owner (str): Repository owner
+        repo_name (str): Repository name
 
-    Returns type: issues (List[Dict[str, Any]]) - list of open issue metadata
+    Returns type: issues (List[Dict[str, Any]]) - raw GitHub issue objects, empty on failure
     """
     try:
-        from .issue_config import get_github_token
-
         token = get_github_token()
         if not token:
             print("❌ No GitHub token found. Cannot fetch issues.")
             return []
 
-        url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues"
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+        url = f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/issues"
 
         params = {
             "state": "open",
             "per_page": 50  # Adjust as needed
         }
 
-        response = requests.get(url, headers=headers, params=params)
+        # Conditional request: GitHub answers 304 (not rate limited) if nothing changed
+        cache_key = (repo_owner, repo_name)
+        etag, cached_issues = _OPEN_ISSUES_CACHE.get(cache_key, (None, None))
+        headers = github_auth_headers(token)
+        if etag:
+            headers = {**headers, "If-None-Match": etag}
+
+        response = github_request("GET", url, headers=headers, params=params)
+
+        if response.status_code == 304 and cached_issues is not None:
+            print(f"📋 Found {len(cached_issues)} open issues (unchanged)")
+            return cached_issues
 
         if response.status_code == 200:
             issues = response.json()
+            if response.headers.get("ETag"):
+                _OPEN_ISSUES_CACHE[cache_key] = (response.headers["ETag"], issues)
             print(f"📋 Found {len(issues)} open issues")
-
-            # Return simplified issue data
-            simplified_issues = []
-            for issue in issues:
-                simplified_issues.append({
-                    "number": issue["number"],
-                    "title": issue["title"],
-                    "body": issue["body"] or "",
-                    "labels": [label["name"] for label in issue["labels"]],
-                    "created_at": issue["created_at"],
-                    "updated_at": issue["updated_at"],
-                    "html_url": issue["html_url"],
-                    "state": issue["state"]
-                })
-
-            return simplified_issues
+            return issues
 
         else:
             print(f"❌ Failed to fetch issues: {response.status_code}")
@@ -84,6 +123,47 @@ def get_open_issues(repo_owner: str = "Norris36", repo_name: str = "jensbay_util
         return []
 
 
+def iter_open_issues(repo_owner: str = "Norris36", repo_name: str = "jensbay_utilities") -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield simplified open issues from the jensbay_utilities repository.
+
+    1. Fetches the open issues page when called, not when iterated
+    2. Simplifies each issue only as the caller reaches it
+    3. Yields nothing if the token is missing or the request fails
+
+    Args:
+        repo_owner (str): Repository owner (default: Norris36)
+        repo_name (str): Repository name (default: jensbay_utilities)
+
+    Returns type: issues (Iterator[Dict[str, Any]]) - open issue metadata
+    """
+    return map(_simplify_issue, _fetch_open_issues(repo_owner, repo_name))
+
+
+def get_open_issues(repo_owner: str = "Norris36", repo_name: str = "jensbay_utilities") -> List[Dict[str, Any]]:
+    """
+    Get all open issues from the jensbay_utilities repository.
+
+    ~~~
+    • Fetches open issues from GitHub API
+    • Filters by state and labels if needed
+    • Returns organized list with issue metadata
+    • Handles API errors gracefully
+    ~~~
+
+    Args:
+        repo_owner (str): Repository owner (default: Norris36)
+        repo_name (str): Repository name (default: jensbay_utilities)
+
+    Returns type: issues (List[Dict[str, Any]]) - list of open issue metadata
+    """
+    try:
+        return list(iter_open_issues(repo_owner, repo_name))
+    except Exception as e:
+        print(f"❌ Error fetching issues: {e}")
+        return []
+
+
 def display_open_issues(limit: int = 10) -> None:
     """
     Display open issues in a readable format.
@@ -91,8 +171,9 @@ def display_open_issues(limit: int = 10) -> None:
     ~~~
     • Fetches and formats open issues
     • Shows essential information for each issue
-    • Limits display to specified number
+    • Limits display to specified number, simplifying only those issues
     • Provides issue numbers for reference
+    • Writes the listing to the console in a single call
     ~~~
 
     Args:
@@ -100,24 +181,28 @@ def display_open_issues(limit: int = 10) -> None:
 
     Returns type: None (NoneType) - prints formatted issue list
     """
-    issues = get_open_issues()
+    raw_issues = _fetch_open_issues("Norris36", "jensbay_utilities")
 
-    if not issues:
+    if not raw_issues:
         print("📭 No open issues found")
         return
 
-    print(f"📋 OPEN ISSUES (showing {min(limit, len(issues))} of {len(issues)}):")
-    print("=" * 60)
+    total = len(raw_issues)
+    lines = [f"📋 OPEN ISSUES (showing {min(limit, total)} of {total}):", "=" * 60]
+
+    for issue in map(_simplify_issue, raw_issues[:limit]):
+        lines.append(
+            f"#{issue['number']}: {issue['title']}\n"
+            f"   Labels: {', '.join(issue['labels']) if issue['labels'] else 'None'}\n"
+            f"   Created: {issue['created_at'][:10]}\n"
+            f"   URL: {issue['html_url']}\n"
+        )
 
-    for i, issue in enumerate(issues[:limit]):
-        print(f"#{issue['number']}: {issue['title']}")
-        print(f"   Labels: {', '.join(issue['labels']) if issue['labels'] else 'None'}")
-        print(f"   Created: {issue['created_at'][:10]}")
-        print(f"   URL: {issue['html_url']}")
-        print()
+    if total > limit:
+        lines.append(f"... and {total - limit} more issues")
 
-    if len(issues) > limit:
-        print(f"... and {len(issues) - limit} more issues")
+    # One write for the whole listing instead of five prints per issue
+    print("\n".join(lines))
 
 
 def issue_solved(
@@ -134,7 +219,7 @@ def issue_solved(
     ~~~
     • Creates new issue with solution code and description
     • Links to original issue if provided
-    • Optionally closes the original issue
+    • Optionally closes the original issue, concurrently with the link comment
     • Formats code properly for GitHub display
     ~~~
 
@@ -163,43 +248,20 @@ def issue_solved(
             print(f"❌ Could not extract function '{function_name}': {extraction_result.get('error', 'Unknown error')}")
             return extraction_result
 
-    # Build solution issue body
-    body_parts = []
-
-    # Add link to original issue if provided
-    if original_issue_number:
-        body_parts.append(f"## Solution for Issue #{original_issue_number}\n")
-        body_parts.append(f"This issue provides a solution for #{original_issue_number}.\n")
-
-    # Add description
-    if description:
-        body_parts.append(f"## Description\n\n{description}\n")
-
-    # Add solution code
-    body_parts.append("## Solution Code\n")
-    body_parts.append("```python")
-    body_parts.append(solution_code)
-    body_parts.append("```\n")
-
-    # Add metadata
-    body_parts.append("## Solution Details\n")
-    body_parts.append(f"- **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    if function_name:
-        body_parts.append(f"- **Function:** `{function_name}`")
-    if original_issue_number:
-        body_parts.append(f"- **Solves:** Issue #{original_issue_number}")
-    body_parts.append("")
-
-    body_parts.append("---")
-    body_parts.append("*This solution was created using the issue_solver module.*")
-
-    solution_body = "\n".join(body_parts)
+    # Build solution issue body from the module template; optional sections
+    # are empty strings so only the dynamic fields are formatted per call
+    solution_body = _SOLUTION_BODY_TEMPLATE.format_map({
+        "header": _SOLUTION_HEADER_TEMPLATE.format_map({"n": original_issue_number}) if original_issue_number else "",
+        "description": f"## Description\n\n{description}\n\n" if description else "",
+        "code": solution_code,
+        "created": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "function_line": f"- **Function:** `{function_name}`\n" if function_name else "",
+        "solves_line": f"- **Solves:** Issue #{original_issue_number}\n" if original_issue_number else "",
+    })
 
     # Create the solution issue
     try:
         from .issue_logger import create_github_issue
-        from .issue_config import get_github_token
-
         token = get_github_token()
         if not token:
             print("❌ No GitHub token found")
@@ -223,32 +285,38 @@ def issue_solved(
         if result.get("success"):
             print(f"✅ Solution issue created: {result['issue_url']}")
 
-            # Add comment to original issue if provided
+            # Comment on and close the original issue concurrently; both only
+            # depend on the solution issue, so their round trips overlap. The
+            # close runs on a worker thread and the comment on this one, so no
+            # thread is started when only the comment is needed
             if original_issue_number:
+                close_future = None
+                if close_original:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    close_future = executor.submit(close_issue, original_issue_number)
+                    executor.shutdown(wait=False)
+
                 try:
                     comment_result = add_comment_to_issue(
                         issue_number=original_issue_number,
                         comment=f"💡 **Solution Available**\n\nA solution for this issue has been created: #{result['issue_number']}\n\nSee: {result['issue_url']}"
                     )
-
                     if comment_result.get("success"):
                         print(f"✅ Added solution link to original issue #{original_issue_number}")
                     else:
                         print(f"⚠️  Could not comment on original issue: {comment_result.get('error')}")
-
                 except Exception as e:
                     print(f"⚠️  Could not comment on original issue: {e}")
 
-            # Close original issue if requested
-            if close_original and original_issue_number:
-                try:
-                    close_result = close_issue(original_issue_number)
-                    if close_result.get("success"):
-                        print(f"✅ Closed original issue #{original_issue_number}")
-                    else:
-                        print(f"⚠️  Could not close original issue: {close_result.get('error')}")
-                except Exception as e:
-                    print(f"⚠️  Could not close original issue: {e}")
+                if close_future is not None:
+                    try:
+                        close_result = close_future.result()
+                        if close_result.get("success"):
+                            print(f"✅ Closed original issue #{original_issue_number}")
+                        else:
+                            print(f"⚠️  Could not close original issue: {close_result.get('error')}")
+                    except Exception as e:
+                        print(f"⚠️  Could not close original issue: {e}")
 
             result.update({
                 "original_issue": original_issue_number,
@@ -288,22 +356,15 @@ def add_comment_to_issue(issue_number: int, comment: str, repo_owner: str = "Nor
     Returns type: comment_result (Dict[str, Any]) - comment creation result
     """
     try:
-        from .issue_config import get_github_token
-
         token = get_github_token()
         if not token:
             return {"success": False, "error": "No GitHub token"}
 
-        url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues/{issue_number}/comments"
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json"
-        }
+        url = f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/issues/{issue_number}/comments"
 
         data = {"body": comment}
 
-        response = requests.post(url, json=data, headers=headers)
+        response = github_request("POST", url, json=data, headers=github_auth_headers(token))
 
         if response.status_code == 201:
             comment_data = response.json()
@@ -343,22 +404,15 @@ def close_issue(issue_number: int, repo_owner: str = "Norris36", repo_name: str
     Returns type: close_result (Dict[str, Any]) - close operation result
     """
     try:
-        from .issue_config import get_github_token
-
         token = get_github_token()
         if not token:
             return {"success": False, "error": "No GitHub token"}
 
-        url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/issues/{issue_number}"
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json"
-        }
+        url = f"{GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/issues/{issue_number}"
 
         data = {"state": "closed"}
 
-        response = requests.patch(url, json=data, headers=headers)
+        response = github_request("PATCH", url, json=data, headers=github_auth_headers(token))
 
         if response.status_code == 200:
             issue_data = response.json()
@@ -2,32 +2,211 @@
 Local Issue Storage - Store issues locally when GitHub access is restricted
 """
 
+import importlib
 import json
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import uuid
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+import secrets
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
+# orjson is optional: it serializes straight to UTF-8 bytes and parses
+# faster; without it issue files are read and written with stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def get_local_issues_dir() -> Path:
+
+# orjson parses integers outside the 64-bit range as floats; any number that
+# long (or a long digit run inside a string) is parsed with stdlib json instead
+_LONG_DIGITS_PATTERN = re.compile(rb'\d{19}')
+
+
+def _dump_issue_json(issue_data: Dict[str, Any]) -> bytes:
     """
-    Get or create local directory for storing issues.
+    Serialize issue data to indented UTF-8 JSON bytes.
 
     ~~~
-    • Creates issues directory in user home or project root
-    • Ensures directory exists with proper permissions
-    • Returns Path object for issues storage
-    • Falls back to temp directory if needed
+    • Uses orjson when installed, falling back to stdlib json
+    • Falls back as well for data orjson rejects (e.g. integers over 64 bits)
+    ~~~
+
+    Args:
+        issue_data (Dict[str, Any]): Issue data to serialize
+
+    Returns type: content (bytes) - JSON document as written to disk
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(issue_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(issue_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_issue_json(content: bytes) -> Dict[str, Any]:
+    """
+    Parse an issue file's JSON bytes.
+
+    ~~~
+    • Uses orjson when installed, falling back to stdlib json
+    • Falls back for NaN/Infinity tokens, which stdlib json writes but orjson rejects
+    • Falls back for runs of 19+ digits, which may be integers orjson would read as floats
+    ~~~
+
+    Args:
+        content (bytes): Raw file contents
+
+    Returns type: issue_data (Dict[str, Any]) - parsed issue data
+    """
+    if orjson is not None and not _LONG_DIGITS_PATTERN.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # Corrupt files fail again below
+    return json.loads(content)
+
+
+def _format_context_value(value: Any) -> str:
+    """
+    Format a dict or list context value as indented JSON text for an issue body.
+
     ~~~
+    • Uses orjson when installed, falling back to stdlib json
+    • Falls back as well for values orjson rejects (e.g. integers over 64 bits)
+    ~~~
+
+    Args:
+        value (Any): Context value to format
+
+    Returns type: text (str) - indented JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2)
+
+
+class _SafeTitleTable(dict):
+    """
+    str.translate table keeping alphanumerics, spaces, '-' and '_' in titles.
+
+    Entries are filled in on first sight of each character, so translate runs
+    in C for every character it has seen before without a table for all of Unicode.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_TITLE_TABLE = _SafeTitleTable()
+
+# Plain ASCII titles that need no characters removed skip str.translate
+_SAFE_ASCII_TITLE_PATTERN = re.compile(r'[A-Za-z0-9 _-]*')
+
+_LOCAL_DEBUG_FOOTER = "---\n*This issue was created locally by the issue_logger module.*"
+
+# list_local_issues reads files on a thread pool from this many files upward
+_PARALLEL_READ_THRESHOLD = 64
+
+# sync_local_issues_to_github creates at most this many GitHub issues at once;
+# GitHub's secondary rate limit starts flagging at around 10 concurrent requests
+_SYNC_MAX_WORKERS = 8
+
+# Issues read ahead of the GitHub calls; reading pauses while this many are in flight
+_SYNC_MAX_PENDING = _SYNC_MAX_WORKERS * 2
+
+# Issue files are named {date}_{id}.{status}.{title}.json. Sanitized titles
+# never contain dots, so older {date}_{id}_{title}.json names cannot be
+# mistaken for this layout; their status is only known after parsing.
+_FILENAME_STATUS_PATTERN = re.compile(r'^\d{8}_\d{6}_[^._]+\.([a-z_]+)\.')
+
+# Fields changed after creation (e.g. by a sync) live in a {issue file}.meta
+# sidecar (e.g. ….synced.Title.json.meta), so the issue file itself is written
+# once and never rewritten. Sidecars do not end in .json, so no issue file name
+# can collide with one. Only issues named with the open status are known to
+# have no sidecar.
+_META_SUFFIX = '.meta'
+
+
+@lru_cache(maxsize=1)
+def _issue_logger():
+    """
+    Get the issue_logger module, importing it on first use.
+
+    ~~~
+    • issue_logger imports this module at load time, so importing it back at
+      module level would fail with a partially initialised module
+    • Cached, so later calls skip the import machinery and its lock
+    • Returns the module rather than its functions, so patches on it still apply
+    ~~~
+
+    Returns type: module (ModuleType) - the conegliano_utilities.issue_logger module
+    """
+    return importlib.import_module('.issue_logger', __package__)
+
+
+def _status_from_filename(name: str) -> Optional[str]:
+    """
+    Read the status embedded in an issue filename.
+
+    Args:
+        name (str): Issue file name
+
+    Returns type: status (Optional[str]) - embedded status, or None for older file names
+    """
+    match = _FILENAME_STATUS_PATTERN.match(name)
+    return match.group(1) if match else None
+
+
+def _with_filename_status(file_path: str, status: str) -> str:
+    """
+    Get the path an issue file should have after a status change.
+
+    Args:
+        file_path (str): Current issue file path
+        status (str): New issue status
+
+    Returns type: new_path (str) - path with the embedded status replaced (unchanged for older names)
+    """
+    directory, name = os.path.split(file_path)
+    match = _FILENAME_STATUS_PATTERN.match(name)
+    if not match:
+        return file_path
+    return os.path.join(directory, f"{name[:match.start(1)]}{status}{name[match.end(1):]}")
+
+
+@lru_cache(maxsize=8)
+def _resolve_local_issues_dir(home: Path, cwd: Path) -> Path:
+    """
+    Pick the first usable issues directory for a home and working directory.
+
+    ~~~
+    • Tries the user home, then the project directory, then the temp directory
+    • Creates the directory and checks it is writable (os.access on POSIX, a probe file on Windows)
+    • Cached, so the probing runs once per home/working directory pair
+    ~~~
+
+    Args:
+        home (Path): User home directory
+        cwd (Path): Current working directory
 
     Returns type: issues_dir (Path) - directory path for storing local issues
     """
     # Try user home first
-    home_dir = Path.home() / '.local_issues'
+    home_dir = home / '.local_issues'
 
     # Try project directory as fallback
-    project_dir = Path.cwd() / 'local_issues'
+    project_dir = cwd / 'local_issues'
 
     # Try temp directory as last resort
     temp_dir = Path('/tmp') / 'local_issues' if os.name != 'nt' else Path(os.environ.get('TEMP', '.')) / 'local_issues'
@@ -35,7 +214,13 @@ def get_local_issues_dir() -> Path:
     for directory in [home_dir, project_dir, temp_dir]:
         try:
             directory.mkdir(exist_ok=True, mode=0o755)
-            # Test write access
+            if os.name != 'nt':
+                # One access() syscall; also reports read-only mounts (EROFS)
+                if os.access(directory, os.W_OK):
+                    return directory
+                continue
+            # os.access is unreliable for ACLs and network shares on Windows,
+            # so test write access with a real file there
             test_file = directory / '.test'
             test_file.write_text('test')
             test_file.unlink()
@@ -49,6 +234,123 @@ def get_local_issues_dir() -> Path:
     return fallback_dir
 
 
+def get_local_issues_dir() -> Path:
+    """
+    Get or create local directory for storing issues.
+
+    ~~~
+    • Creates issues directory in user home or project root
+    • Ensures directory exists with proper permissions
+    • Returns Path object for issues storage
+    • Falls back to temp directory if needed
+    • Caches the choice per home and working directory (clear with get_local_issues_dir.cache_clear())
+    ~~~
+
+    Returns type: issues_dir (Path) - directory path for storing local issues
+    """
+    return _resolve_local_issues_dir(Path.home(), Path.cwd())
+
+
+get_local_issues_dir.cache_clear = _resolve_local_issues_dir.cache_clear
+
+
+def _write_issue_file(file_path: str, content: bytes, atomic: bool = False) -> None:
+    """
+    Write an issue file's bytes with raw os.open/os.write calls.
+
+    ~~~
+    • Skips the buffered file object; the payload is already one bytes object
+    • Loops on os.write in case of a short write
+    • With atomic=True, writes a .tmp sibling and os.replace()s it into place,
+      so an existing issue is never left half rewritten
+    ~~~
+
+    Args:
+        file_path (str): Destination path
+        content (bytes): Serialized issue JSON
+        atomic (bool): Replace the destination atomically (for rewrites)
+
+    Returns type: None (NoneType) - file is written to disk
+    """
+    target = f"{file_path}.tmp" if atomic else file_path
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    if atomic:
+        os.replace(target, file_path)
+
+
+def _write_local_issue(
+    issues_dir: Path,
+    title: str,
+    body: str,
+    labels: Optional[List[str]] = None,
+    priority: str = "medium",
+    additional_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Write one issue as a JSON file into an existing issues directory.
+
+    ~~~
+    • Generates unique ID and timestamp for tracking
+    • Builds a filesystem-safe filename from the status and title
+    • Writes the issue data as indented UTF-8 JSON in a single write
+    ~~~
+
+    Args:
+        issues_dir (Path): Directory returned by get_local_issues_dir()
+        title (str): Issue title
+        body (str): Issue description and details
+        labels (List[str], optional): Issue labels
+        priority (str): Issue priority (low, medium, high, critical)
+        additional_data (Dict[str, Any], optional): Extra debugging data
+
+    Returns type: issue_info (Dict[str, Any]) - local issue metadata and file path
+    """
+    # Generate unique ID and timestamp
+    issue_id = secrets.token_hex(4)  # 8 hex chars, like the old str(uuid4())[:8]
+    timestamp = datetime.now()
+    date_str = timestamp.strftime("%Y%m%d_%H%M%S")
+    created_at = timestamp.isoformat()
+
+    # Create issue data
+    issue_data = {
+        "id": issue_id,
+        "title": title,
+        "body": body,
+        "labels": labels or [],
+        "priority": priority,
+        "status": "open",
+        "created_at": created_at,
+        "additional_data": additional_data or {},
+        "source": "local_issue_store"
+    }
+
+    # Create filename
+    if _SAFE_ASCII_TITLE_PATTERN.fullmatch(title):
+        safe_title = title.rstrip()[:50].replace(' ', '_')
+    else:
+        safe_title = title.translate(_SAFE_TITLE_TABLE).rstrip()[:50].replace(' ', '_')
+    filename = f"{date_str}_{issue_id}.{issue_data['status']}.{safe_title}.json"
+
+    # Save to file
+    file_path = issues_dir / filename
+    _write_issue_file(str(file_path), _dump_issue_json(issue_data))
+
+    return {
+        "success": True,
+        "issue_id": issue_id,
+        "file_path": str(file_path),
+        "created_at": created_at,
+        "title": title,
+        "storage_type": "local"
+    }
+
+
 def store_issue_locally(
     title: str,
     body: str,
@@ -76,43 +378,9 @@ def store_issue_locally(
     Returns type: issue_info (Dict[str, Any]) - local issue metadata and file path
     """
     try:
-        issues_dir = get_local_issues_dir()
-
-        # Generate unique ID and timestamp
-        issue_id = str(uuid.uuid4())[:8]
-        timestamp = datetime.now()
-        date_str = timestamp.strftime("%Y%m%d_%H%M%S")
-
-        # Create issue data
-        issue_data = {
-            "id": issue_id,
-            "title": title,
-            "body": body,
-            "labels": labels or [],
-            "priority": priority,
-            "status": "open",
-            "created_at": timestamp.isoformat(),
-            "additional_data": additional_data or {},
-            "source": "local_issue_store"
-        }
-
-        # Create filename
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
-        filename = f"{date_str}_{issue_id}_{safe_title.replace(' ', '_')}.json"
-
-        # Save to file
-        file_path = issues_dir / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(issue_data, f, indent=2, ensure_ascii=False)
-
-        return {
-            "success": True,
-            "issue_id": issue_id,
-            "file_path": str(file_path),
-            "created_at": timestamp.isoformat(),
-            "title": title,
-            "storage_type": "local"
-        }
+        return _write_local_issue(
+            get_local_issues_dir(), title, body, labels, priority, additional_data
+        )
 
     except Exception as e:
         return {
@@ -122,15 +390,193 @@ def store_issue_locally(
         }
 
 
+def store_issues_locally(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Store several issues locally in one pass.
+
+    ~~~
+    • Resolves (and write-checks) the issues directory once for the batch
+    • Writes one JSON file per issue, like store_issue_locally
+    • Reports failures per issue without stopping the batch
+    ~~~
+
+    Args:
+        issues (List[Dict[str, Any]]): Issues as dicts with "title" and "body" and optional
+            "labels", "priority" and "additional_data" keys
+
+    Returns type: issue_infos (List[Dict[str, Any]]) - one result per issue, in input order
+    """
+    if not issues:
+        return []
+
+    try:
+        issues_dir = get_local_issues_dir()
+    except Exception as e:
+        return [{"success": False, "error": str(e), "storage_type": "local"} for _ in issues]
+
+    results = []
+    for issue in issues:
+        try:
+            results.append(_write_local_issue(
+                issues_dir,
+                issue["title"],
+                issue["body"],
+                issue.get("labels"),
+                issue.get("priority", "medium"),
+                issue.get("additional_data")
+            ))
+        except Exception as e:
+            results.append({"success": False, "error": str(e), "storage_type": "local"})
+    return results
+
+
+def _read_issue_file(file_path: str) -> Optional[bytes]:
+    """
+    Read one issue file's raw bytes.
+
+    Args:
+        file_path (str): Path to the issue JSON file
+
+    Returns type: content (Optional[bytes]) - file contents, or None if it cannot be read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_issue(file_path: str) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Read one issue file and its metadata sidecar, if it can have one.
+
+    Args:
+        file_path (str): Path to the issue JSON file
+
+    Returns type: contents (Tuple[Optional[bytes], Optional[bytes]]) - issue bytes and sidecar bytes, None where missing
+    """
+    content = _read_issue_file(file_path)
+    if content is None or _status_from_filename(os.path.basename(file_path)) == 'open':
+        return content, None
+    return content, _read_issue_file(file_path + _META_SUFFIX)
+
+
+def _read_issue_files(paths: List[str]) -> List[Tuple[str, Optional[bytes], Optional[bytes]]]:
+    """
+    Read many issue files, overlapping the I/O with threads for large directories.
+
+    ~~~
+    • Reads serially below _PARALLEL_READ_THRESHOLD files, where threads cost more than they save
+    • Otherwise reads on up to 32 threads (file reads release the GIL)
+    • Reads each issue's metadata sidecar alongside it
+    • Keeps the input order; parsing is left to the caller's thread
+    ~~~
+
+    Args:
+        paths (List[str]): Issue file paths
+
+    Returns type: contents (List[Tuple[str, Optional[bytes], Optional[bytes]]]) - (path, issue bytes, sidecar bytes) in input order
+    """
+    if len(paths) < _PARALLEL_READ_THRESHOLD:
+        return [(path, *_read_issue(path)) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return [(path, *contents) for path, contents in zip(paths, executor.map(_read_issue, paths))]
+
+
+def _scan_issue_paths(issues_dir: Path, status: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield the issue file paths in a directory that may match a status.
+
+    ~~~
+    • One os.scandir pass; DirEntry gives the name and type without a Path or stat per file
+    • Skips files whose name shows a different status without reading them (sidecars never end in .json)
+    ~~~
+
+    Args:
+        issues_dir (Path): Directory returned by get_local_issues_dir()
+        status (str, optional): Status the issues must have
+
+    Returns type: paths (Iterator[str]) - candidate issue file paths in directory order
+    """
+    with os.scandir(issues_dir) as it:
+        for entry in it:
+            if (entry.name.endswith('.json') and entry.is_file()
+                    and (status is None or _status_from_filename(entry.name) in (status, None))):
+                yield entry.path
+
+
+def _parse_issue(
+    file_path: str,
+    content: Optional[bytes],
+    meta: Optional[bytes] = None,
+    status: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse one issue file, apply its metadata sidecar and check its status.
+
+    Args:
+        file_path (str): Path the content was read from
+        content (Optional[bytes]): Raw file contents, None if the file could not be read
+        meta (Optional[bytes]): Raw sidecar contents, None if there is no sidecar
+        status (str, optional): Status the issue must have
+
+    Returns type: issue_data (Optional[Dict[str, Any]]) - issue with its file_path, or None if unreadable, corrupt or filtered out
+    """
+    if content is None:
+        return None  # Skip unreadable files
+    try:
+        issue_data = _load_issue_json(content)
+        if meta is not None:
+            issue_data.update(_load_issue_json(meta))
+    except Exception:
+        return None  # Skip corrupted files
+
+    # Add file path for reference
+    issue_data['file_path'] = file_path
+
+    # Filter by status if specified
+    if status is None or issue_data.get('status') == status:
+        return issue_data
+    return None
+
+
+def iter_local_issues(status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over locally stored issues one at a time, with optional status filtering.
+
+    ~~~
+    • Streams the issues directory with os.scandir
+    • Reads and parses each file only when the next issue is requested
+    • Filters by status like list_local_issues, but does not sort
+    • Keeps one issue in memory at a time, for large backlogs
+    ~~~
+
+    Args:
+        status (str, optional): Filter by issue status
+
+    Returns type: issues (Iterator[Dict[str, Any]]) - issue metadata in directory order
+    """
+    try:
+        issues_dir = get_local_issues_dir()
+        for file_path in _scan_issue_paths(issues_dir, status):
+            issue_data = _parse_issue(file_path, *_read_issue(file_path), status)
+            if issue_data is not None:
+                yield issue_data
+    except Exception:
+        return
+
+
 def list_local_issues(status: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     List all locally stored issues with optional status filtering.
 
     ~~~
-    • Scans local issues directory for JSON files
-    • Loads and parses issue metadata
-    • Filters by status if specified (open, closed, in_progress)
-    • Returns sorted list of issues by creation date
+    • Scans local issues directory for JSON files with os.scandir
+    • Reads large directories on a thread pool, then parses issue metadata
+    • Filters by status if specified (open, closed, in_progress), skipping
+      files whose name shows a different status without reading them
+    • Returns issues newest first, ordered by the creation time in their file names
     ~~~
 
     Args:
@@ -140,29 +586,66 @@ def list_local_issues(status: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     try:
         issues_dir = get_local_issues_dir()
+        # Sort by creation date (newest first). File names start with the
+        # YYYYMMDD_HHMMSS creation time and share one directory, so sorting
+        # the paths orders the issues without a key function over parsed dicts
+        paths = sorted(_scan_issue_paths(issues_dir, status), reverse=True)
+
         issues = []
+        for file_path, content, meta in _read_issue_files(paths):
+            issue_data = _parse_issue(file_path, content, meta, status)
+            if issue_data is not None:
+                issues.append(issue_data)
+        return issues
 
-        for file_path in issues_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    issue_data = json.load(f)
+    except Exception:
+        return []
 
-                # Add file path for reference
-                issue_data['file_path'] = str(file_path)
 
-                # Filter by status if specified
-                if status is None or issue_data.get('status') == status:
-                    issues.append(issue_data)
+def _record_sync_result(issue: Dict[str, Any], future, synced_at: str, results: Dict[str, Any]) -> None:
+    """
+    Apply one finished GitHub issue creation to the local store and the sync summary.
 
-            except Exception:
-                continue  # Skip corrupted files
+    ~~~
+    • Renames the untouched issue file so its name carries the synced status,
+      then records the GitHub info in the sidecar
+    • Counts failures and exceptions with a per-issue error message
+    ~~~
 
-        # Sort by creation date (newest first)
-        issues.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        return issues
+    Args:
+        issue (Dict[str, Any]): Local issue that was submitted
+        future (concurrent.futures.Future): Finished create_github_issue call
+        synced_at (str): Timestamp of the sync run
+        results (Dict[str, Any]): Sync summary, updated in place
 
-    except Exception:
-        return []
+    Returns type: None (NoneType) - updates files and results in place
+    """
+    try:
+        github_result = future.result()
+
+        if github_result.get("success"):
+            meta = {
+                "status": "synced",
+                "github_issue_number": github_result['issue_number'],
+                "github_url": github_result['issue_url'],
+                "synced_at": synced_at
+            }
+            # Rename first: a .synced. file is left out of the open scan even
+            # if its sidecar is never written, so a failure here cannot cause
+            # a duplicate GitHub issue on the next sync
+            synced_path = _with_filename_status(issue['file_path'], 'synced')
+            if synced_path != issue['file_path']:
+                os.replace(issue['file_path'], synced_path)
+            _write_issue_file(synced_path + _META_SUFFIX, _dump_issue_json(meta), atomic=True)
+
+            results["synced"] += 1
+        else:
+            results["failed"] += 1
+            results["errors"].append(f"Issue '{issue['title']}': {github_result.get('message', 'Unknown error')}")
+
+    except Exception as e:
+        results["failed"] += 1
+        results["errors"].append(f"Issue '{issue['title']}': {str(e)}")
 
 
 def sync_local_issues_to_github(github_token: str, repo_owner: str = "Norris36", repo_name: str = "jensbay_utilities") -> Dict[str, Any]:
@@ -170,9 +653,10 @@ def sync_local_issues_to_github(github_token: str, repo_owner: str = "Norris36",
     Sync locally stored issues to GitHub when access becomes available.
 
     ~~~
-    • Reads all local issues from storage directory
-    • Creates GitHub issues for each local issue
-    • Updates local files with GitHub issue numbers
+    • Streams open local issues with iter_local_issues, without loading them all first
+    • Creates GitHub issues for each local issue as it is read, up to 8 at a time
+    • Reads at most 16 issues ahead of the finished GitHub calls
+    • Records GitHub issue numbers in a small .meta sidecar and renames issue files to the synced status
     • Moves synced issues to archive folder
     ~~~
 
@@ -183,48 +667,42 @@ def sync_local_issues_to_github(github_token: str, repo_owner: str = "Norris36",
 
     Returns type: sync_result (Dict[str, Any]) - summary of sync operation results
     """
-    from .issue_logger import create_github_issue
+    create_github_issue = _issue_logger().create_github_issue
 
     try:
-        local_issues = list_local_issues(status="open")
         results = {
-            "total_issues": len(local_issues),
+            "total_issues": 0,
             "synced": 0,
             "failed": 0,
             "errors": []
         }
 
-        for issue in local_issues:
-            try:
-                # Create GitHub issue
-                github_result = create_github_issue(
+        # One timestamp for the whole sync run
+        synced_at = datetime.now().isoformat()
+
+        with ThreadPoolExecutor(max_workers=_SYNC_MAX_WORKERS) as executor:
+            # Submit each issue as soon as it is read, keeping a bounded window
+            # in flight so the backlog is never loaded or queued all at once
+            pending = {}
+            for issue in iter_local_issues(status="open"):
+                results["total_issues"] += 1
+                if len(pending) >= _SYNC_MAX_PENDING:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _record_sync_result(pending.pop(future), future, synced_at, results)
+
+                pending[executor.submit(
+                    create_github_issue,
                     title=f"[Local] {issue['title']}",
                     body=f"{issue['body']}\n\n---\n*Originally created locally at {issue['created_at']}*",
                     labels=issue.get('labels', []) + ['synced-from-local'],
                     github_token=github_token,
                     repo_owner=repo_owner,
                     repo_name=repo_name
-                )
-
-                if github_result.get("success"):
-                    # Update local issue with GitHub info
-                    issue['github_issue_number'] = github_result['issue_number']
-                    issue['github_url'] = github_result['issue_url']
-                    issue['status'] = 'synced'
-                    issue['synced_at'] = datetime.now().isoformat()
-
-                    # Save updated issue
-                    with open(issue['file_path'], 'w', encoding='utf-8') as f:
-                        json.dump(issue, f, indent=2, ensure_ascii=False)
-
-                    results["synced"] += 1
-                else:
-                    results["failed"] += 1
-                    results["errors"].append(f"Issue '{issue['title']}': {github_result.get('message', 'Unknown error')}")
+                )] = issue
 
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append(f"Issue '{issue['title']}': {str(e)}")
+            for future in as_completed(pending):
+                _record_sync_result(pending[future], future, synced_at, results)
 
         return results
 
@@ -263,7 +741,7 @@ def create_local_debug_issue(
 
     Returns type: issue_result (Dict[str, Any]) - local issue creation result
     """
-    from .issue_logger import format_system_info, format_stack_trace
+    issue_logger = _issue_logger()
 
     # Build comprehensive issue body
     body_parts = []
@@ -272,18 +750,19 @@ def create_local_debug_issue(
         body_parts.append(f"## Description\n\n{description}\n")
 
     if exception:
-        body_parts.append(format_stack_trace(exception))
+        body_parts.append(issue_logger.format_stack_trace(exception))
 
     if additional_context:
-        body_parts.append("## Additional Context\n")
-        for key, value in additional_context.items():
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value, indent=2)
-            body_parts.append(f"**{key}:**\n```\n{value}\n```\n")
-
-    # Add system information
-    body_parts.append(format_system_info())
-    body_parts.append("---\n*This issue was created locally by the issue_logger module.*")
+        body_parts.append("## Additional Context\n\n" + "\n".join(
+            f"**{key}:**\n```\n"
+            f"{_format_context_value(value) if isinstance(value, (dict, list)) else value}"
+            "\n```\n"
+            for key, value in additional_context.items()
+        ))
+
+    # Add system information (cached by issue_logger apart from its timestamp)
+    body_parts.append(issue_logger.format_system_info())
+    body_parts.append(_LOCAL_DEBUG_FOOTER)
 
     body = "\n".join(body_parts)
 
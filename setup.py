@@ -10,7 +10,7 @@ with open("requirements.txt", "r", encoding="utf-8") as fh:
 
 setup(
     name="conegliano-utilities",
-    version="1.1.32",
+    version="1.2.48",
     author="Jens Bay",
     description="Personal utility functions for data science and development tasks",
     long_description=long_description,
@@ -31,4 +31,8 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "http2": ["httpx[http2]>=0.23.0"],
+        "fast-json": ["orjson>=3.0"],
+    },
 )
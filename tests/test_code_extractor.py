@@ -0,0 +1,311 @@
+"""
+Tests for conegliano_utilities.code_extractor - finding, listing and copying functions
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities import _ast_utils
+from conegliano_utilities.code_extractor import (
+    copy_functions_to_clipboard,
+    extract_function_code,
+    find_function_in_file,
+    iter_function_matches,
+    list_functions_in_file,
+    search_function_in_directory,
+)
+
+
+SAMPLE_SOURCE = '''
+def first(a: int) -> int:
+    """First function."""
+    return a
+
+
+async def second(b):
+    return b
+'''
+
+
+class TestCodeExtractor(unittest.TestCase):
+    """
+    Tests for function lookup, directory search and snippet copying on a temporary sample file.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'sample.py')
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_SOURCE)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_find_function_in_file(self):
+        """
+        Test that find_function_in_file extracts a function's details.
+
+        ~~~
+        " Looks up an annotated function in the sample file
+        " Validates signature, docstring, line numbers and source
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        info = find_function_in_file(self.file_path, 'first')
+        self.assertIsNotNone(info)
+        self.assertEqual(info['signature'], 'def first(a: int) -> int')
+        self.assertEqual(info['docstring'], 'First function.')
+        self.assertEqual(info['start_line'], 2)
+        self.assertEqual(info['end_line'], 4)
+        self.assertEqual(info['lines_count'], 3)
+        self.assertTrue(info['source_code'].startswith('def first('))
+        self.assertFalse(info['is_async'])
+
+    def test_find_async_function(self):
+        """
+        Test that async functions are found and flagged.
+
+        ~~~
+        " Looks up an async function
+        " Validates is_async is set
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        info = find_function_in_file(self.file_path, 'second')
+        self.assertTrue(info['is_async'])
+
+    def test_find_missing_function(self):
+        """
+        Test that an unknown function name returns None.
+
+        ~~~
+        " Looks up a name that is not defined
+        " Validates None is returned
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.assertIsNone(find_function_in_file(self.file_path, 'missing'))
+
+    def test_cache_invalidated_when_file_changes(self):
+        """
+        Test that the parsed-file cache is refreshed when the file changes.
+
+        ~~~
+        " Looks up a function before it exists
+        " Appends it to the file
+        " Validates the new function is found
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.assertIsNone(find_function_in_file(self.file_path, 'third'))
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write('\n\ndef third():\n    pass\n')
+        self.assertIsNotNone(find_function_in_file(self.file_path, 'third'))
+
+    def test_search_function_in_directory(self):
+        """
+        Test that directory search matches exact definitions only.
+
+        ~~~
+        " Adds files with a similar name and a non-function assignment
+        " Validates only real definitions are returned
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        nested = os.path.join(self.temp_dir.name, 'pkg')
+        os.makedirs(nested)
+        with open(os.path.join(nested, 'other.py'), 'w', encoding='utf-8') as f:
+            f.write('def firstly():\n    pass\n\nfirst = None\n')
+        with open(os.path.join(nested, 'copy.py'), 'w', encoding='utf-8') as f:
+            f.write('def  first():\n    pass\n')
+
+        matches = search_function_in_directory(self.temp_dir.name, 'first')
+        relative_paths = sorted(match['relative_path'] for match in matches)
+        self.assertEqual(relative_paths, [os.path.join('pkg', 'copy.py'), 'sample.py'])
+
+    def test_search_reads_each_candidate_once(self):
+        """
+        Test that searches parse candidates in-process from the bytes already read.
+
+        ~~~
+        " Creates many files defining the function
+        " Validates every definition is found with one open per file
+        " Validates the parsed files are reused by find_function_in_file
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        for index in range(40):
+            with open(os.path.join(self.temp_dir.name, f'mod_{index}.py'), 'w', encoding='utf-8') as f:
+                f.write(f'def first():\n    return {index}\n')
+        _ast_utils.get_file_index.cache_clear()
+
+        with mock.patch('builtins.open', wraps=open) as opened:
+            matches = search_function_in_directory(self.temp_dir.name, 'first')
+            self.assertEqual(len(matches), 41)
+            self.assertEqual(opened.call_count, 41)
+
+            self.assertIsNotNone(find_function_in_file(self.file_path, 'first'))
+            self.assertEqual(opened.call_count, 41)
+
+    def test_iter_function_matches_is_lazy(self):
+        """
+        Test that iter_function_matches yields matches lazily.
+
+        ~~~
+        " Takes only the first match
+        " Validates it comes from the sample file
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        matches = iter_function_matches(self.temp_dir.name, 'first')
+        first_match = next(matches)
+        self.assertEqual(first_match['relative_path'], 'sample.py')
+
+    def test_extract_function_code_first_and_exhaustive(self):
+        """
+        Test first-match and exhaustive modes of extract_function_code.
+
+        ~~~
+        " Searches two directories that both define the function
+        " Validates the default stops at the first match
+        " Validates exhaustive mode reports both
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        second_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(second_dir.cleanup)
+        with open(os.path.join(second_dir.name, 'again.py'), 'w', encoding='utf-8') as f:
+            f.write('def first():\n    pass\n')
+        search_paths = [self.temp_dir.name, second_dir.name]
+
+        result = extract_function_code('first', search_paths=search_paths)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_matches'], 1)
+        self.assertEqual(result['file_path'], self.file_path)
+
+        result = extract_function_code('first', search_paths=search_paths, exhaustive=True)
+        self.assertEqual(result['total_matches'], 2)
+
+    def test_search_skips_pruned_directories(self):
+        """
+        Test that VCS, dependency and cache directories are not searched.
+
+        ~~~
+        " Adds definitions inside .git, node_modules and __pycache__
+        " Validates they are skipped by default and found with exclude_dirs=set()
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        for name in ('.git', 'node_modules', '__pycache__'):
+            os.makedirs(os.path.join(self.temp_dir.name, name))
+            with open(os.path.join(self.temp_dir.name, name, 'vendored.py'), 'w', encoding='utf-8') as f:
+                f.write('def first():\n    pass\n')
+
+        matches = search_function_in_directory(self.temp_dir.name, 'first')
+        self.assertEqual([match['relative_path'] for match in matches], ['sample.py'])
+
+        matches = search_function_in_directory(self.temp_dir.name, 'first', exclude_dirs=set())
+        self.assertEqual(len(matches), 3)
+
+    def test_methods_and_nested_functions(self):
+        """
+        Test how methods and nested functions are looked up and listed.
+
+        ~~~
+        " Adds a class with a method that contains a nested function
+        " Validates methods are found unless include_methods is False
+        " Validates nested functions are never found
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write('\n\nclass Thing:\n    def method(self):\n        def inner():\n            pass\n')
+
+        self.assertIsNotNone(find_function_in_file(self.file_path, 'method'))
+        self.assertIsNone(find_function_in_file(self.file_path, 'method', include_methods=False))
+        self.assertIsNone(find_function_in_file(self.file_path, 'inner'))
+
+        names = [info['name'] for info in list_functions_in_file(self.file_path)]
+        self.assertEqual(names, ['first', 'second', 'method'])
+        names = [info['name'] for info in list_functions_in_file(self.file_path, include_methods=False)]
+        self.assertEqual(names, ['first', 'second'])
+
+    def test_list_functions_fast_scan(self):
+        """
+        Test the regex fast path of list_functions_in_file.
+
+        ~~~
+        " Adds a method to the sample file
+        " Validates names, line numbers, async and method flags
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write('\n\nclass Thing:\n    def method(self):\n        pass\n')
+
+        functions = list_functions_in_file(self.file_path, fast=True)
+        self.assertEqual(
+            [(info['name'], info['line_number'], info['is_async'], info['is_method']) for info in functions],
+            [('first', 2, False, False), ('second', 7, True, False), ('method', 12, False, True)],
+        )
+        names = [info['name'] for info in list_functions_in_file(self.file_path, include_methods=False, fast=True)]
+        self.assertEqual(names, ['first', 'second'])
+
+    def test_copy_functions_to_file(self):
+        """
+        Test that copy_functions_to_clipboard can write snippets to a file.
+
+        ~~~
+        " Copies two functions without metadata to an output path
+        " Validates the file holds both definitions
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir.name)
+        output_path = os.path.join(self.temp_dir.name, 'snippets.txt')
+
+        result = copy_functions_to_clipboard(['first', 'second'], include_metadata=False, output_path=output_path)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['functions'], ['first', 'second'])
+        self.assertFalse(result['copied_to_clipboard'])
+        with open(output_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('def first(a: int) -> int:', content)
+        self.assertIn('async def second(b):', content)
+
+    def test_find_function_with_invalid_utf8(self):
+        """
+        Test that files with undecodable bytes are still parsed.
+
+        ~~~
+        " Appends a Latin-1 byte in a comment
+        " Validates the following function is found
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        with open(self.file_path, 'ab') as f:
+            f.write(b'\n\n# caf\xe9\ndef third():\n    pass\n')
+        self.assertIsNotNone(find_function_in_file(self.file_path, 'third'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import ast
 import inspect
 import sys
 import os
+import datetime
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -192,6 +193,97 @@ def test_func(x: int, y: str) -> bool:
             if os.path.exists(test_file_path):
                 os.remove(test_file_path)
     
+    @unittest.skipUnless(hasattr(ast, 'get_source_segment'), "needs Python 3.8+ to render annotations")
+    def test_get_functions_dataframe_annotations(self):
+        """
+        Test that subscripted annotations are rendered as source text.
+
+        ~~~
+        " Creates a test file with generic and dotted annotations
+        " Calls get_functions_dataframe on test file
+        " Validates input and output types are readable
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as root:
+            test_file_path = os.path.join(root, 'annotated.py')
+            with open(test_file_path, 'w') as f:
+                f.write(
+                    'def annotated(items: List[int], frame: pd.DataFrame) -> Dict[str, int]:\n'
+                    '    """Annotated function."""\n'
+                    '    return {}\n'
+                )
+
+            df = get_functions_dataframe(test_file_path)
+            self.assertEqual(df.iloc[0]['Input Types'], 'items: List[int], frame: pd.DataFrame')
+            self.assertEqual(df.iloc[0]['Output Type'], 'Dict[str, int]')
+
+    def test_get_functions_dataframe_shares_parse_cache(self):
+        """
+        Test that get_functions_dataframe and find_function_in_file parse a file once.
+
+        ~~~
+        " Creates a test file and clears the shared file index cache
+        " Calls get_functions_dataframe then find_function_in_file
+        " Validates ast.parse runs once for both callers
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+        from unittest import mock
+        from conegliano_utilities import _ast_utils
+        from conegliano_utilities.code_extractor import find_function_in_file
+
+        with tempfile.TemporaryDirectory() as root:
+            test_file_path = os.path.join(root, 'shared.py')
+            with open(test_file_path, 'w') as f:
+                f.write('def shared():\n    """Shared function."""\n    return 1\n')
+
+            _ast_utils.get_file_index.cache_clear()
+            with mock.patch.object(_ast_utils.ast, 'parse', wraps=ast.parse) as parse:
+                df = get_functions_dataframe(test_file_path)
+                info = find_function_in_file(test_file_path, 'shared')
+
+            self.assertEqual(list(df['Function']), ['shared'])
+            self.assertEqual(info['name'], 'shared')
+            self.assertEqual(parse.call_count, 1)
+
+    def test_find_files_accepts_paths_and_dir_entries(self):
+        """
+        Test that find_files filters by modification date for paths and DirEntry objects.
+
+        ~~~
+        " Creates files with controlled modification times
+        " Calls find_files with string paths and os.scandir entries
+        " Validates only files inside the window are kept
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as root:
+            inside = os.path.join(root, 'inside.txt')
+            outside = os.path.join(root, 'outside.txt')
+            for file_path, day in ((inside, 10), (outside, 1)):
+                open(file_path, 'w').close()
+                timestamp = datetime.datetime(2025, 2, day, 12).timestamp()
+                os.utime(file_path, (timestamp, timestamp))
+
+            missing = os.path.join(root, 'missing.txt')
+            result = find_files([inside, outside, missing], '2025-02-11', days=4)
+            self.assertEqual(result['path'].tolist(), [inside])
+            self.assertEqual(result['file_name'].tolist(), ['inside.txt'])
+            self.assertEqual(result['folder_name'].tolist(), [os.path.basename(root)])
+
+            with os.scandir(root) as entries:
+                result = find_files(list(entries), '2025-02-11', days=4)
+            self.assertEqual(result['path'].tolist(), [inside])
+
     def test_hygin_basic_functionality(self):
         """
         Test basic functionality of hygin search function.
@@ -212,6 +304,167 @@ def test_func(x: int, y: str) -> bool:
         with self.assertRaises(ValueError):
             hygin('/nonexistent/path', 'test')
 
+    def test_get_folder_sizes_basic(self):
+        """
+        Test that get_folder_sizes sums file sizes per immediate subdirectory.
+
+        ~~~
+        " Creates nested folders with files of known size
+        " Calls get_folder_sizes on the temporary root
+        " Validates sizes include nested files and skip root files
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+        from conegliano_utilities.core import get_folder_sizes
+
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, 'a', 'nested'))
+            os.makedirs(os.path.join(root, 'b'))
+            with open(os.path.join(root, 'a', 'one.txt'), 'wb') as f:
+                f.write(b'x' * 10)
+            with open(os.path.join(root, 'a', 'nested', 'two.txt'), 'wb') as f:
+                f.write(b'x' * 5)
+            with open(os.path.join(root, 'top.txt'), 'wb') as f:
+                f.write(b'x' * 100)
+
+            expected = {
+                os.path.join(root, 'a'): 15,
+                os.path.join(root, 'b'): 0,
+            }
+            self.assertEqual(get_folder_sizes(root), expected)
+            self.assertEqual(get_folder_sizes(root, max_workers=1), expected)
+
+            # The portable scandir walk must agree with the fwalk path
+            from unittest import mock
+            with mock.patch.object(core_module, '_USE_FWALK', False):
+                self.assertEqual(get_folder_sizes(root), expected)
+
+
+    @unittest.skipUnless(hasattr(os, 'symlink') and os.name != 'nt', "needs POSIX symlinks")
+    def test_get_folder_sizes_symlinked_subfolder(self):
+        """
+        Test that a subfolder that is a symlink reports its target's size.
+
+        ~~~
+        " Links a subfolder to a directory outside the root
+        " Validates the fwalk and scandir paths both report the target size
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+        from unittest import mock
+        from conegliano_utilities.core import get_folder_sizes
+
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as target:
+            with open(os.path.join(target, 'data.bin'), 'wb') as f:
+                f.write(b'x' * 7)
+            link = os.path.join(root, 'linked')
+            os.symlink(target, link)
+
+            self.assertEqual(get_folder_sizes(root, max_workers=1), {link: 7})
+            with mock.patch.object(core_module, '_USE_FWALK', False):
+                self.assertEqual(get_folder_sizes(root, max_workers=1), {link: 7})
+
+    def test_hygin_nested_and_extensions(self):
+        """
+        Test that hygin finds nested and top-level files exactly once.
+
+        ~~~
+        " Creates files at several depths with different extensions
+        " Searches with and without an extension filter
+        " Validates each match is reported once
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, 'a', 'deep'))
+            paths = [
+                os.path.join(root, 'report.csv'),
+                os.path.join(root, 'a', 'report.txt'),
+                os.path.join(root, 'a', 'deep', 'report.csv'),
+                os.path.join(root, 'a', 'deep', 'other.csv'),
+            ]
+            for file_path in paths:
+                open(file_path, 'w').close()
+
+            self.assertEqual(sorted(hygin(root, 'report')), sorted(paths[:3]))
+            self.assertEqual(
+                sorted(hygin(root, 'report', extensions='.csv')),
+                sorted([paths[0], paths[2]]),
+            )
+            self.assertEqual(hygin(root, 'report', extensions=['.md']), [])
+
+            # The lazy variant validates eagerly and can stop after the first match
+            from conegliano_utilities.core import iter_hygin
+            with self.assertRaises(ValueError):
+                iter_hygin(os.path.join(root, 'missing'), 'report')
+            matches = iter_hygin(root, 'report', extensions='.csv')
+            self.assertIn(next(matches), [paths[0], paths[2]])
+            matches.close()
+
+    @unittest.skipUnless(hasattr(os, 'symlink') and os.name != 'nt', "needs POSIX symlinks")
+    def test_hygin_skips_directory_symlinks(self):
+        """
+        Test that symlinks to directories are neither matched nor followed.
+
+        ~~~
+        " Creates a file, a symlinked directory and a symlinked file
+        " Validates the directory link is not reported as a match
+        " Validates nothing is found through the directory link
+        " Validates file links are still reported, as with os.walk
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, 'report_dir'))
+            real = os.path.join(root, 'report_dir', 'report.txt')
+            open(real, 'w').close()
+            os.symlink(os.path.join(root, 'report_dir'), os.path.join(root, 'report_link'))
+            file_link = os.path.join(root, 'report_file_link.txt')
+            os.symlink(real, file_link)
+
+            self.assertEqual(sorted(hygin(root, 'report')), sorted([real, file_link]))
+
+    def test_create_dataframe_from_folder_sizes(self):
+        """
+        Test the folder size DataFrame ordering, rounding and percentages.
+
+        ~~~
+        " Builds a folder size mapping with known byte counts
+        " Validates descending order and stable ties
+        " Validates cumulative and percentage columns
+        " Checks an empty mapping
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from conegliano_utilities.core import create_dataframe_from_folder_sizes
+
+        gib = 1024 ** 3
+        df = create_dataframe_from_folder_sizes({
+            '/data/small': 1 * gib,
+            '/data/large': 3 * gib,
+            '/data/tie': 1 * gib,
+        })
+        self.assertEqual(df.columns.tolist(), [
+            'path', 'size (GB)', 'cum (size)', 'percentage(size)', 'cum percentage (size)', 'basename',
+        ])
+        self.assertEqual(df['path'].tolist(), ['/data/large', '/data/small', '/data/tie'])
+        self.assertEqual(df['size (GB)'].tolist(), [3.0, 1.0, 1.0])
+        self.assertEqual(df['cum (size)'].tolist(), [3.0, 4.0, 5.0])
+        self.assertEqual(df['percentage(size)'].tolist(), [60.0, 20.0, 20.0])
+        self.assertEqual(df['cum percentage (size)'].tolist(), [60.0, 80.0, 100.0])
+        self.assertEqual(df['basename'].tolist(), ['large', 'small', 'tie'])
+        self.assertEqual(len(create_dataframe_from_folder_sizes({})), 0)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -20,5 +20,118 @@ class TestDataUtils(unittest.TestCase):
             self.skipTest("data_utils module not available")
 
 
+    def test_calculate_column_overlap(self):
+        """
+        Test that column overlap is computed from unique values per column pair.
+
+        ~~~
+        " Builds two small DataFrames with known shared values
+        " Calls calculate_column_overlap on them
+        " Validates long format, ordering and percentages
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import pandas as pd
+        from conegliano_utilities.data_utils import calculate_column_overlap
+
+        df_a = pd.DataFrame({'x': [1, 2, 3, 4], 'y': ['a', 'b', 'b', 'c']})
+        df_b = pd.DataFrame({'p': [2, 3, 9], 'q': ['b', 'c', 'z']})
+
+        result = calculate_column_overlap(df_a, df_b)
+        self.assertEqual(result.columns.tolist(), ['column_a', 'column_b', 'overlap'])
+        self.assertEqual(len(result), 4)
+        overlaps = {(row.column_a, row.column_b): row.overlap for row in result.itertuples()}
+        self.assertEqual(overlaps, {('x', 'p'): 50.0, ('y', 'q'): 50.0, ('x', 'q'): 0.0, ('y', 'p'): 0.0})
+        self.assertTrue(result['overlap'].is_monotonic_decreasing)
+
+    def test_humanise_text_examples(self):
+        """
+        Test humanise_text against its documented examples and edge cases.
+
+        ~~~
+        " Checks underscore, hyphen and mixed case inputs
+        " Checks empty strings and repeated separators
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from conegliano_utilities.data_utils import humanise_text
+
+        self.assertEqual(humanise_text("customer_id"), 'Customer id')
+        self.assertEqual(humanise_text("total_revenue_USD"), 'Total revenue usd')
+        self.assertEqual(humanise_text("purchase-date"), 'Purchase date')
+        self.assertEqual(humanise_text("FULL_NAME"), 'Full name')
+        self.assertEqual(humanise_text("single"), 'Single')
+        self.assertEqual(humanise_text(""), '')
+        self.assertEqual(humanise_text("a__B"), 'A  b')
+
+    def test_humanise_df_matches_humanise_text(self):
+        """
+        Test that humanise_df renames columns exactly like humanise_text.
+
+        ~~~
+        " Builds a DataFrame with mixed column name styles
+        " Validates the renamed columns and that the input is untouched
+        " Checks a DataFrame without columns
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import pandas as pd
+        from conegliano_utilities.data_utils import humanise_df, humanise_text
+
+        names = ['customer_id', 'total_revenue_USD', 'purchase-date', 'x', 'a__B']
+        df = pd.DataFrame([[1, 2, 3, 4, 5]], columns=names)
+
+        result = humanise_df(df)
+        self.assertEqual(result.columns.tolist(), [humanise_text(name) for name in names])
+        self.assertEqual(df.columns.tolist(), names)
+        self.assertEqual(len(humanise_df(pd.DataFrame()).columns), 0)
+
+    def test_rename_columns_standardizes_names(self):
+        """
+        Test that rename_columns standardizes names and maps name columns to name_.
+
+        ~~~
+        " Builds a DataFrame with spaces, hyphens and name columns
+        " Validates the standardized column names
+        " Checks a DataFrame without columns
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import pandas as pd
+        from conegliano_utilities.data_utils import rename_columns
+
+        df = pd.DataFrame(columns=['Name', 'First  Name', 'e-mail', 'name', 'Total Sum'])
+        result = rename_columns(df)
+        self.assertEqual(result.columns.tolist(), ['name_', 'first_name', 'email', 'name_', 'total_sum'])
+        self.assertEqual(df.columns.tolist()[0], 'Name')
+        self.assertEqual(len(rename_columns(pd.DataFrame()).columns), 0)
+
+    def test_get_columns_csv_header_only(self):
+        """
+        Test that get_columns reports CSV headers and rejects unknown formats.
+
+        ~~~
+        " Writes a small CSV file to a temporary folder
+        " Validates the reported column list
+        " Checks the message for unsupported extensions
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        import tempfile
+        from conegliano_utilities.data_utils import get_columns
+
+        with tempfile.TemporaryDirectory() as root:
+            csv_path = os.path.join(root, 'data.csv')
+            with open(csv_path, 'w') as f:
+                f.write('id,name,score\n1,a,2.5\n2,b,3.0\n')
+
+            self.assertEqual(get_columns(csv_path), "CSV: ['id', 'name', 'score']")
+            self.assertIn('not a supported format', get_columns(os.path.join(root, 'data.json')))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,304 @@
+import unittest
+import sys
+import os
+import tempfile
+import subprocess
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities import _http, global_issue_logger
+from conegliano_utilities.global_issue_logger import detect_current_repo
+
+
+def _make_git_repo(path, remote_url):
+    """
+    Create a git repository with one commit and an origin remote.
+
+    Args:
+        path (str): Directory to initialise
+        remote_url (str): URL to register as origin
+
+    Returns type: None (NoneType) - repository is created on disk
+    """
+    def git(*args):
+        subprocess.run(["git", *args], cwd=path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("remote", "add", "origin", remote_url)
+    with open(os.path.join(path, "README.md"), "w") as f:
+        f.write("test\n")
+    git("add", "README.md")
+    git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "initial")
+
+
+class TestGlobalIssueLogger(unittest.TestCase):
+
+    def setUp(self):
+        detect_current_repo.cache_clear()
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+        detect_current_repo.cache_clear()
+
+    def test_detect_current_repo_outside_git(self):
+        """
+        Test repository detection in a directory that is not a git repository.
+
+        ~~~
+        " Changes into an empty temporary directory
+        " Validates the directory-based fallback info
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        os.chdir(self.temp_dir.name)
+        info = detect_current_repo()
+        self.assertIsNone(info['git_root'])
+        self.assertEqual(info['repo_name'], os.path.basename(os.getcwd()))
+        self.assertEqual(info['relative_path'], '.')
+
+    def test_detect_current_repo_is_cached_per_directory(self):
+        """
+        Test that git subprocesses run once per working directory.
+
+        ~~~
+        " Counts subprocess.run calls across repeated detections
+        " Validates callers get independent copies of the cached info
+        " Validates cache_clear forces a fresh detection
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        repo = os.path.realpath(self.temp_dir.name)
+        _make_git_repo(repo, "https://github.com/example-owner/example-repo.git")
+        os.chdir(repo)
+        with mock.patch.object(global_issue_logger.subprocess, 'run', wraps=subprocess.run) as run:
+            first = detect_current_repo()
+            first['repo_name'] = 'changed'
+            second = detect_current_repo()
+            self.assertEqual(run.call_count, 1)
+            self.assertEqual(second['repo_name'], 'example-repo')
+
+            detect_current_repo.cache_clear()
+            detect_current_repo()
+            self.assertEqual(run.call_count, 2)
+
+    def test_detect_current_repo_skips_git_outside_repositories(self):
+        """
+        Test that no git process is spawned outside a repository.
+
+        ~~~
+        " Changes into a directory with no .git entry above it
+        " Validates subprocess.run is never called
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        os.chdir(self.temp_dir.name)
+        with mock.patch.object(global_issue_logger.subprocess, 'run') as run, \
+                mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('GIT_DIR', None)
+            os.environ.pop('GIT_WORK_TREE', None)
+            info = detect_current_repo()
+        run.assert_not_called()
+        self.assertIsNone(info['git_root'])
+
+    def test_global_issue_context_reads_git_metadata(self):
+        """
+        Test that global_issue_context collects branch, commits and status.
+
+        ~~~
+        " Creates a git repository with one commit and a GitHub remote
+        " Validates detected owner, repo name and relative path
+        " Validates git_info fields and the change flag
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        repo = os.path.realpath(self.temp_dir.name)
+        _make_git_repo(repo, "https://github.com/example-owner/example-repo.git")
+        os.makedirs(os.path.join(repo, "src"))
+        os.chdir(os.path.join(repo, "src"))
+
+        context = global_issue_logger.global_issue_context()
+        repo_info = context['repo_info']
+        self.assertEqual(repo_info['git_root'], repo)
+        self.assertEqual(repo_info['owner'], 'example-owner')
+        self.assertEqual(repo_info['repo_name'], 'example-repo')
+        self.assertEqual(repo_info['relative_path'], 'src')
+
+        git_info = context['git_info']
+        self.assertEqual(len(git_info['recent_commits']), 1)
+        self.assertTrue(git_info['recent_commits'][0].endswith('initial'))
+        self.assertIn('current_branch', git_info)
+        self.assertFalse(git_info['has_changes'])
+
+        with open(os.path.join(repo, 'new.txt'), 'w') as f:
+            f.write('change\n')
+        context = global_issue_logger.global_issue_context()
+        self.assertTrue(context['git_info']['has_changes'])
+        self.assertEqual(
+            set(context['system_info']),
+            {'python_version', 'platform', 'hostname', 'working_directory', 'timestamp'}
+        )
+
+    def test_github_url_pattern_variants(self):
+        """
+        Test owner and repo extraction across GitHub remote URL forms.
+
+        ~~~
+        " Checks SSH, HTTPS, git:// and ssh:// URLs
+        " Checks .git suffixes, trailing slashes and dotted repo names
+        " Checks that non-GitHub URLs do not match
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        pattern = global_issue_logger._GITHUB_URL_PATTERN
+        cases = {
+            "git@github.com:owner/repo.git": ("owner", "repo"),
+            "git@github.com:owner/repo": ("owner", "repo"),
+            "https://github.com/owner/repo.git": ("owner", "repo"),
+            "https://github.com/owner/repo/": ("owner", "repo"),
+            "https://user@github.com/owner/repo.git": ("owner", "repo"),
+            "git://github.com/owner/repo.git": ("owner", "repo"),
+            "git+https://github.com/owner/repo": ("owner", "repo"),
+            "ssh://git@github.com/owner/repo.git": ("owner", "repo"),
+            "https://github.com/owner/owner.github.io.git": ("owner", "owner.github.io"),
+        }
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                match = pattern.match(url)
+                self.assertIsNotNone(match)
+                self.assertEqual((match.group("owner"), match.group("repo")), expected)
+
+        self.assertIsNone(pattern.match("https://gitlab.com/owner/repo.git"))
+        self.assertIsNone(pattern.match("https://github.com/owner"))
+
+    def test_list_repo_issues_uses_etag_cache(self):
+        """
+        Test that list_repo_issues reuses cached issues on 304 Not Modified.
+
+        ~~~
+        " Mocks the shared session with a 200 response carrying an ETag
+        " Validates the second call sends If-None-Match
+        " Validates the cached issues are returned on 304
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        issues = [{"number": 1, "title": "First"}]
+        fresh = mock.Mock(status_code=200, headers={"ETag": '"abc"'})
+        fresh.json.return_value = issues
+        unchanged = mock.Mock(status_code=304, headers={})
+        session = mock.Mock()
+        session.request.side_effect = [fresh, unchanged]
+
+        with mock.patch.object(_http, 'get_github_session', return_value=session), \
+                mock.patch.object(global_issue_logger, 'get_github_token', return_value='token'), \
+                mock.patch.dict(global_issue_logger._ISSUE_LIST_CACHE, clear=True):
+            self.assertEqual(global_issue_logger.list_repo_issues('owner', 'repo'), issues)
+            self.assertEqual(global_issue_logger.list_repo_issues('owner', 'repo'), issues)
+
+        first_headers = session.request.call_args_list[0].kwargs['headers']
+        second_headers = session.request.call_args_list[1].kwargs['headers']
+        self.assertNotIn('If-None-Match', first_headers)
+        self.assertEqual(second_headers['If-None-Match'], '"abc"')
+
+    def test_global_issue_labels_and_local_fallback(self):
+        """
+        Test global_issue label building and the local storage fallback.
+
+        ~~~
+        " Runs from a subfolder of a git repository without a GitHub token
+        " Validates the labels passed to local storage
+        " Validates the caller's label list is not modified
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        repo = os.path.realpath(self.temp_dir.name)
+        _make_git_repo(repo, "git@github.com:example-owner/example-repo.git")
+        os.makedirs(os.path.join(repo, "src", "pkg"))
+        os.chdir(os.path.join(repo, "src", "pkg"))
+
+        labels = ["bug"]
+        store = mock.Mock(return_value={"success": True, "file_path": "issue.json"})
+        with mock.patch.object(global_issue_logger, 'get_github_token', return_value=None), \
+                mock.patch.object(global_issue_logger, 'store_issue_locally', store):
+            result = global_issue_logger.global_issue("Title", "Body", labels=labels)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(labels, ["bug"])
+        kwargs = store.call_args.kwargs
+        self.assertEqual(kwargs['title'], "[Global] Title")
+        self.assertEqual(kwargs['labels'], ["bug", "global-issue", "from-repo:example-repo", "working-in:src"])
+        self.assertIn("**Working in Repository:** example-repo", kwargs['body'])
+        self.assertIn(f"**Relative Path:** `{os.path.join('src', 'pkg')}`", kwargs['body'])
+
+    def test_iso_now_is_second_precision_and_cached(self):
+        """
+        Test the cached ISO timestamp helper.
+
+        ~~~
+        " Validates the string matches the current second
+        " Validates repeated calls in the same second reuse the string
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from datetime import datetime
+
+        with mock.patch.object(global_issue_logger.time, 'time', return_value=1739282607.75):
+            first = global_issue_logger._iso_now()
+            second = global_issue_logger._iso_now()
+        self.assertEqual(first, datetime.fromtimestamp(1739282607).isoformat())
+        self.assertIs(first, second)
+
+    def test_bulk_global_issue_shares_setup_and_keeps_order(self):
+        """
+        Test that bulk_global_issue detects context once and falls back per issue.
+
+        ~~~
+        " Mocks GitHub creation to succeed for one issue and fail for another
+        " Validates repository detection and token lookup run once
+        " Validates results come back in input order with local fallback
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        os.chdir(self.temp_dir.name)
+
+        def create(title, body, labels, github_token, repo_owner, repo_name):
+            if title == "[Global] ok":
+                return {"success": True, "issue_url": "https://example.test/1"}
+            return {"success": False, "error": "boom"}
+
+        store = mock.Mock(return_value=[{"success": True, "file_path": "issue.json", "method": "local"}])
+        detect = mock.Mock(wraps=global_issue_logger.detect_current_repo)
+        token = mock.Mock(return_value="token")
+        with mock.patch.object(global_issue_logger, '_get_create_github_issue', return_value=create), \
+                mock.patch.object(global_issue_logger, 'store_issues_locally', store), \
+                mock.patch.object(global_issue_logger, 'detect_current_repo', detect), \
+                mock.patch.object(global_issue_logger, 'get_github_token', token):
+            results = global_issue_logger.bulk_global_issue([
+                {"title": "ok", "labels": ["a"]},
+                {"title": "fails", "priority": "high"},
+            ])
+
+        self.assertEqual(detect.call_count, 1)
+        self.assertEqual(token.call_count, 1)
+        self.assertEqual(results[0]["issue_url"], "https://example.test/1")
+        self.assertEqual(results[1]["method"], "local")
+        stored_issues = store.call_args.args[0]
+        self.assertEqual(len(stored_issues), 1)
+        self.assertEqual(stored_issues[0]["title"], "[Global] fails")
+        self.assertEqual(stored_issues[0]["priority"], "high")
+        self.assertEqual(global_issue_logger.bulk_global_issue([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the conegliano_utilities package namespace - lazy exports and version
+"""
+
+import unittest
+import sys
+import os
+import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import conegliano_utilities
+
+
+class TestPackageInit(unittest.TestCase):
+    """
+    Tests for the lazily imported package attributes and the package version.
+    """
+
+    def test_all_exports_resolve(self):
+        """
+        Test that every name in __all__ resolves to a callable.
+
+        ~~~
+        " Accesses each exported name on the package
+        " Validates the lazy import returns a function or class
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        for name in conegliano_utilities.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(conegliano_utilities, name)))
+
+    def test_submodules_available_as_attributes(self):
+        """
+        Test that submodules can be reached as package attributes.
+
+        ~~~
+        " Accesses the core submodule
+        " Validates it exposes its functions
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.assertTrue(hasattr(conegliano_utilities.core, 'hygin'))
+
+    def test_names_outside_all_still_resolve(self):
+        """
+        Test that public names outside __all__ still resolve.
+
+        ~~~
+        " Accesses a data_utils helper not listed in __all__
+        " Validates it is found and works
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.assertEqual(conegliano_utilities.humanise_text('customer_id'), 'Customer id')
+
+    def test_print_version_info_from_core_and_package(self):
+        """
+        Test that print_version_info is importable from core and the package.
+
+        ~~~
+        " Imports it from conegliano_utilities.core, as before the lazy package
+        " Validates the package attribute is the same function
+        " Validates it prints the current version
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from unittest import mock
+        from conegliano_utilities.core import print_version_info
+
+        self.assertIs(conegliano_utilities.print_version_info, print_version_info)
+        with mock.patch('builtins.print') as printed:
+            print_version_info()
+        self.assertIn(conegliano_utilities.__version__, "".join(str(call.args[0]) for call in printed.call_args_list))
+
+    def test_unknown_attribute_raises(self):
+        """
+        Test that unknown attributes raise AttributeError without importing submodules.
+
+        ~~~
+        " Accesses a name no submodule exports, directly and through hasattr
+        " Validates AttributeError is raised
+        " Validates no submodule is imported by the lookup
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from unittest import mock
+
+        with mock.patch('importlib.import_module') as import_module:
+            with self.assertRaises(AttributeError):
+                conegliano_utilities.does_not_exist
+            self.assertFalse(hasattr(conegliano_utilities, "also_missing"))
+        import_module.assert_not_called()
+
+    def test_version_matches_setup_py(self):
+        """
+        Test that the package version matches setup.py.
+
+        ~~~
+        " Reads the version from setup.py
+        " Validates it equals __version__
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        setup_path = os.path.join(os.path.dirname(__file__), '..', 'setup.py')
+        with open(setup_path, 'r', encoding='utf-8') as f:
+            setup_version = re.search(r'version="([^"]+)"', f.read()).group(1)
+        self.assertEqual(conegliano_utilities.__version__, setup_version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities.issue_config import REPO_CONFIGS, get_github_token, get_repo_config, setup_token_config
+
+
+class TestIssueConfig(unittest.TestCase):
+
+    def setUp(self):
+        get_github_token.cache_clear()
+        self.temp_home = tempfile.TemporaryDirectory()
+        self.patches = [
+            mock.patch.object(Path, 'home', return_value=Path(self.temp_home.name)),
+            mock.patch.dict(os.environ, {}, clear=False),
+        ]
+        for patch in self.patches:
+            patch.start()
+        os.environ.pop('GITHUB_TOKEN', None)
+
+    def tearDown(self):
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.temp_home.cleanup()
+        get_github_token.cache_clear()
+
+    def test_token_sources_and_cache(self):
+        """
+        Test token lookup order and cache invalidation.
+
+        ~~~
+        " Validates None when no token source exists
+        " Validates setup_token_config makes the saved token visible
+        " Validates the environment variable takes precedence
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.assertIsNone(get_github_token())
+
+        self.assertTrue(setup_token_config('file-token'))
+        self.assertEqual(get_github_token(), 'file-token')
+
+        with mock.patch.dict(os.environ, {'GITHUB_TOKEN': 'env-token'}):
+            self.assertEqual(get_github_token(), 'env-token')
+        self.assertEqual(get_github_token(), 'file-token')
+
+    def test_config_file_is_read_once(self):
+        """
+        Test that the token file is read once until the cache is cleared.
+
+        ~~~
+        " Saves a token and reads it
+        " Edits the file directly without clearing the cache
+        " Validates the cached token is returned until cache_clear
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        setup_token_config('first-token')
+        self.assertEqual(get_github_token(), 'first-token')
+
+        token_file = Path(self.temp_home.name) / '.github_config' / 'token'
+        token_file.write_text('second-token')
+        self.assertEqual(get_github_token(), 'first-token')
+
+        get_github_token.cache_clear()
+        self.assertEqual(get_github_token(), 'second-token')
+
+
+    def test_get_repo_config_profiles_and_override(self):
+        """
+        Test repository profile lookup, environment override and immutability.
+
+        ~~~
+        " Validates the default personal profile
+        " Validates CONEGLIANO_ISSUE_PROFILE overrides the argument
+        " Validates unknown profiles fall back to personal
+        " Validates REPO_CONFIGS cannot be modified
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        os.environ.pop('CONEGLIANO_ISSUE_PROFILE', None)
+        self.assertEqual(get_repo_config()['repo'], 'jensbay_utilities')
+        self.assertEqual(get_repo_config('backup')['repo'], 'debug-issues')
+
+        with mock.patch.dict(os.environ, {'CONEGLIANO_ISSUE_PROFILE': 'work'}):
+            self.assertEqual(get_repo_config('backup')['owner'], 'your-work-org')
+
+        self.assertEqual(get_repo_config('missing')['repo'], 'jensbay_utilities')
+
+        with self.assertRaises(TypeError):
+            REPO_CONFIGS['new'] = {}
+        with self.assertRaises(TypeError):
+            REPO_CONFIGS['personal']['repo'] = 'other'
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+import subprocess
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities import issue_logger
+from conegliano_utilities.issue_logger import format_system_info
+
+
+class TestIssueLogger(unittest.TestCase):
+
+    def setUp(self):
+        format_system_info.cache_clear()
+
+    def tearDown(self):
+        format_system_info.cache_clear()
+
+    def test_format_system_info_is_cached(self):
+        """
+        Test that platform details are cached while git details and the timestamp stay fresh.
+
+        ~~~
+        " Validates a single git subprocess collects branch and commit on each call
+        " Validates platform details are only collected on the first call
+        " Validates a new commit shows up without clearing the cache
+        " Validates the timestamp line is rebuilt on every call
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        with mock.patch.object(issue_logger.subprocess, 'check_output', wraps=subprocess.check_output) as check_output, \
+                mock.patch.object(issue_logger.platform, 'platform', wraps=issue_logger.platform.platform) as platform_call:
+            first = format_system_info()
+            second = format_system_info()
+        git_calls = [call for call in check_output.call_args_list if call.args[0][0] == "git"]
+        self.assertEqual(len(git_calls), 2)
+        self.assertEqual(platform_call.call_count, 1)
+
+        self.assertIn("## System Information", first)
+        self.assertIn(f"- Working Directory: {os.getcwd()}", first)
+        self.assertIn("**Timestamp:** ", second)
+        branch = subprocess.run(["git", "branch", "--show-current"], capture_output=True, text=True).stdout.strip()
+        if branch:
+            self.assertIn(f"- Git Branch: {branch}\n", first)
+        self.assertEqual(first.rsplit("**Timestamp:**", 1)[0], second.rsplit("**Timestamp:**", 1)[0])
+
+        with mock.patch.object(issue_logger.subprocess, 'check_output', return_value="0123456789abcdef\nmain\n"):
+            moved = format_system_info()
+        self.assertIn("- Git Branch: main\n- Git Commit: 01234567\n", moved)
+
+    def test_smart_issue_paths(self):
+        """
+        Test smart_issue's GitHub fast path and local fallbacks.
+
+        ~~~
+        " Validates a successful GitHub issue is returned without local storage
+        " Validates GitHub errors and a missing token fall back to local storage
+        " Validates force_local skips the token lookup
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        local = {"success": True, "file_path": "issue.json"}
+        with mock.patch('builtins.print'), \
+                mock.patch.object(issue_logger, 'store_issue_locally', return_value=local) as store, \
+                mock.patch.object(issue_logger, 'get_github_token', side_effect=['tok', 'tok', None]) as token, \
+                mock.patch.object(issue_logger, 'create_github_issue', side_effect=[
+                    {"success": True, "issue_url": "https://example/1"}, RuntimeError("offline")]):
+            self.assertEqual(issue_logger.smart_issue("t")["issue_url"], "https://example/1")
+            store.assert_not_called()
+            self.assertIs(issue_logger.smart_issue("t"), local)
+            self.assertIs(issue_logger.smart_issue("t"), local)
+            self.assertIs(issue_logger.smart_issue("t", force_local=True), local)
+
+        self.assertEqual(store.call_count, 3)
+        self.assertEqual(token.call_count, 3)
+
+    def test_format_stack_trace_reuses_formatted_text(self):
+        """
+        Test that an exception's traceback is formatted once per raise.
+
+        ~~~
+        " Validates repeated calls reuse the formatted text
+        " Validates the current-exception path shares the cache
+        " Validates a re-raised exception is formatted again
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        def fail():
+            raise ValueError("boom")
+
+        with mock.patch.object(issue_logger.traceback, 'format_exception',
+                               wraps=issue_logger.traceback.format_exception) as format_exception:
+            try:
+                fail()
+            except ValueError as error:
+                first = issue_logger.format_stack_trace(error)
+                self.assertEqual(issue_logger.format_stack_trace(), first)
+                caught = error
+            self.assertEqual(format_exception.call_count, 1)
+
+            try:
+                raise caught
+            except ValueError:
+                reraised = issue_logger.format_stack_trace(caught)
+            self.assertEqual(format_exception.call_count, 2)
+
+        self.assertIn("ValueError: boom", first)
+        self.assertIn("in fail", first)
+        self.assertGreater(len(reraised), len(first))
+        self.assertIn("No active exception found", issue_logger.format_stack_trace())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities import _http, issue_logger, issue_solver
+
+
+class TestIssueSolver(unittest.TestCase):
+
+    def test_github_session_is_shared(self):
+        """
+        Test that GitHub API calls share one pooled session.
+
+        ~~~
+        " Validates get_github_session returns the same object every call
+        " Validates the requests fallback when httpx is not installed
+        " Validates the https adapter keeps a connection pool and retries connections
+        " Validates the token is sent per request, not stored on the session
+        " Validates the header mapping is built once per token and read-only
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        _http.get_github_session.cache_clear()
+        try:
+            with mock.patch.dict(sys.modules, {"httpx": None}):
+                session = _http.get_github_session()
+            self.assertIs(_http.get_github_session(), session)
+            adapter = session.get_adapter("https://api.github.com")
+            self.assertEqual(adapter._pool_maxsize, 16)
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertEqual((adapter.max_retries.read, adapter.max_retries.status), (0, 0))
+            self.assertFalse(adapter.max_retries.respect_retry_after_header)
+            self.assertNotIn("Authorization", session.headers)
+        finally:
+            _http.get_github_session.cache_clear()
+        self.assertEqual(_http.github_auth_headers("abc"), {"Authorization": "token abc"})
+        self.assertIs(_http.github_auth_headers("abc"), _http.github_auth_headers("abc"))
+        with self.assertRaises(TypeError):
+            _http.github_auth_headers("abc")["If-None-Match"] = "etag"
+
+    def test_github_session_prefers_http2_client(self):
+        """
+        Test that an HTTP/2 httpx client is used when httpx and h2 are installed.
+
+        ~~~
+        " Installs stand-in httpx and h2 modules
+        " Validates the client uses an http2=True transport and the default headers
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        httpx = mock.Mock()
+        _http.get_github_session.cache_clear()
+        try:
+            with mock.patch.dict(sys.modules, {"httpx": httpx, "h2": mock.Mock()}):
+                self.assertIs(_http.get_github_session(), httpx.Client.return_value)
+        finally:
+            _http.get_github_session.cache_clear()
+        kwargs = httpx.Client.call_args.kwargs
+        self.assertIs(kwargs["transport"], httpx.HTTPTransport.return_value)
+        self.assertEqual(kwargs["headers"]["Accept"], "application/vnd.github.v3+json")
+        transport_kwargs = httpx.HTTPTransport.call_args.kwargs
+        self.assertTrue(transport_kwargs["http2"])
+        self.assertEqual(transport_kwargs["retries"], 3)
+
+    def test_solver_calls_use_shared_session(self):
+        """
+        Test that issue creation, commenting and closing go through the shared session.
+
+        ~~~
+        " Mocks the session returned to issue_logger and issue_solver
+        " Validates each call hits the expected URL with the token header
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        session = mock.Mock()
+        session.request.side_effect = [
+            mock.Mock(status_code=201, headers={"X-RateLimit-Remaining": "41"}, json=mock.Mock(return_value={
+                "number": 2, "html_url": "h", "url": "u", "created_at": "c", "title": "t"})),
+            mock.Mock(status_code=201, headers={}, json=mock.Mock(return_value={
+                "id": 9, "html_url": "h", "created_at": "c"})),
+            mock.Mock(status_code=200, headers={}, json=mock.Mock(return_value={
+                "state": "closed", "html_url": "h"})),
+        ]
+
+        with mock.patch.object(_http, 'get_github_session', return_value=session):
+            created = issue_logger.create_github_issue("t", "b", github_token="tok", repo_owner="o", repo_name="r")
+            with mock.patch.object(issue_solver, 'get_github_token', return_value='tok'):
+                commented = issue_solver.add_comment_to_issue(1, "hi", "o", "r")
+                closed = issue_solver.close_issue(1, "o", "r")
+
+        self.assertTrue(created["success"] and commented["success"] and closed["success"])
+        self.assertEqual(created["rate_limit_remaining"], 41)
+        calls = [call.args for call in session.request.call_args_list]
+        self.assertEqual(calls, [
+            ("POST", "https://api.github.com/repos/o/r/issues"),
+            ("POST", "https://api.github.com/repos/o/r/issues/1/comments"),
+            ("PATCH", "https://api.github.com/repos/o/r/issues/1"),
+        ])
+        for call in session.request.call_args_list:
+            self.assertEqual(call.kwargs["headers"], {"Authorization": "token tok"})
+
+    def test_github_request_backs_off_on_rate_limits(self):
+        """
+        Test that rate-limited responses are retried after sleeping.
+
+        ~~~
+        " Validates Retry-After and X-RateLimit-Reset drive the wait
+        " Validates plain 403 errors are returned without retrying
+        " Validates waits beyond the cap are not slept through
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        limited = mock.Mock(status_code=429, headers={"Retry-After": "3"})
+        exhausted = mock.Mock(status_code=403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"})
+        ok = mock.Mock(status_code=200, headers={})
+        forbidden = mock.Mock(status_code=403, headers={})
+        far_reset = mock.Mock(status_code=403, headers={"Retry-After": "3600"})
+        session = mock.Mock()
+        session.request.side_effect = [limited, exhausted, ok, forbidden, far_reset]
+
+        with mock.patch.object(_http, 'get_github_session', return_value=session), \
+                mock.patch.object(_http.time, 'sleep') as sleep:
+            self.assertIs(_http.github_request("GET", "url"), ok)
+            self.assertIs(_http.github_request("GET", "url"), forbidden)
+            self.assertIs(_http.github_request("GET", "url"), far_reset)
+
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [3.0, 2])
+
+    def test_open_issues_are_simplified_lazily(self):
+        """
+        Test iter_open_issues, get_open_issues and display_open_issues.
+
+        ~~~
+        " Validates issues are fetched when called and simplified while iterating
+        " Validates get_open_issues still returns a list
+        " Validates display_open_issues only simplifies the issues it shows
+        " Validates the listing is printed in a single call
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        raw = [
+            {"number": n, "title": f"Issue {n}", "body": None, "labels": [{"name": "bug"}],
+             "created_at": "2024-01-01T00:00:00Z", "updated_at": "u", "html_url": f"h{n}", "state": "open"}
+            for n in range(5)
+        ]
+        with mock.patch.object(issue_solver, '_fetch_open_issues', return_value=raw) as fetch:
+            issues = issue_solver.iter_open_issues("o", "r")
+            fetch.assert_called_once_with("o", "r")
+            first = next(issues)
+            listed = issue_solver.get_open_issues("o", "r")
+            with mock.patch.object(issue_solver, '_simplify_issue', wraps=issue_solver._simplify_issue) as simplify, \
+                    mock.patch('builtins.print') as printed:
+                issue_solver.display_open_issues(limit=2)
+
+        self.assertEqual(first["body"], "")
+        self.assertEqual(first["labels"], ["bug"])
+        self.assertEqual([issue["number"] for issue in listed], [0, 1, 2, 3, 4])
+        self.assertEqual(simplify.call_count, 2)
+        printed.assert_called_once()
+        listing = printed.call_args.args[0]
+        self.assertTrue(listing.startswith("📋 OPEN ISSUES (showing 2 of 5):"))
+        self.assertIn("#1: Issue 1\n   Labels: bug\n   Created: 2024-01-01\n   URL: h1\n", listing)
+        self.assertTrue(listing.endswith("... and 3 more issues"))
+
+    def test_open_issues_use_etag_cache(self):
+        """
+        Test that unchanged open-issue pages are served from the ETag cache.
+
+        ~~~
+        " Validates the first fetch sends no If-None-Match header
+        " Validates a 304 answer returns the previously fetched issues
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        raw = [{"number": 1, "title": "First", "body": "b", "labels": [], "created_at": "c",
+                "updated_at": "u", "html_url": "h", "state": "open"}]
+        fresh = mock.Mock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.json.return_value = raw
+        unchanged = mock.Mock(status_code=304, headers={})
+
+        with mock.patch.object(issue_solver, 'github_request', side_effect=[fresh, unchanged]) as request, \
+                mock.patch.object(issue_solver, 'get_github_token', return_value='tok'), \
+                mock.patch.dict(issue_solver._OPEN_ISSUES_CACHE, clear=True), \
+                mock.patch('builtins.print'):
+            first = issue_solver.get_open_issues("o", "r")
+            second = issue_solver.get_open_issues("o", "r")
+
+        self.assertEqual(first, second)
+        self.assertEqual(second[0]["title"], "First")
+        self.assertNotIn("If-None-Match", request.call_args_list[0].kwargs["headers"])
+        self.assertEqual(request.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_issue_solved_follow_ups_on_original_issue(self):
+        """
+        Test that issue_solved comments on and closes the original issue.
+
+        ~~~
+        " Mocks issue creation, commenting and closing
+        " Validates the comment links the new solution issue
+        " Validates close is only requested when close_original is set
+        " Validates no worker thread is started for a comment-only follow-up
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        created = {"success": True, "issue_number": 7, "issue_url": "https://example/7"}
+        with mock.patch.object(issue_logger, 'create_github_issue', side_effect=lambda **kwargs: dict(created)), \
+                mock.patch.object(issue_solver, 'get_github_token', return_value='tok'), \
+                mock.patch.object(issue_solver, 'add_comment_to_issue', return_value={"success": True}) as comment, \
+                mock.patch.object(issue_solver, 'close_issue', return_value={"success": True}) as close:
+            result = issue_solver.issue_solved("pass", "Fix", original_issue_number=3, close_original=True)
+            with mock.patch.object(issue_solver, 'ThreadPoolExecutor') as executor:
+                issue_solver.issue_solved("pass", "Fix", original_issue_number=3)
+            executor.assert_not_called()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(comment.call_count, 2)
+        self.assertIn("#7", comment.call_args.kwargs["comment"])
+        close.assert_called_once_with(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
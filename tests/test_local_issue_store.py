@@ -0,0 +1,538 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conegliano_utilities import local_issue_store
+from conegliano_utilities.local_issue_store import list_local_issues, store_issue_locally, store_issues_locally
+
+
+class TestLocalIssueStore(unittest.TestCase):
+
+    def setUp(self):
+        local_issue_store.get_local_issues_dir.cache_clear()
+        self.temp_home = tempfile.TemporaryDirectory()
+        self.home_patch = mock.patch.object(Path, 'home', return_value=Path(self.temp_home.name))
+        self.home_patch.start()
+        self.issues_dir = Path(self.temp_home.name) / '.local_issues'
+
+    def tearDown(self):
+        self.home_patch.stop()
+        self.temp_home.cleanup()
+        local_issue_store.get_local_issues_dir.cache_clear()
+
+    def test_store_and_list_round_trip(self):
+        """
+        Test that a stored issue is written as JSON and listed back.
+
+        ~~~
+        " Stores one issue with labels and additional data
+        " Validates the JSON file contents
+        " Validates list_local_issues returns it with its file path
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        result = store_issue_locally("Disk full", "Body", labels=["bug"], additional_data={"key": 1})
+        self.assertTrue(result['success'])
+        self.assertTrue(result['file_path'].startswith(str(self.issues_dir)))
+        self.assertRegex(result['issue_id'], r'^[0-9a-f]{8}$')
+
+        with open(result['file_path'], encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['title'], "Disk full")
+        self.assertEqual(data['labels'], ["bug"])
+        self.assertEqual(data['status'], "open")
+        self.assertEqual(data['additional_data'], {"key": 1})
+
+        issues = list_local_issues()
+        self.assertEqual([issue['id'] for issue in issues], [result['issue_id']])
+        self.assertEqual(issues[0]['file_path'], result['file_path'])
+        self.assertEqual(list_local_issues(status="closed"), [])
+
+    def test_json_backends_write_identical_files(self):
+        """
+        Test that the orjson and stdlib json paths read and write the same files.
+
+        ~~~
+        " Stores the same issue with and without orjson
+        " Validates the serialized bytes match apart from id and timestamps
+        " Validates both files list back through either parser
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        data = {"title": "Ünïcode ✓", "labels": [], "additional_data": {"nested": [1, 2.5, None]}}
+        stdlib_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        with mock.patch.object(local_issue_store, 'orjson', None):
+            self.assertEqual(local_issue_store._dump_issue_json(data), stdlib_bytes)
+            store_issue_locally("Ünïcode ✓", "Body")
+        if local_issue_store.orjson is not None:
+            self.assertEqual(local_issue_store._dump_issue_json(data), stdlib_bytes)
+        store_issue_locally("Second", "Body")
+
+        with mock.patch.object(local_issue_store, 'orjson', None):
+            self.assertEqual(len(list_local_issues()), 2)
+        self.assertEqual(sorted(issue['title'] for issue in list_local_issues()), ["Second", "Ünïcode ✓"])
+
+    def test_data_orjson_rejects_is_still_stored(self):
+        """
+        Test that issue data orjson cannot serialize falls back to stdlib json.
+
+        ~~~
+        " Stores an issue with an integer wider than 64 bits
+        " Validates the issue is written and lists back with the value intact
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        result = store_issue_locally("Big number", "Body", additional_data={"value": 2 ** 70})
+        self.assertTrue(result['success'])
+        with open(result['file_path'], encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['additional_data'], {"value": 2 ** 70})
+        issues = list_local_issues()
+        self.assertEqual(issues[0]['additional_data'], {"value": 2 ** 70})
+        self.assertIsInstance(issues[0]['additional_data']['value'], int)
+
+    def test_issue_files_with_nan_are_listed(self):
+        """
+        Test that files holding NaN or Infinity, as stdlib json writes them, are still read.
+
+        ~~~
+        " Stores an issue whose data orjson cannot serialize and which holds NaN
+        " Writes an older-style file with Infinity using stdlib json
+        " Validates both issues are listed with their values
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        result = store_issue_locally("t", "b", additional_data={"x": float("nan"), "big": 2 ** 70})
+        self.assertTrue(result['success'])
+        legacy = self.issues_dir / "20200101_000000_abcd1234_Legacy_issue.json"
+        legacy.write_text(json.dumps({"id": "abcd1234", "title": "Legacy", "status": "open",
+                                      "created_at": "", "additional_data": {"limit": float("inf")}}))
+
+        issues = {issue['title']: issue for issue in list_local_issues()}
+        self.assertEqual(sorted(issues), ["Legacy", "t"])
+        self.assertNotEqual(issues["t"]['additional_data']['x'], issues["t"]['additional_data']['x'])
+        self.assertEqual(issues["t"]['additional_data']['big'], 2 ** 70)
+        self.assertEqual(issues["Legacy"]['additional_data']['limit'], float("inf"))
+
+    def test_list_local_issues_skips_non_issue_entries(self):
+        """
+        Test that listing ignores directories, other files and corrupt JSON.
+
+        ~~~
+        " Adds a directory named like an issue, a text file and a broken JSON file
+        " Validates only the stored issue is listed
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        result = store_issue_locally("Real", "Body")
+        (self.issues_dir / "folder.json").mkdir()
+        (self.issues_dir / "notes.txt").write_text("{}")
+        (self.issues_dir / "broken.json").write_text("{not json")
+
+        issues = list_local_issues()
+        self.assertEqual([issue['file_path'] for issue in issues], [result['file_path']])
+
+    def test_local_issues_dir_is_probed_once(self):
+        """
+        Test that the issues directory is resolved once per home directory.
+
+        ~~~
+        " Counts mkdir calls across repeated lookups
+        " Validates cache_clear forces a fresh probe
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        with mock.patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mkdir:
+            first = local_issue_store.get_local_issues_dir()
+            self.assertEqual(local_issue_store.get_local_issues_dir(), first)
+            self.assertEqual(mkdir.call_count, 1)
+
+            local_issue_store.get_local_issues_dir.cache_clear()
+            local_issue_store.get_local_issues_dir()
+            self.assertEqual(mkdir.call_count, 2)
+        self.assertEqual(first, self.issues_dir)
+
+    def test_unwritable_home_falls_back(self):
+        """
+        Test that an unwritable home issues directory is skipped.
+
+        ~~~
+        " Reports the home issues directory as not writable
+        " Validates the project directory is used instead, without probe files
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        project = tempfile.TemporaryDirectory()
+        self.addCleanup(project.cleanup)
+        real_access = os.access
+        with mock.patch.object(Path, 'cwd', return_value=Path(project.name)), \
+                mock.patch.object(local_issue_store.os, 'name', 'posix'), \
+                mock.patch.object(local_issue_store.os, 'access',
+                                  side_effect=lambda p, mode: Path(p) != self.issues_dir and real_access(p, mode)):
+            issues_dir = local_issue_store.get_local_issues_dir()
+        self.assertEqual(issues_dir, Path(project.name) / 'local_issues')
+        self.assertFalse((issues_dir / '.test').exists())
+
+    def test_large_directories_are_read_in_parallel(self):
+        """
+        Test that listing switches to threaded reads above the threshold.
+
+        ~~~
+        " Lowers the threshold and stores more issues than it
+        " Validates the thread pool is used and the listing is unchanged
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        store_issues_locally([{"title": f"Issue {i}", "body": "Body"} for i in range(4)])
+        serial = list_local_issues()
+
+        with mock.patch.object(local_issue_store, '_PARALLEL_READ_THRESHOLD', 2), \
+                mock.patch.object(local_issue_store, 'ThreadPoolExecutor',
+                                  wraps=local_issue_store.ThreadPoolExecutor) as executor:
+            parallel = list_local_issues()
+        executor.assert_called_once_with(max_workers=4)
+        self.assertEqual(parallel, serial)
+
+    def test_status_filter_uses_file_names(self):
+        """
+        Test that status filtering skips non-matching files by name.
+
+        ~~~
+        " Stores an issue and checks its file name carries the status
+        " Syncs it with a mocked GitHub call and checks the file is renamed
+        " Validates filtered listings only read matching and older-style files
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        synced = store_issue_locally("Synced issue", "Body")
+        self.assertIn(".open.Synced_issue.json", synced['file_path'])
+
+        github_result = {"success": True, "issue_number": 5, "issue_url": "https://example/5"}
+        with mock.patch('conegliano_utilities.issue_logger.create_github_issue', return_value=github_result):
+            result = local_issue_store.sync_local_issues_to_github("token")
+        self.assertEqual(result["synced"], 1)
+        self.assertFalse(os.path.exists(synced['file_path']))
+
+        still_open = store_issue_locally("Open issue", "Body")
+        legacy = self.issues_dir / "20200101_000000_abcd1234_Legacy_issue.json"
+        legacy.write_text(json.dumps({"id": "abcd1234", "title": "Legacy", "status": "open", "created_at": ""}))
+
+        with mock.patch.object(local_issue_store, '_read_issue_files',
+                               wraps=local_issue_store._read_issue_files) as read_files:
+            open_issues = list_local_issues(status="open")
+        read_names = sorted(os.path.basename(path) for path in read_files.call_args.args[0])
+        self.assertEqual(read_names, sorted([os.path.basename(still_open['file_path']), legacy.name]))
+        self.assertEqual(sorted(issue['title'] for issue in open_issues), ["Legacy", "Open issue"])
+
+        synced_issues = list_local_issues(status="synced")
+        self.assertEqual([issue['github_issue_number'] for issue in synced_issues], [5])
+        self.assertIn(".synced.Synced_issue.json", synced_issues[0]['file_path'])
+
+    def test_file_names_use_sanitized_titles(self):
+        """
+        Test the title part of local issue file names.
+
+        ~~~
+        " Validates punctuation is dropped and spaces become underscores
+        " Validates non-ASCII letters are kept and trailing spaces stripped
+        " Validates titles are cut to 50 characters
+        " Validates plain ASCII titles get the same names without str.translate
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        cases = {
+            "Fix: crash in parser (v2.1)!": "Fix_crash_in_parser_v21",
+            "Ünïcode café ✓  ": "Ünïcode_café",
+            "x" * 80: "x" * 50,
+            "Plain title-with_parts  ": "Plain_title-with_parts",
+            "a" * 49 + "  b": "a" * 49 + "_",
+        }
+        for title, expected in cases.items():
+            with self.subTest(title=title):
+                path = store_issue_locally(title, "Body")['file_path']
+                self.assertTrue(path.endswith(f".open.{expected}.json"), path)
+
+        # A missing table would make str.translate raise, so this only passes on the fast path
+        with mock.patch.object(local_issue_store, '_SAFE_TITLE_TABLE', None):
+            path = store_issue_locally("Plain ASCII title", "Body")['file_path']
+        self.assertTrue(path.endswith(".open.Plain_ASCII_title.json"), path)
+
+    def test_write_issue_file_atomic_rewrite(self):
+        """
+        Test raw issue file writes and atomic rewrites.
+
+        ~~~
+        " Writes a file, then rewrites it atomically with shorter content
+        " Validates the content is replaced and no .tmp file is left behind
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        self.issues_dir.mkdir()
+        path = str(self.issues_dir / "issue.json")
+        local_issue_store._write_issue_file(path, b'{"status": "open", "padding": "xxxxxxxx"}')
+        local_issue_store._write_issue_file(path, b'{"status": "synced"}', atomic=True)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'{"status": "synced"}')
+        self.assertEqual(os.listdir(self.issues_dir), ["issue.json"])
+
+    def test_context_values_format_as_indented_json(self):
+        """
+        Test the JSON text used for dict and list context values.
+
+        ~~~
+        " Validates orjson and stdlib json give the same text for ASCII data
+        " Validates values orjson rejects still format via stdlib json
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        value = {"a": [1, {"b": None}], 2: "x"}
+        expected = json.dumps(value, indent=2)
+        self.assertEqual(local_issue_store._format_context_value(value), expected)
+        with mock.patch.object(local_issue_store, 'orjson', None):
+            self.assertEqual(local_issue_store._format_context_value(value), expected)
+        self.assertIn(str(2 ** 70), local_issue_store._format_context_value([2 ** 70]))
+
+    def test_sync_streams_open_issues(self):
+        """
+        Test iter_local_issues and that syncing submits issues to a bounded pool.
+
+        ~~~
+        " Validates iter_local_issues is a generator that filters by status
+        " Validates each open issue is created once, on a pool of 8 threads
+        " Validates successes and failures are counted per issue
+        " Validates issues synced in one run share a synced_at timestamp
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        store_issues_locally([{"title": f"Issue {i}", "body": "Body"} for i in range(3)])
+        issues = local_issue_store.iter_local_issues(status="open")
+        self.assertNotIsInstance(issues, list)
+        self.assertEqual(sorted(issue['title'] for issue in issues), ["Issue 0", "Issue 1", "Issue 2"])
+        self.assertEqual(list(local_issue_store.iter_local_issues(status="closed")), [])
+
+        def create(**kwargs):
+            if kwargs["title"] == "[Local] Issue 1":
+                raise ConnectionError("offline")
+            return {"success": True, "issue_number": int(kwargs["title"][-1]), "issue_url": "u"}
+
+        with mock.patch('conegliano_utilities.issue_logger.create_github_issue', side_effect=create) as created, \
+                mock.patch.object(local_issue_store, 'ThreadPoolExecutor',
+                                  wraps=local_issue_store.ThreadPoolExecutor) as executor:
+            result = local_issue_store.sync_local_issues_to_github("token")
+        executor.assert_called_once_with(max_workers=8)
+        self.assertEqual(created.call_count, 3)
+        self.assertEqual((result["total_issues"], result["synced"], result["failed"]), (3, 2, 1))
+        self.assertEqual(result["errors"], ["Issue 'Issue 1': offline"])
+        synced = list_local_issues(status="synced")
+        self.assertEqual(sorted(issue['github_issue_number'] for issue in synced), [0, 2])
+        self.assertEqual(synced[0]['synced_at'], synced[1]['synced_at'])
+
+    def test_sync_keeps_a_bounded_window_in_flight(self):
+        """
+        Test that syncing stops reading issues while the in-flight window is full.
+
+        ~~~
+        " Lowers the window to 2 and syncs 6 issues
+        " Validates no issue is read while 2 submitted ones are unfinished
+        " Validates every issue is still synced
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        store_issues_locally([{"title": f"Issue {i}", "body": "Body"} for i in range(6)])
+        events = []
+        real_read = local_issue_store._read_issue
+
+        def read(path):
+            events.append("read")
+            return real_read(path)
+
+        def create(**kwargs):
+            time.sleep(0.02)  # Slow enough that an unbounded loop would read every issue first
+            events.append("create")
+            return {"success": True, "issue_number": 1, "issue_url": "u"}
+
+        with mock.patch.object(local_issue_store, '_SYNC_MAX_PENDING', 2), \
+                mock.patch.object(local_issue_store, '_read_issue', side_effect=read), \
+                mock.patch('conegliano_utilities.issue_logger.create_github_issue', side_effect=create):
+            result = local_issue_store.sync_local_issues_to_github("token")
+        self.assertEqual((result["total_issues"], result["synced"]), (6, 6))
+
+        for index, event in enumerate(events):
+            if event == "read":
+                before = events[:index]
+                self.assertLessEqual(before.count("read") - before.count("create"), 2)
+
+    def test_sync_writes_metadata_sidecars(self):
+        """
+        Test that syncing leaves issue files untouched and records GitHub info in sidecars.
+
+        ~~~
+        " Syncs a current and an older-style issue with a mocked GitHub call
+        " Validates the renamed issue file keeps its original bytes
+        " Validates the sidecars are merged into listings and never listed themselves
+        " Validates a second sync finds nothing left to create
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        stored = store_issue_locally("Big issue", "Body", additional_data={"log": "x" * 1000})
+        with open(stored['file_path'], 'rb') as f:
+            original = f.read()
+        legacy = self.issues_dir / "20200101_000000_abcd1234_Legacy_issue.json"
+        legacy.write_text(json.dumps({"id": "abcd1234", "title": "Legacy", "body": "b", "status": "open", "created_at": ""}))
+
+        github_result = {"success": True, "issue_number": 5, "issue_url": "https://example/5"}
+        with mock.patch('conegliano_utilities.issue_logger.create_github_issue', return_value=github_result) as created:
+            self.assertEqual(local_issue_store.sync_local_issues_to_github("token")["synced"], 2)
+            self.assertEqual(local_issue_store.sync_local_issues_to_github("token")["total_issues"], 0)
+        self.assertEqual(created.call_count, 2)
+
+        synced_path = stored['file_path'].replace(".open.", ".synced.")
+        with open(synced_path, 'rb') as f:
+            self.assertEqual(f.read(), original)
+        self.assertTrue(os.path.exists(synced_path + ".meta"))
+        self.assertTrue(os.path.exists(str(legacy) + ".meta"))
+
+        issues = list_local_issues()
+        self.assertEqual(sorted(issue['file_path'] for issue in issues), sorted([synced_path, str(legacy)]))
+        for issue in issues:
+            self.assertEqual((issue['status'], issue['github_issue_number']), ("synced", 5))
+        self.assertEqual(list_local_issues(status="open"), [])
+
+    def test_sync_renames_before_writing_sidecar(self):
+        """
+        Test that a failed rename leaves no sidecar and a failed sidecar write causes no duplicate.
+
+        ~~~
+        " Makes the rename fail, validates no sidecar exists and the issue stays open
+        " Makes the sidecar write fail after the rename succeeds
+        " Validates the issue is no longer open and a later sync creates nothing
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        stored = store_issue_locally("Flaky disk", "Body")
+        synced_path = stored['file_path'].replace(".open.", ".synced.")
+        github_result = {"success": True, "issue_number": 7, "issue_url": "https://example/7"}
+
+        with mock.patch('conegliano_utilities.issue_logger.create_github_issue', return_value=github_result) as created:
+            with mock.patch.object(local_issue_store.os, 'replace', side_effect=OSError("disk full")):
+                self.assertEqual(local_issue_store.sync_local_issues_to_github("token")["failed"], 1)
+            self.assertFalse(os.path.exists(synced_path + ".meta"))
+            self.assertFalse(os.path.exists(stored['file_path'] + ".meta"))
+            self.assertEqual(len(list_local_issues(status="open")), 1)
+
+            with mock.patch.object(local_issue_store, '_write_issue_file', side_effect=OSError("disk full")):
+                self.assertEqual(local_issue_store.sync_local_issues_to_github("token")["failed"], 1)
+            self.assertTrue(os.path.exists(synced_path))
+            self.assertFalse(os.path.exists(synced_path + ".meta"))
+            self.assertEqual(list_local_issues(status="open"), [])
+
+            self.assertEqual(local_issue_store.sync_local_issues_to_github("token")["total_issues"], 0)
+        self.assertEqual(created.call_count, 2)
+
+    def test_issue_titled_meta_is_not_a_sidecar(self):
+        """
+        Test that an issue titled "meta" is listed and synced like any other.
+
+        ~~~
+        " Stores an issue whose file name ends in .meta.json
+        " Validates it is listed, synced once and gets its own sidecar
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        stored = store_issue_locally("meta", "Body")
+        self.assertTrue(stored['file_path'].endswith(".open.meta.json"))
+        self.assertEqual([issue['title'] for issue in list_local_issues(status="open")], ["meta"])
+
+        github_result = {"success": True, "issue_number": 8, "issue_url": "https://example/8"}
+        with mock.patch('conegliano_utilities.issue_logger.create_github_issue', return_value=github_result):
+            result = local_issue_store.sync_local_issues_to_github("token")
+        self.assertEqual((result["total_issues"], result["synced"]), (1, 1))
+
+        synced_path = stored['file_path'].replace(".open.", ".synced.")
+        self.assertTrue(os.path.exists(synced_path + ".meta"))
+        self.assertEqual([issue['github_issue_number'] for issue in list_local_issues()], [8])
+
+    def test_list_local_issues_newest_first(self):
+        """
+        Test that listings are ordered newest first by file name.
+
+        ~~~
+        " Stores issues at three different mocked times, out of order
+        " Validates the listing follows the creation times, not the store order
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        for day in (2, 3, 1):
+            when = local_issue_store.datetime(2024, 1, day, 12, 0, 0)
+            with mock.patch.object(local_issue_store, 'datetime', wraps=local_issue_store.datetime) as clock:
+                clock.now.return_value = when
+                store_issue_locally(f"Day {day}", "Body")
+        self.assertEqual([issue['title'] for issue in list_local_issues()], ["Day 3", "Day 2", "Day 1"])
+
+    def test_issue_logger_is_imported_once(self):
+        """
+        Test the cached lazy import of issue_logger.
+
+        ~~~
+        " Validates the issue_logger module itself is returned
+        " Validates repeated calls skip importlib
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        from conegliano_utilities import issue_logger
+        self.assertIs(local_issue_store._issue_logger(), issue_logger)
+        with mock.patch.object(local_issue_store.importlib, 'import_module') as import_module:
+            local_issue_store._issue_logger()
+        import_module.assert_not_called()
+
+    def test_store_issues_locally_batch(self):
+        """
+        Test that a batch of issues resolves the directory once and keeps order.
+
+        ~~~
+        " Stores three issues in one call
+        " Validates the issues directory lookup runs once
+        " Validates every issue is listed back
+        ~~~
+
+        Returns type: None (NoneType) - assertion-based test with no return value
+        """
+        issues = [{"title": f"Issue {i}", "body": "Body", "priority": "low"} for i in range(3)]
+        with mock.patch.object(local_issue_store, 'get_local_issues_dir',
+                               wraps=local_issue_store.get_local_issues_dir) as get_dir:
+            results = store_issues_locally(issues)
+        self.assertEqual(get_dir.call_count, 1)
+        self.assertEqual([result['title'] for result in results], ["Issue 0", "Issue 1", "Issue 2"])
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual(len(list_local_issues()), 3)
+        self.assertEqual(store_issues_locally([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()